@@ -1,7 +1,7 @@
 # Controls the game logic and updates the view
 import sys
 import os
-from datetime import datetime
+import time
 from tkinter import messagebox
 from Views.text_board_view import TextBoardView
 from Views.board_view import BoardView
@@ -9,37 +9,59 @@ from Views.board_view import BoardView
 from Models.board_model import BoardModel
 from Views.board_view import BoardView
 from Views.difficulty_view import DifficultyView
+from Controllers.game_engine import GameEngine, PLAYING, WON
+from Controllers.game_snapshot import SnapshotError, restoreSnapshot, snapshotInfo, writeSnapshot
+from Controllers.move_journal import REVEAL, FLAG
+
+# Cells revealed per batch at the end of a graphical game
+END_REVEAL_BATCH = 512
+
+# Seconds of end-of-game reveal work done before control returns to Tk
+END_REVEAL_SLICE = 0.015
+
+# Least number of seconds between two autosaves
+AUTOSAVE_INTERVAL = 5.0
 
 class GameController:
-    def __init__(self, board, view):
+    def __init__(self, board, view, autosave_path=None, journal=None):
         """
         Initializes the GameController.
 
         Preconditions:
         - `board` is an instance of BoardModel.
         - `view` is an instance of either BoardView or TextBoardView.
+        - `autosave_path` is None or a file path for game snapshots; endless boards cannot be autosaved.
+        - `journal` is None or a `MoveJournal`; endless boards cannot be journaled.
 
         Postconditions:
-        - Initializes game parameters such as `game_over`, `start_time`, and counters.
+        - `self.engine` is a GameEngine that owns the game rules, `game_over`, `start_time`, and counters.
+        - With a graphical view the engine leaves the end-of-game reveal to `gameOver`, which applies it in time slices.
         - Links the controller to the view.
-        - Sets up the game board and initializes the view.
+        - Resumes the autosaved game if there is one for a board with the same parameters, otherwise sets up a new game.
+        - Records the start of the game and every move that changes the board to `journal`, if one is given.
+        - Initializes the view.
         - Starts the timer for the game.
         """
         self.board = board
         self.view = view
-        self.game_over = False
-        self.start_time = None
-        self.correct_flag_count = 0
-        self.flag_count = 0
-        self.clicked_count = 0
+        self.engine = GameEngine(board, reveal_on_end=not isinstance(view, BoardView))
+        self.autosave_path = autosave_path
+        self.autosave_dirty = False
+        self.last_autosave = time.monotonic()
+        self.journal = journal
 
         self.view.controller = self
-        self.board.setup()
+        resumed = self.resumeAutosave()
+        if resumed is None:
+            self.engine.newGame()
+            if self.journal is not None:
+                self.journal.startGame(self.board)
         if isinstance(self.view, BoardView):
             self.view.generateUI()
-            
+            if resumed:
+                self.view.updateCells(resumed)
         elif isinstance(self.view, TextBoardView):
-            self.view.displayBoard()
+            self.view.resetUI()
         self.updateTimer()
 
     # Takes action when a cell is left clicked on
@@ -51,42 +73,30 @@ class GameController:
         - `x` and `y` are valid indices in the board's grid.
 
         Postconditions:
+        - Does nothing if (x, y) is outside the board.
         - Reveals the cell if it is not already revealed or flagged.
         - Ends the game if a mine or treasure is clicked.
         - Updates the view and checks if the game is won.
+        - Returns the set of (x, y) cells whose state changed.
         """
-        if self.game_over:
-            return
+        if self.game_over or not self.inBounds(x, y):
+            return set()
 
-        if self.start_time is None:
-            self.start_time = datetime.now()
+        result = self.engine.reveal(x, y)
+        if self.journal is not None and result.changed:
+            self.journal.recordMove(REVEAL, x, y)
+        self.refreshView(result.changed)
+        if result.changed:
+            self.autosave_dirty = True
+            self.autosave(force=isinstance(self.view, TextBoardView))
 
-        cell = self.board.grid[x][y]
-        if cell.is_revealed or cell.is_flagged:
-            return
+        if result.status != PLAYING:
+            self.gameOver(result.status == WON)
+        return result.changed
 
-        if cell.is_mine:
-            cell.reveal()
-            self.updateView(x, y)
-            self.gameOver(False)
-            return
-        
-        if cell.is_treasure:
-            cell.reveal()
-            self.updateView(x, y)
-            self.gameOver(True)
-            return
-
-        if cell.adjacent_mines == 0:
-            self.board.clearSurroundingTiles(x, y)
-        else:
-            cell.reveal()
-            self.clicked_count += 1
-
-        self.refreshView()
-
-        if self.clicked_count == (self.board.rows * self.board.cols) - self.board.mines:
-            self.gameOver(True)
+    # Checks whether a cell is on the board; negative indices would otherwise wrap around the grid
+    def inBounds(self, x, y):
+        return 0 <= x < self.board.rows and 0 <= y < self.board.cols
 
     # Refreshes the view based on type
     def updateView(self, x=None, y=None):
@@ -106,22 +116,23 @@ class GameController:
             self.view.refresh()
 
     # Helper to update game board based off of view type
-    def refreshView(self):
+    def refreshView(self, changed=None):
         """
         Refreshes the view based on the current state of the game board.
 
         Preconditions:
         - The view type is either BoardView or TextBoardView.
+        - `changed` is None or a set of (x, y) tuples returned by a board operation.
 
         Postconditions:
-        - Updates the graphical or text-based view to reflect the board's state.
+        - If `changed` is given, only those cells are redrawn.
+        - Otherwise updates the graphical or text-based view to reflect the whole board's state.
         """
-        if isinstance(self.view, BoardView):
+        if changed is not None:
+            self.view.updateCells(changed)
+        elif isinstance(self.view, BoardView):
             # Update the view for all revealed cells
-            for i in range(self.board.rows):
-                for j in range(self.board.cols):
-                    if self.board.grid[i][j].is_revealed:
-                        self.view.updateCell(i, j)
+            self.view.updateCells(self.board.revealedPositions())
         elif isinstance(self.view, TextBoardView):
             self.view.displayBoard()
 
@@ -134,33 +145,28 @@ class GameController:
         - `x` and `y` are valid indices in the board's grid.
 
         Postconditions:
+        - Does nothing if (x, y) is outside the board.
         - Toggles the flagged state of the cell.
         - Updates the game status and the view.
+        - Returns the set of (x, y) cells whose state changed.
         """
-        if self.game_over:
-            return
-
-        cell = self.board.grid[x][y]
-        if cell.is_revealed:
-            return
-
-        cell.toggle_flag()
-
-        if cell.is_flagged:
-            self.flag_count += 1
-            if cell.is_mine:
-                self.correct_flag_count += 1
-        else:
-            self.flag_count -= 1
-            if cell.is_mine:
-                self.correct_flag_count -= 1
-
-        self.view.updateCell(x, y)
-        self.refreshView()
+        if self.game_over or not self.inBounds(x, y):
+            return set()
+
+        changed = self.engine.flag(x, y).changed
+        if not changed:
+            return changed
+        if self.journal is not None:
+            self.journal.recordMove(FLAG, x, y)
+
+        self.refreshView(changed)
+        self.autosave_dirty = True
+        self.autosave(force=isinstance(self.view, TextBoardView))
         if isinstance(self.view, TextBoardView):
-            print(f"Mines: {self.board.mines - self.flag_count}, Time: {self.getTimeElapsed()}")
+            self.view.message(f"Mines: {self.board.mines - self.flag_count}, Time: {self.getTimeElapsed()}")
         else:
             self.view.refreshLabel(self.board.mines - self.flag_count, self.getTimeElapsed())
+        return changed
 
     # Handles game over logic
     def gameOver(self, won):
@@ -172,38 +178,30 @@ class GameController:
 
         Postconditions:
         - Reveals all cells and displays the game over message.
+        - In the graphical view the cells are revealed in batches between Tk events, and the message follows the last batch.
         - Prompts the user to restart or exit the game.
         """
-        self.game_over = True
-
         if hasattr(self, "timer_id"):
             self.view.window.after_cancel(self.timer_id)
 
-        # Reveal all cells
-        for x in range(self.board.rows):
-            for y in range(self.board.cols):
-                cell = self.board.grid[x][y]
-                if cell.is_treasure:
-                    cell.reveal()
-                if cell.is_mine and not cell.is_flagged:
-                    cell.reveal()
-                if cell.is_flagged and not cell.is_mine:
-                    # Mark wrong flags
-                    cell.is_wrong_flag = True
-                    cell.reveal()
+        # Reveal all cells, unless the engine already did when the game ended or the graphical view reveals them in slices below
+        changed = self.engine.endGame(won)
+        self.discardAutosave()
+        if self.journal is not None:
+            self.journal.flush()
 
         # Refresh the view after revealing all cells
-        self.refreshView()
+        if changed:
+            self.refreshView(changed)
 
         # Display game over message
         if isinstance(self.view, TextBoardView):
-            self.view.displayBoard()
-            print("Congratulations! You Win!" if won else "Game Over! You Lose.")
-            replay = input("Play again? (y/n): ").strip().lower()
+            self.view.message("Congratulations! You Win!" if won else "Game Over! You Lose.")
+            replay = self.view.ask("Play again? (y/n): ").lower()
             if replay == "y":
                 self.restart()
             else:
-                print("Thanks for playing!")
+                self.view.message("Thanks for playing!")
                 exit()
         elif isinstance(self.view, BoardView):
             def showGameOver():
@@ -216,7 +214,35 @@ class GameController:
                         print("Thanks for playing!")
                         self.view.window.destroy()
                         self.view.window.master.destroy()
-            self.view.window.after(1000, showGameOver)
+            self.revealInSlices(self.board.endStateBatches(END_REVEAL_BATCH),
+                                lambda: self.view.window.after(1000, showGameOver))
+
+    # Applies the end-of-game reveal a slice at a time so Tk keeps handling events
+    def revealInSlices(self, batches, done):
+        """
+        Applies and draws batches of cell changes across several Tk callbacks.
+
+        Preconditions:
+        - `batches` is an iterator of sets of (x, y) tuples, such as `board.endStateBatches`.
+        - The view is a BoardView.
+
+        Postconditions:
+        - Batches are drawn for up to `END_REVEAL_SLICE` seconds per callback, and the rest is scheduled with `window.after`.
+        - `done` is called once every batch has been drawn.
+        - Nothing more happens if the window is closed or the game is restarted first.
+        """
+        def step():
+            self.reveal_id = None
+            if not self.view.window.winfo_exists():
+                return
+            deadline = time.perf_counter() + END_REVEAL_SLICE
+            for changed in batches:
+                self.view.updateCells(changed)
+                if time.perf_counter() > deadline:
+                    self.reveal_id = self.view.window.after(1, step)
+                    return
+            done()
+        step()
 
     # Restarts the game
     def restart(self):
@@ -228,24 +254,22 @@ class GameController:
 
         Postconditions:
         - Resets the board and counters.
-        - Initializes the view for a new game.
+        - Resets the view for a new game, rebuilding it only if the board size changed.
         """
         if hasattr(self, 'timer_id'):
             self.view.window.after_cancel(self.timer_id)
+        if getattr(self, 'reveal_id', None) is not None:
+            self.view.window.after_cancel(self.reveal_id)
+            self.reveal_id = None
 
-        self.game_over = False
-        self.start_time = None
-        self.correct_flag_count = 0
-        self.flag_count = 0
-        self.clicked_count = 0
-        self.board.setup()
+        self.engine.newGame()
+        if self.journal is not None:
+            self.journal.startGame(self.board)
         if isinstance(self.view, BoardView):
-            for widget in self.view.window.winfo_children():
-                widget.destroy()
-            
-            self.view.generateUI()
+            # Reuses the existing tiles unless the board size changed
+            self.view.resetUI()
         elif isinstance(self.view, TextBoardView):
-            self.view.displayBoard()
+            self.view.resetUI()
         self.updateTimer()
 
     def updateTimer(self):
@@ -266,10 +290,80 @@ class GameController:
         if isinstance(self.view, BoardView):
             # For graphical view, update the status label and re-schedule the timer
             self.view.refreshLabel(self.board.mines - self.flag_count, elapsed_time)
+            self.autosave()
             self.timer_id = self.view.window.after(1000, self.updateTimer)
         elif isinstance(self.view, TextBoardView):
             # For text-based view, print the elapsed time directly
-            print(f"Time: {elapsed_time}")
+            self.view.message(f"Time: {elapsed_time}")
+
+    # Resumes the autosaved game
+    def resumeAutosave(self):
+        """
+        Restores the game saved at `self.autosave_path`.
+
+        Postconditions:
+        - If the file holds an unfinished game on a board with the same dimensions, mines and treasures,
+          the game is restored and the set of revealed and flagged cells is returned.
+          The journal, if any, records the snapshot so the game can be replayed from it.
+        - Otherwise returns None and the board is unchanged. Unreadable or outdated files are ignored.
+        """
+        if self.autosave_path is None or not os.path.exists(self.autosave_path):
+            return None
+        try:
+            with open(self.autosave_path, "rb") as file:
+                data = file.read()
+            info = snapshotInfo(data)
+        except (OSError, SnapshotError):
+            return None
+        if info["game_over"] or (info["rows"], info["cols"], info["mines"], info["treasures"]) != \
+                (self.board.rows, self.board.cols, self.board.mines, self.board.treasures):
+            return None
+        if self.journal is not None:
+            self.journal.startSnapshot(data)
+        return restoreSnapshot(self.engine, data)
+
+    # Saves the game if it changed and the last save is old enough
+    def autosave(self, force=False):
+        """
+        Writes a snapshot of the game to `self.autosave_path`.
+
+        Postconditions:
+        - Nothing is written without an autosave path, after the game ended, or if no move was made since the last save.
+        - Unless `force` is True, at most one snapshot is written per `AUTOSAVE_INTERVAL` seconds;
+          the graphical timer writes any move left over. The text view has no timer, so its moves force a save.
+        - A failed write is reported once and autosaving is turned off.
+        """
+        if self.autosave_path is None or not self.autosave_dirty or self.game_over:
+            return
+        now = time.monotonic()
+        if not force and now - self.last_autosave < AUTOSAVE_INTERVAL:
+            return
+        try:
+            writeSnapshot(self.autosave_path, self.engine)
+        except (OSError, ValueError) as error:
+            if isinstance(self.view, TextBoardView):
+                self.view.message(f"Autosave disabled: {error}")
+            else:
+                print(f"Autosave disabled: {error}")
+            self.autosave_path = None
+            return
+        self.autosave_dirty = False
+        self.last_autosave = now
+
+    # Removes the autosave of a finished game
+    def discardAutosave(self):
+        """
+        Deletes the autosave file.
+
+        Postconditions:
+        - A finished game is never resumed.
+        """
+        self.autosave_dirty = False
+        if self.autosave_path is not None and os.path.exists(self.autosave_path):
+            try:
+                os.remove(self.autosave_path)
+            except OSError:
+                pass
 
     def getTimeElapsed(self):
         """
@@ -281,8 +375,25 @@ class GameController:
         Postconditions:
         - Returns a string representing the elapsed time in HH:MM:SS format.
         """
-        if self.start_time is None:
-            return "00:00:00"
-        else:
-            delta = datetime.now() - self.start_time
-            return str(delta).split('.')[0]
+        return self.engine.getTimeElapsed()
+
+    # Game state lives in the engine; these keep the controller's attributes working for views and main.py
+    @property
+    def game_over(self):
+        return self.engine.game_over
+
+    @property
+    def start_time(self):
+        return self.engine.start_time
+
+    @property
+    def flag_count(self):
+        return self.engine.flag_count
+
+    @property
+    def correct_flag_count(self):
+        return self.engine.correct_flag_count
+
+    @property
+    def clicked_count(self):
+        return self.engine.clicked_count
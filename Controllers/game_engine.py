@@ -0,0 +1,232 @@
+# Headless game logic. Has no knowledge of tkinter or the console, so it can run without a display or a player.
+from collections import namedtuple
+from datetime import datetime
+
+# Values of GameEngine.status
+PLAYING = "playing"
+WON = "won"
+LOST = "lost"
+
+# Outcome of a single move: the set of (x, y) cells whose state changed and the game status after the move
+MoveResult = namedtuple("MoveResult", ["changed", "status"])
+
+class GameEngine:
+    """
+    Applies the game rules to a BoardModel and reports outcomes as plain data.
+    """
+    def __init__(self, board, reveal_on_end=True):
+        """
+        Initializes the GameEngine.
+
+        Preconditions:
+        - `board` is an instance of BoardModel or a compatible backend.
+
+        Postconditions:
+        - `self.board` is set and the counters are reset.
+        - The board is not set up; call `newGame` to start a game.
+        - If `reveal_on_end` is False, ending the game leaves the end-of-game reveal to the caller,
+          which can apply it gradually with `board.endStateBatches`.
+        """
+        self.board = board
+        self.reveal_on_end = reveal_on_end
+        self.resetCounters()
+
+    # Resets the state of a game in progress
+    def resetCounters(self):
+        """
+        Resets the per-game state.
+
+        Postconditions:
+        - `game_over`, `won`, `found_treasure`, `start_time` and `end_time` are cleared and the move count is zero.
+        - Cell and flag counts are kept by the board and reset by its `setup`.
+        """
+        self.game_over = False
+        self.won = False
+        self.found_treasure = False
+        self.start_time = None
+        self.end_time = None
+        self.move_count = 0
+
+    # Starts a new game on the same board parameters
+    def newGame(self):
+        """
+        Starts a new game.
+
+        Postconditions:
+        - The board is set up again and the per-game state is reset.
+        """
+        self.resetCounters()
+        self.board.setup()
+
+    # Reveals a cell
+    def reveal(self, x, y):
+        """
+        Applies a left click on the cell at (x, y).
+
+        Preconditions:
+        - `x` and `y` are valid indices in the board's grid.
+
+        Postconditions:
+        - Does nothing if the game is over or the cell is revealed or flagged.
+        - Zero cells clear their surroundings; other cells are revealed on their own.
+        - The board's `is_lost` and `is_won` decide the outcome: revealing a mine loses, and revealing
+          a treasure or the last safe cell wins.
+        - If the game ended, the end state of the board is revealed as well.
+        - Returns a MoveResult with every changed cell.
+        """
+        if self.game_over:
+            return MoveResult(set(), self.status)
+
+        if self.start_time is None:
+            self.start_time = datetime.now()
+
+        board = self.board
+        if board.isRevealed(x, y) or board.isFlagged(x, y):
+            return MoveResult(set(), self.status)
+        self.move_count += 1
+
+        if board.isZeroCell(x, y):
+            changed = board.clearSurroundingTiles(x, y)
+        else:
+            changed = board.revealCell(x, y)
+
+        if self.board.is_lost:
+            changed |= self.endGame(False)
+        elif self.board.is_won:
+            self.found_treasure = self.board.treasure_found
+            changed |= self.endGame(True)
+        return MoveResult(changed, self.status)
+
+    # Toggles a flag
+    def flag(self, x, y):
+        """
+        Applies a right click on the cell at (x, y).
+
+        Preconditions:
+        - `x` and `y` are valid indices in the board's grid.
+
+        Postconditions:
+        - Does nothing if the game is over or the cell is revealed.
+        - Otherwise toggles the flag; the board updates its flag counters.
+        - Returns a MoveResult with every changed cell.
+        """
+        if self.game_over:
+            return MoveResult(set(), self.status)
+
+        changed = self.board.toggleFlag(x, y)
+        if changed:
+            self.move_count += 1
+        return MoveResult(changed, self.status)
+
+    # Controller-compatible names, so code written against GameController can drive the engine directly.
+    # Like the controller, they return only the set of changed cells.
+    def onClick(self, x, y):
+        return self.reveal(x, y).changed
+
+    def onRightClick(self, x, y):
+        return self.flag(x, y).changed
+
+    # Ends the game
+    def endGame(self, won):
+        """
+        Ends the game and reveals the end state of the board.
+
+        Preconditions:
+        - `won` is a boolean indicating whether the player won or lost.
+
+        Postconditions:
+        - `game_over` is True and `won` is set.
+        - Returns the cells changed by the end-of-game reveal, or an empty set if the game had already ended
+          or `self.reveal_on_end` is False.
+        """
+        if self.game_over:
+            return set()
+        self.game_over = True
+        self.won = won
+        if self.start_time is not None:
+            self.end_time = datetime.now()
+        if not self.reveal_on_end:
+            return set()
+        return self.board.revealEndState()
+
+    @property
+    def status(self):
+        return (WON if self.won else LOST) if self.game_over else PLAYING
+
+    # Counters owned by the board, kept here for code written against the engine
+    @property
+    def flag_count(self):
+        return self.board.flag_count
+
+    @property
+    def correct_flag_count(self):
+        return self.board.correct_flag_count
+
+    @property
+    def clicked_count(self):
+        return self.board.revealed_safe_count
+
+    # Gets a snapshot of the game in progress
+    def getStatus(self):
+        """
+        Gets the current state of the game.
+
+        Postconditions:
+        - Returns a dictionary of plain values describing the game.
+        """
+        return {
+            "status": self.status,
+            "rows": self.board.rows,
+            "cols": self.board.cols,
+            "mines": self.board.mines,
+            "remaining_mines": self.board.mines - self.flag_count,
+            "flags": self.flag_count,
+            "clicked": self.clicked_count,
+            "moves": self.move_count,
+            "elapsed": self.getTimeElapsed(),
+        }
+
+    # Gets the outcome of a finished game
+    def getResult(self):
+        """
+        Gets the outcome of the game.
+
+        Postconditions:
+        - Returns None while the game is in progress.
+        - Otherwise returns a dictionary with the outcome, whether the treasure was found,
+          the number of moves, the number of correct flags and the elapsed seconds.
+        """
+        if not self.game_over:
+            return None
+        return {
+            "won": self.won,
+            "found_treasure": self.found_treasure,
+            "moves": self.move_count,
+            "correct_flags": self.correct_flag_count,
+            "seconds": self.getSecondsElapsed(),
+        }
+
+    def getSecondsElapsed(self):
+        """
+        Calculates the elapsed time since the first reveal.
+
+        Postconditions:
+        - Returns the elapsed time in seconds as a float, or 0.0 if the game has not started.
+        - The time stops when the game ends.
+        """
+        if self.start_time is None:
+            return 0.0
+        return ((self.end_time or datetime.now()) - self.start_time).total_seconds()
+
+    def getTimeElapsed(self):
+        """
+        Calculates the elapsed time since the game started.
+
+        Postconditions:
+        - Returns a string representing the elapsed time in HH:MM:SS format.
+        """
+        if self.start_time is None:
+            return "00:00:00"
+        else:
+            delta = (self.end_time or datetime.now()) - self.start_time
+            return str(delta).split('.')[0]
@@ -0,0 +1,282 @@
+# Multi-session text game server. Every connection plays its own game through a GameEngine and a TextBoardView
+# that writes into a buffer, and all sessions share one asyncio event loop, so the server runs no thread per player.
+import asyncio
+import io
+from Models.board_model import BoardModel, DIFFICULTY_PRESETS
+from Controllers.game_engine import GameEngine, WON
+from Views.text_board_view import TextBoardView
+
+# Address served by default
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# Line that ends every reply, so a client knows when to send its next command
+END_OF_REPLY = "."
+
+# Seconds a session may stay silent before it is closed
+IDLE_TIMEOUT = 600.0
+
+# Sessions served at once; further connections are turned away
+MAX_SESSIONS = 10000
+
+# Connections waiting to be accepted, so a burst of players connecting at once is not refused
+LISTEN_BACKLOG = 1024
+
+# Longest command line accepted, in bytes
+MAX_LINE = 256
+
+# Largest board a session may ask for, in cells
+MAX_SESSION_CELLS = 100 * 100
+
+# Text sent for the HELP command
+HELP_TEXT = """Commands:
+  R x y       reveal the cell in row x, column y
+  F x y       flag or unflag the cell in row x, column y
+  G x y       move the view to the cell in row x, column y
+  B           show the board
+  NEW         start a new game with the same board
+  NEW level   start a new game on beginner, intermediate or expert
+  NEW rows cols mines treasures
+              start a new game on a custom board
+  QUIT        leave"""
+
+class GameSession:
+    """
+    State of one player's game: the board, its engine and a text view rendering into a buffer.
+    """
+    def __init__(self, rows, cols, mines, treasures):
+        """
+        Starts a session with a new game.
+
+        Preconditions:
+        - The board parameters are valid for `BoardModel`.
+
+        Postconditions:
+        - `self.engine` plays a new game and the first frame is waiting in the output buffer.
+        - `self.closed` is False until the player quits, and `self.games_started` counts the session's games.
+        """
+        self.output = io.StringIO()
+        self.closed = False
+        self.games_started = 0
+        self.board = None
+        self.newGame(rows, cols, mines, treasures)
+
+    # Starts a new game on the given board parameters, reusing the board if they are unchanged
+    def newGame(self, rows, cols, mines, treasures):
+        board = self.board
+        if board is None or (board.rows, board.cols, board.mines, board.treasures) != (rows, cols, mines, treasures):
+            self.board = BoardModel(rows, cols, mines, treasures)
+            self.engine = GameEngine(self.board)
+            self.view = TextBoardView(self.board, stream=self.output, ansi=False)
+        self.engine.newGame()
+        self.games_started += 1
+        self.view.last_frame = None
+        self.view.resetUI()
+
+    # Writes a line of the reply
+    def _say(self, text):
+        self.output.write(text + "\n")
+
+    # Writes the status line shown after every move in text mode
+    def _status(self):
+        engine = self.engine
+        self._say(f"Mines: {self.board.mines - engine.flag_count}, Time: {engine.getTimeElapsed()}")
+        if engine.game_over:
+            self._say("Congratulations! You Win!" if engine.status == WON else "Game Over! You Lose.")
+            self._say("Send NEW to play again or QUIT to leave.")
+
+    # Parses the arguments of a NEW command
+    def _newGameArguments(self, arguments):
+        """
+        Gets the board parameters asked for by NEW.
+
+        Postconditions:
+        - Returns (rows, cols, mines, treasures): the current board's with no arguments, a preset's with a level name,
+          or the four given numbers.
+        - Raises ValueError with a message for the player if the arguments are not a valid board.
+        """
+        if not arguments:
+            return self.board.rows, self.board.cols, self.board.mines, self.board.treasures
+        if len(arguments) == 1:
+            preset = DIFFICULTY_PRESETS.get(arguments[0].lower())
+            if preset is None:
+                raise ValueError(f"Unknown level. Use {', '.join(DIFFICULTY_PRESETS)}.")
+            return preset
+        if len(arguments) != 4 or not all(argument.isdigit() for argument in arguments):
+            raise ValueError("Use NEW, NEW level or NEW rows cols mines treasures.")
+        rows, cols, mines, treasures = (int(argument) for argument in arguments)
+        if rows < 1 or cols < 1 or rows * cols > MAX_SESSION_CELLS:
+            raise ValueError(f"Boards must have between 1 and {MAX_SESSION_CELLS} cells.")
+        if mines + treasures >= rows * cols:
+            raise ValueError("Invalid number of mines or treasures.")
+        return rows, cols, mines, treasures
+
+    # Parses the coordinates of a cell command
+    def _cellArguments(self, arguments):
+        if len(arguments) != 2:
+            raise ValueError("Invalid input format. Use 'R x y' or 'F x y'.")
+        if not (arguments[0].isdigit() and arguments[1].isdigit()):
+            raise ValueError("Invalid input. Please enter numeric coordinates.")
+        x, y = int(arguments[0]), int(arguments[1])
+        if not (0 <= x < self.board.rows and 0 <= y < self.board.cols):
+            raise ValueError("Coordinates out of bounds.")
+        return x, y
+
+    # Applies one command line and returns the reply
+    def handle(self, line):
+        """
+        Runs one command from the player.
+
+        Preconditions:
+        - `line` is one line of text without its line ending.
+
+        Postconditions:
+        - Moves are applied through the engine and the changed cells are drawn by the view, as in text mode.
+        - Returns the reply: the frame if the board changed, then the status or an error message.
+        - After QUIT, `self.closed` is True.
+        """
+        parts = line.split()
+        if parts:
+            command, arguments = parts[0].upper(), parts[1:]
+            try:
+                if command in ("R", "F"):
+                    x, y = self._cellArguments(arguments)
+                    if self.engine.game_over:
+                        self._say("The game is over. Send NEW to play again.")
+                    else:
+                        result = self.engine.reveal(x, y) if command == "R" else self.engine.flag(x, y)
+                        self.view.updateCells(result.changed)
+                        self._status()
+                elif command == "G":
+                    self.view.centerOn(*self._cellArguments(arguments))
+                    self.view.last_frame = None
+                    self.view.displayBoard()
+                elif command == "B":
+                    self.view.last_frame = None
+                    self.view.displayBoard()
+                    self._status()
+                elif command == "NEW":
+                    self.newGame(*self._newGameArguments(arguments))
+                    self._status()
+                elif command in ("QUIT", "EXIT"):
+                    self._say("Thanks for playing!")
+                    self.closed = True
+                elif command == "HELP":
+                    self._say(HELP_TEXT)
+                else:
+                    self._say("Unknown command. Send HELP for the list of commands.")
+            except ValueError as error:
+                self._say(str(error))
+        return self.takeOutput()
+
+    # Takes the text written since the last reply
+    def takeOutput(self):
+        text = self.output.getvalue()
+        self.output.seek(0)
+        self.output.truncate()
+        return text
+
+class GameServer:
+    """
+    Serves independent game sessions over TCP or a Unix socket from one event loop.
+    """
+    def __init__(self, level="beginner", idle_timeout=IDLE_TIMEOUT, max_sessions=MAX_SESSIONS):
+        """
+        Initializes the server.
+
+        Preconditions:
+        - `level` is a key of `DIFFICULTY_PRESETS`, used for the first game of every session.
+
+        Postconditions:
+        - `self.sessions` is the number of connected sessions, and `self.games_played` counts every game started.
+        """
+        self.board_parameters = DIFFICULTY_PRESETS[level]
+        self.idle_timeout = idle_timeout
+        self.max_sessions = max_sessions
+        self.sessions = 0
+        self.games_played = 0
+        self.server = None
+
+    # Sends a reply followed by the end-of-reply line
+    async def _reply(self, writer, text):
+        if text and not text.endswith("\n"):
+            text += "\n"
+        writer.write((text + END_OF_REPLY + "\n").encode())
+        await writer.drain()
+
+    # Serves one connection until the player quits, goes idle or disconnects
+    async def handleConnection(self, reader, writer):
+        """
+        Runs the session of one connection.
+
+        Postconditions:
+        - Each line received is handled by the connection's GameSession and answered with its reply and `END_OF_REPLY`.
+        - The session ends on QUIT, end of input, a line longer than `MAX_LINE`, or `idle_timeout` seconds without a command.
+        - Connections beyond `max_sessions` get an error reply and are closed.
+        """
+        if self.sessions >= self.max_sessions:
+            await self._reply(writer, "Server full. Try again later.\n")
+            writer.close()
+            return
+
+        session = GameSession(*self.board_parameters)
+        self.sessions += 1
+        try:
+            await self._reply(writer, "Welcome to Minesweeper. Send HELP for the list of commands.\n" + session.takeOutput())
+            while not session.closed:
+                try:
+                    line = await asyncio.wait_for(reader.readline(), self.idle_timeout)
+                except asyncio.TimeoutError:
+                    await self._reply(writer, "Closing idle session.\n")
+                    break
+                except ValueError:
+                    # The line overran the reader's limit
+                    break
+                if not line:
+                    break
+                await self._reply(writer, session.handle(line.decode(errors="replace").strip()))
+        except ConnectionError:
+            pass
+        finally:
+            self.sessions -= 1
+            self.games_played += session.games_started
+            writer.close()
+
+    # Starts listening
+    async def start(self, host=DEFAULT_HOST, port=DEFAULT_PORT, unix_path=None):
+        """
+        Opens the listening socket.
+
+        Postconditions:
+        - Listens on `unix_path` if it is given, otherwise on `host` and `port`. A port of 0 picks a free port.
+        - Returns the asyncio server; `serve` keeps it running.
+        """
+        if unix_path is not None:
+            self.server = await asyncio.start_unix_server(self.handleConnection, unix_path, limit=MAX_LINE, backlog=LISTEN_BACKLOG)
+        else:
+            self.server = await asyncio.start_server(self.handleConnection, host, port, limit=MAX_LINE, backlog=LISTEN_BACKLOG)
+        return self.server
+
+    # Serves until cancelled
+    async def serve(self, host=DEFAULT_HOST, port=DEFAULT_PORT, unix_path=None):
+        await self.start(host, port, unix_path)
+        async with self.server:
+            await self.server.serve_forever()
+
+# Reads one reply from a connection
+async def readReply(reader):
+    """
+    Reads the lines of one server reply.
+
+    Postconditions:
+    - Returns the reply without its `END_OF_REPLY` line, or None if the connection closed first.
+    """
+    lines = []
+    while True:
+        line = await reader.readline()
+        if not line:
+            return None
+        text = line.decode().rstrip("\n")
+        if text == END_OF_REPLY:
+            return "\n".join(lines)
+        lines.append(text)
@@ -0,0 +1,222 @@
+# Versioned binary snapshots of a game in progress. A snapshot holds a fixed header with the board parameters,
+# counters and timer, the board's random generator state, and five bit planes; no Cell objects are pickled.
+import os
+import struct
+from datetime import datetime, timedelta
+import random
+from Models.bit_planes import packPositions, planeCount, planePaddingClear, planePositions, planeSize, planesOverlap
+
+# First bytes of every snapshot
+MAGIC = b"MSWS"
+
+# Format version written by this module
+VERSION = 1
+
+# Header layout: magic, version, flags, rows, cols, mines, treasures, seed, moves, elapsed seconds,
+# revealed safe cells, flags placed, correct flags
+HEADER = struct.Struct("<4sHHIIQQQQdQQQ")
+
+# Internal state of `random.Random`: 624 words and an index
+RNG_STATE = struct.Struct("<625I")
+
+# Header flags
+FLAG_SEED = 1
+FLAG_STARTED = 2
+FLAG_GAME_OVER = 4
+FLAG_WON = 8
+FLAG_FOUND_TREASURE = 16
+FLAG_MINE_REVEALED = 32
+FLAG_TREASURE_FOUND = 64
+FLAG_TESTING = 128
+
+# Planes stored after the header, in order
+PLANES = ("mines", "treasures", "revealed", "flagged", "wrong_flags")
+
+class SnapshotError(ValueError):
+    """
+    Raised when data is not a snapshot this module can restore.
+    """
+
+# Reads the header of a snapshot
+def snapshotInfo(data):
+    """
+    Reads the header of a snapshot without restoring it.
+
+    Preconditions:
+    - `data` is a bytes-like object.
+
+    Postconditions:
+    - Returns a dictionary with the board's `rows`, `cols`, `mines` and `treasures`, and the game's `game_over`, `moves` and `elapsed`.
+    - Raises SnapshotError if `data` is not a complete snapshot of this version.
+    """
+    if len(data) < HEADER.size:
+        raise SnapshotError("Invalid snapshot")
+    (magic, version, flags, rows, cols, mines, treasures, seed, moves, elapsed,
+     revealedSafe, flagCount, correctFlags) = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise SnapshotError("Invalid snapshot")
+    if len(data) < HEADER.size + RNG_STATE.size + len(PLANES) * planeSize(rows, cols):
+        raise SnapshotError("Invalid snapshot")
+    return {
+        "flags": flags,
+        "rows": rows,
+        "cols": cols,
+        "mines": mines,
+        "treasures": treasures,
+        "seed": seed if flags & FLAG_SEED else None,
+        "game_over": bool(flags & FLAG_GAME_OVER),
+        "moves": moves,
+        "elapsed": elapsed,
+        "revealed_safe_count": revealedSafe,
+        "flag_count": flagCount,
+        "correct_flag_count": correctFlags,
+    }
+
+# Checks that the planes of a snapshot describe a game a board can take
+def _checkPlanes(info, planes):
+    """
+    Validates the planes of a snapshot against each other and its header.
+
+    Postconditions:
+    - Raises SnapshotError if the board is empty, a plane has bits set past the last cell, the mine or treasure plane
+      disagrees with the header count, a cell is both a mine and a treasure, a flag is on a revealed cell,
+      a wrong flag is not a flag, or the flag counters disagree with the planes.
+    """
+    rows, cols = info["rows"], info["cols"]
+    if rows * cols == 0:
+        raise SnapshotError("Invalid snapshot")
+    values = {name: int.from_bytes(plane, "little") for name, plane in planes.items()}
+    if not all(planePaddingClear(plane, rows, cols) for plane in planes.values()) \
+            or planeCount(planes["mines"]) != info["mines"] or planeCount(planes["treasures"]) != info["treasures"] \
+            or planesOverlap(planes["mines"], planes["treasures"]) or planesOverlap(planes["flagged"], planes["revealed"]) \
+            or values["wrong_flags"] & ~values["flagged"] \
+            or planeCount(planes["flagged"]) != info["flag_count"] \
+            or (values["flagged"] & values["mines"]).bit_count() != info["correct_flag_count"] \
+            or info["revealed_safe_count"] > rows * cols - info["mines"] - info["treasures"]:
+        raise SnapshotError("Invalid snapshot")
+
+# Captures the state of a game
+def saveSnapshot(engine):
+    """
+    Captures the complete state of the engine's game.
+
+    Preconditions:
+    - `engine` is a GameEngine whose board has been set up. Endless boards cannot be saved.
+
+    Postconditions:
+    - Returns the snapshot as bytes.
+    - The board's random generator state is included, so a restored board goes on to generate the same games.
+    - Apart from the revealed plane, which each backend packs in bulk, the cost is proportional to the number of mines, treasures and flags.
+    """
+    board = engine.board
+    rows, cols = board.rows, board.cols
+    seed = board.seed
+    hasSeed = isinstance(seed, int) and 0 <= seed < 1 << 64
+    started = engine.start_time is not None
+
+    flags = (FLAG_SEED if hasSeed else 0) | (FLAG_STARTED if started else 0) \
+        | (FLAG_GAME_OVER if engine.game_over else 0) | (FLAG_WON if engine.won else 0) \
+        | (FLAG_FOUND_TREASURE if engine.found_treasure else 0) \
+        | (FLAG_MINE_REVEALED if board.mine_revealed else 0) | (FLAG_TREASURE_FOUND if board.treasure_found else 0) \
+        | (FLAG_TESTING if board.is_testing else 0)
+
+    grid = board.grid
+    wrongFlags = [(x, y) for x, y in board.flagged_positions if grid[x][y].is_wrong_flag]
+    rngState = board.rng.getstate()[1]
+
+    parts = [
+        HEADER.pack(MAGIC, VERSION, flags, rows, cols, board.mines, board.treasures, seed if hasSeed else 0,
+                    engine.move_count, engine.getSecondsElapsed(),
+                    board.revealed_safe_count, board.flag_count, board.correct_flag_count),
+        RNG_STATE.pack(*rngState),
+        packPositions(rows, cols, board.mine_positions),
+        packPositions(rows, cols, board.treasure_positions),
+        board.revealedPlane(),
+        packPositions(rows, cols, board.flagged_positions),
+        packPositions(rows, cols, wrongFlags),
+    ]
+    return b"".join(parts)
+
+# Restores a game from a snapshot
+def restoreSnapshot(engine, data):
+    """
+    Replaces the engine's game with the one in a snapshot.
+
+    Preconditions:
+    - `engine` is a GameEngine over a board backend that can be saved, with any dimensions.
+    - `data` was returned by `saveSnapshot`, possibly with a different backend.
+
+    Postconditions:
+    - The board takes the snapshot's dimensions, positions, revealed cells, flags, counters, seed and random generator state.
+      The planes are loaded with the backend's `loadPlanes`, `restoreRevealed` and `restoreFlags`, so no game is generated
+      and the zero-region index is only built by the first clear.
+    - The engine takes the snapshot's outcome and move count, and its clock resumes from the saved elapsed time.
+    - Returns the set of (x, y) cells that are revealed or flagged, for the view to draw.
+    - Raises SnapshotError if `data` is not a valid snapshot; everything is checked before the game is changed,
+      so the game is unchanged in that case.
+    """
+    info = snapshotInfo(data)
+    flags = info["flags"]
+    rows, cols = info["rows"], info["cols"]
+    size = planeSize(rows, cols)
+    offset = HEADER.size + RNG_STATE.size
+    planes = {name: data[offset + index * size:offset + (index + 1) * size] for index, name in enumerate(PLANES)}
+    _checkPlanes(info, planes)
+    rngState = (3, RNG_STATE.unpack_from(data, HEADER.size), None)
+    try:
+        random.Random().setstate(rngState)
+    except ValueError:
+        raise SnapshotError("Invalid snapshot")
+
+    # Loads the saved layout directly; the random generator then goes on to the games after it
+    board = engine.board
+    board.rows, board.cols = rows, cols
+    board.seed = info["seed"]
+    board.loadPlanes(planes["mines"], planes["treasures"])
+    board.is_testing = bool(flags & FLAG_TESTING)
+    board.rng.setstate(rngState)
+
+    board.restoreRevealed(planes["revealed"])
+    board.restoreFlags(planes["flagged"], planes["wrong_flags"])
+    board.revealed_safe_count = info["revealed_safe_count"]
+    board.flag_count = info["flag_count"]
+    board.correct_flag_count = info["correct_flag_count"]
+    board.mine_revealed = bool(flags & FLAG_MINE_REVEALED)
+    board.treasure_found = bool(flags & FLAG_TREASURE_FOUND)
+
+    engine.resetCounters()
+    engine.game_over = bool(flags & FLAG_GAME_OVER)
+    engine.won = bool(flags & FLAG_WON)
+    engine.found_treasure = bool(flags & FLAG_FOUND_TREASURE)
+    engine.move_count = info["moves"]
+    if flags & FLAG_STARTED:
+        engine.start_time = datetime.now() - timedelta(seconds=info["elapsed"])
+        if engine.game_over:
+            engine.end_time = engine.start_time + timedelta(seconds=info["elapsed"])
+
+    return set(planePositions(planes["revealed"], cols)) | board.flagged_positions
+
+# Writes a snapshot to a file
+def writeSnapshot(file_path, engine):
+    """
+    Saves the engine's game to a file.
+
+    Postconditions:
+    - The snapshot is written to a temporary file that then replaces `file_path`, so a crash never leaves a partial snapshot.
+    """
+    data = saveSnapshot(engine)
+    temporary = file_path + ".tmp"
+    with open(temporary, "wb") as file:
+        file.write(data)
+    os.replace(temporary, file_path)
+
+# Reads a snapshot from a file
+def readSnapshot(file_path, engine):
+    """
+    Restores the engine's game from a file written by `writeSnapshot`.
+
+    Postconditions:
+    - Same as `restoreSnapshot`.
+    """
+    with open(file_path, "rb") as file:
+        return restoreSnapshot(engine, file.read())
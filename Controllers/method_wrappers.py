@@ -0,0 +1,41 @@
+# Replaces methods on their classes with wrappers and puts the originals back. Used by the optional
+# instrumentation in Controllers.metrics and Controllers.profiling, which both install wrappers only while enabled.
+import importlib
+
+# Installs wrappers on the named methods
+def wrapMethods(targets):
+    """
+    Wraps methods named by module, class and method name.
+
+    Preconditions:
+    - `targets` is an iterable of (module, class, method, wrap) tuples, where `wrap(original)` returns the replacement.
+
+    Postconditions:
+    - Every method defined on its class is replaced by `wrap(original)`. Targets whose module cannot be imported,
+      and methods a class only inherits, are skipped, so an optional backend never stops the others from being wrapped.
+    - Returns the list of (class, name, original) replaced, for `restoreMethods`.
+    """
+    originals = []
+    for module, cls, name, wrap in targets:
+        try:
+            owner = getattr(importlib.import_module(module), cls)
+        except ImportError:
+            continue
+        original = owner.__dict__.get(name)
+        if original is None:
+            continue
+        originals.append((owner, name, original))
+        setattr(owner, name, wrap(original))
+    return originals
+
+# Puts back the methods replaced by `wrapMethods`
+def restoreMethods(originals):
+    """
+    Restores wrapped methods.
+
+    Postconditions:
+    - Every (class, name, original) in `originals` is set back, last wrapped first, and `originals` is emptied.
+    """
+    while originals:
+        owner, name, original = originals.pop()
+        setattr(owner, name, original)
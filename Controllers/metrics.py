@@ -0,0 +1,245 @@
+# Optional latency instrumentation. Enabling it wraps the instrumented methods on their classes; while it is
+# disabled the original methods are in place, so a game without metrics runs exactly the code it always did.
+import atexit
+import bisect
+import functools
+import os
+import threading
+import time
+from Controllers.method_wrappers import restoreMethods, wrapMethods
+
+# Upper bounds, in seconds, of the latency histogram buckets
+LATENCY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+# Upper bounds of the cells-touched histogram buckets
+CELL_BUCKETS = (0, 1, 8, 64, 512, 4096, 32768, 262144, 2097152)
+
+# Seconds between two exports by default
+DEFAULT_EXPORT_INTERVAL = 10.0
+
+# Cells touched by an operation: the size of the change set it returned or, for a view redraw, was given
+def _returnedCells(args, result):
+    return len(result) if result is not None else 0
+
+def _givenCells(args, result):
+    changed = args[0] if args else None
+    return len(changed) if changed is not None else 0
+
+def _oneCell(args, result):
+    return 1
+
+# Methods that are timed, as (module, class, method, cells-touched function)
+INSTRUMENTED = (
+    ("Controllers.game_controller", "GameController", "onClick", _returnedCells),
+    ("Controllers.game_controller", "GameController", "onRightClick", _returnedCells),
+    ("Controllers.game_controller", "GameController", "refreshView", _givenCells),
+    ("Models.board_model", "BoardModel", "clearSurroundingTiles", _returnedCells),
+    ("Models.array_board_model", "ArrayBoardModel", "clearSurroundingTiles", _returnedCells),
+    ("Models.bit_board_model", "BitBoardModel", "clearSurroundingTiles", _returnedCells),
+    ("Models.endless_board_model", "EndlessBoardModel", "clearSurroundingTiles", _returnedCells),
+    ("Views.board_view", "BoardView", "updateCell", _oneCell),
+    ("Views.canvas_board_view", "CanvasBoardView", "updateCell", _oneCell),
+)
+
+class Histogram:
+    """
+    Cumulative-bucket histogram in the Prometheus layout.
+    """
+    __slots__ = ("bounds", "counts", "total", "count")
+
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.total = 0
+        self.count = 0
+
+    # Records one observation
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.total += value
+        self.count += 1
+
+class MetricsRegistry:
+    """
+    In-process counters for operation latencies, cells touched and finished games.
+    """
+    def __init__(self):
+        """
+        Initializes an empty registry.
+
+        Postconditions:
+        - Every metric is keyed by the operation and the board size, so slow sizes and actions can be told apart.
+        - `self.lock` guards every update, so an exporter thread always reads consistent values.
+        """
+        self.lock = threading.Lock()
+        self.latency = {}
+        self.cells = {}
+        self.games = {}
+        self.started = time.monotonic()
+
+    # Records one timed operation
+    def record(self, operation, board, seconds, cells):
+        key = (operation, board)
+        with self.lock:
+            latency = self.latency.get(key)
+            if latency is None:
+                latency = self.latency[key] = Histogram(LATENCY_BUCKETS)
+                self.cells[key] = Histogram(CELL_BUCKETS)
+            latency.observe(seconds)
+            self.cells[key].observe(cells)
+
+    # Records a finished game
+    def recordGame(self, board, won):
+        key = (board, "won" if won else "lost")
+        with self.lock:
+            self.games[key] = self.games.get(key, 0) + 1
+
+    # Renders every metric in the Prometheus text exposition format
+    def exportText(self):
+        """
+        Renders the metrics.
+
+        Postconditions:
+        - Returns the text of `minesweeper_operation_seconds` and `minesweeper_operation_cells` histograms,
+          a `minesweeper_games_total` counter and a `minesweeper_games_per_second` gauge averaged since the registry was created.
+        """
+        with self.lock:
+            lines = []
+            for name, description, metrics in (
+                ("minesweeper_operation_seconds", "Latency of instrumented operations.", self.latency),
+                ("minesweeper_operation_cells", "Cells touched by instrumented operations.", self.cells),
+            ):
+                lines.append(f"# HELP {name} {description}")
+                lines.append(f"# TYPE {name} histogram")
+                for (operation, board), histogram in sorted(metrics.items()):
+                    labels = f'operation="{operation}",board="{board}"'
+                    cumulative = 0
+                    for bound, count in zip(histogram.bounds, histogram.counts):
+                        cumulative += count
+                        lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+                    lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {histogram.count}')
+                    lines.append(f"{name}_sum{{{labels}}} {histogram.total}")
+                    lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+
+            lines.append("# HELP minesweeper_games_total Finished games.")
+            lines.append("# TYPE minesweeper_games_total counter")
+            for (board, result), count in sorted(self.games.items()):
+                lines.append(f'minesweeper_games_total{{board="{board}",result="{result}"}} {count}')
+
+            elapsed = time.monotonic() - self.started
+            lines.append("# HELP minesweeper_games_per_second Finished games per second since metrics were enabled.")
+            lines.append("# TYPE minesweeper_games_per_second gauge")
+            lines.append(f"minesweeper_games_per_second {sum(self.games.values()) / elapsed if elapsed > 0 else 0.0}")
+        return "\n".join(lines) + "\n"
+
+    # Writes the metrics to a file
+    def writeText(self, file_path):
+        """
+        Writes `exportText` to `file_path`.
+
+        Postconditions:
+        - The file is replaced in one step, so a scraper never reads a partial export.
+        """
+        temporary = file_path + ".tmp"
+        with open(temporary, "w") as file:
+            file.write(self.exportText())
+        os.replace(temporary, file_path)
+
+class MetricsExporter:
+    """
+    Background thread that periodically writes a registry to a file.
+    """
+    def __init__(self, registry, file_path, interval=DEFAULT_EXPORT_INTERVAL):
+        """
+        Starts the exporter.
+
+        Postconditions:
+        - The registry is written to `file_path` every `interval` seconds on a daemon thread, and once more by `stop`,
+          which also runs at exit.
+        """
+        self.registry = registry
+        self.file_path = file_path
+        self.interval = interval
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.run, name="metrics-exporter", daemon=True)
+        self.thread.start()
+        atexit.register(self.stop)
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            self.registry.writeText(self.file_path)
+
+    # Stops the thread after a final export
+    def stop(self):
+        if self.stopped.is_set():
+            return
+        self.stopped.set()
+        self.thread.join()
+        self.registry.writeText(self.file_path)
+        atexit.unregister(self.stop)
+
+# Registry in use while metrics are enabled
+_registry = None
+
+# Original methods replaced by `enableMetrics`, as (class, name, function)
+_originals = []
+
+# Gets a short label for a board's size
+def _boardLabel(instance):
+    board = getattr(instance, "board", instance)
+    return f"{board.rows}x{board.cols}"
+
+# Wraps a method so every call is timed
+def _timed(function, operation, cellsTouched, registry):
+    @functools.wraps(function)
+    def wrapper(self, *args, **kwargs):
+        start = time.perf_counter()
+        result = function(self, *args, **kwargs)
+        registry.record(operation, _boardLabel(self), time.perf_counter() - start, cellsTouched(args, result))
+        return result
+    return wrapper
+
+# Wraps the end of a game so finished games are counted once
+def _counted(function, registry):
+    @functools.wraps(function)
+    def wrapper(self, won, *args, **kwargs):
+        if not self.game_over:
+            registry.recordGame(_boardLabel(self), won)
+        return function(self, won, *args, **kwargs)
+    return wrapper
+
+# Installs the instrumentation
+def enableMetrics(registry=None):
+    """
+    Starts recording metrics.
+
+    Postconditions:
+    - Every method in `INSTRUMENTED` whose module imports is wrapped on its class, and `GameEngine.endGame` counts games,
+      including headless ones.
+    - Returns the registry in use, a new one if none is given. Calling it again while enabled returns the current registry.
+    """
+    global _registry
+    if _registry is not None:
+        return _registry
+    _registry = registry or MetricsRegistry()
+
+    registry = _registry
+    targets = [(module, cls, name, functools.partial(_timed, operation=f"{cls}.{name}", cellsTouched=cells, registry=registry))
+               for module, cls, name, cells in INSTRUMENTED]
+    targets.append(("Controllers.game_engine", "GameEngine", "endGame", functools.partial(_counted, registry=registry)))
+    _originals.extend(wrapMethods(targets))
+    return registry
+
+# Removes the instrumentation
+def disableMetrics():
+    """
+    Stops recording metrics.
+
+    Postconditions:
+    - Every wrapped method is restored, so the instrumented code runs with no overhead.
+    - Returns the registry that was in use, or None.
+    """
+    global _registry
+    restoreMethods(_originals)
+    registry, _registry = _registry, None
+    return registry
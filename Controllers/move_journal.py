@@ -0,0 +1,337 @@
+# Compact journal of the moves made through a GameController, and headless replay of it.
+# Every field is an unsigned LEB128 varint, so a move usually costs five or six bytes.
+import atexit
+import time
+from collections import namedtuple
+from Models.board_model import BoardModel
+from Controllers.game_engine import GameEngine
+from Controllers.game_snapshot import restoreSnapshot
+
+# First bytes of every journal, followed by the format version
+MAGIC = b"MSWJ"
+VERSION = 1
+
+# Entry tags
+GAME = 1
+REVEAL = 2
+FLAG = 3
+SNAPSHOT = 4
+
+# Bytes read to check the header of an existing journal, enough for the magic and any version varint
+HEADER_LIMIT = 16
+
+# Bytes buffered in memory before they are written to the file
+BUFFER_LIMIT = 4096
+
+# Start of a game: the board parameters, its seed if it is an integer, and its layout
+GameEntry = namedtuple("GameEntry", ["rows", "cols", "mines", "treasures", "seed", "mine_positions", "treasure_positions"])
+
+# Game resumed from a snapshot
+SnapshotEntry = namedtuple("SnapshotEntry", ["data"])
+
+# A move: REVEAL or FLAG, its cell, and microseconds since the previous entry
+MoveEntry = namedtuple("MoveEntry", ["kind", "x", "y", "delay"])
+
+class JournalError(ValueError):
+    """
+    Raised when a file is not a journal.
+    """
+
+class TruncatedJournalError(JournalError):
+    """
+    Raised when a journal ends in the middle of an entry.
+    """
+
+# Appends an unsigned varint to a buffer
+def writeVarint(buffer, value):
+    """
+    Encodes `value` at the end of `buffer`.
+
+    Postconditions:
+    - Raises ValueError, leaving `buffer` unchanged, if `value` is negative.
+    """
+    if value < 0:
+        raise ValueError("Journal values must not be negative")
+    while value > 0x7F:
+        buffer.append(value & 0x7F | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+# Reads an unsigned varint from a buffer
+def readVarint(data, offset):
+    """
+    Decodes the varint at `offset`.
+
+    Postconditions:
+    - Returns (value, offset of the next byte).
+    - Raises TruncatedJournalError if the data ends inside the varint.
+    """
+    value = 0
+    shift = 0
+    while True:
+        if offset >= len(data):
+            raise TruncatedJournalError("Truncated journal")
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+# Encodes positions as gaps between sorted flat indices
+def _writePositions(buffer, cols, positions):
+    indices = sorted(x * cols + y for x, y in positions)
+    writeVarint(buffer, len(indices))
+    previous = 0
+    for index in indices:
+        writeVarint(buffer, index - previous)
+        previous = index
+
+# Decodes positions written by `_writePositions`
+def _readPositions(data, offset, cols):
+    count, offset = readVarint(data, offset)
+    positions = []
+    index = 0
+    for _ in range(count):
+        gap, offset = readVarint(data, offset)
+        index += gap
+        positions.append(divmod(index, cols))
+    return positions, offset
+
+# Checks the magic and version at the start of a journal
+def _readHeader(data):
+    """
+    Reads the journal header.
+
+    Postconditions:
+    - Returns the offset of the first entry.
+    - Raises JournalError if `data` does not start with `MAGIC` and `VERSION`.
+    """
+    if data[:len(MAGIC)] != MAGIC:
+        raise JournalError("Invalid journal")
+    version, offset = readVarint(data, len(MAGIC))
+    if version != VERSION:
+        raise JournalError("Invalid journal")
+    return offset
+
+class MoveJournal:
+    """
+    Appends games and moves to a journal file.
+    """
+    def __init__(self, file_path):
+        """
+        Opens a journal for appending.
+
+        Preconditions:
+        - `file_path` is a writable path. An existing journal is appended to.
+
+        Postconditions:
+        - A new or empty file gets the journal header.
+        - Raises JournalError, leaving the file untouched, if it is not empty and does not start with this version's header.
+        - Entries are buffered and written every `BUFFER_LIMIT` bytes, at the start of every game, on `flush` and at exit.
+        """
+        self.file_path = file_path
+        self.file = open(file_path, "ab")
+        self.buffer = bytearray()
+        if self.file.tell() == 0:
+            self.buffer += MAGIC
+            writeVarint(self.buffer, VERSION)
+        else:
+            try:
+                with open(file_path, "rb") as existing:
+                    _readHeader(existing.read(HEADER_LIMIT))
+            except JournalError:
+                self.file.close()
+                raise JournalError(f"Not a version {VERSION} journal: {file_path}")
+        self.last_time = time.monotonic_ns()
+        atexit.register(self.close)
+
+    # Gets the microseconds since the previous entry
+    def _delay(self):
+        now = time.monotonic_ns()
+        delay = (now - self.last_time) // 1000
+        self.last_time = now
+        return delay
+
+    # Records the start of a new game
+    def startGame(self, board):
+        """
+        Records the layout of a game that was just set up.
+
+        Preconditions:
+        - `board` has been set up and is not an endless board.
+
+        Postconditions:
+        - The board parameters, integer seed and mine and treasure positions are recorded, so a replay needs nothing else.
+        """
+        self.flush()
+        buffer = self.buffer
+        writeVarint(buffer, GAME)
+        for value in (board.rows, board.cols, board.mines, board.treasures):
+            writeVarint(buffer, value)
+        seed = board.seed
+        if isinstance(seed, int) and seed >= 0:
+            writeVarint(buffer, 1)
+            writeVarint(buffer, seed)
+        else:
+            writeVarint(buffer, 0)
+        _writePositions(buffer, board.cols, board.mine_positions)
+        _writePositions(buffer, board.cols, board.treasure_positions)
+        self._delay()
+
+    # Records a game resumed from a snapshot
+    def startSnapshot(self, data):
+        """
+        Records the snapshot a resumed game started from.
+
+        Postconditions:
+        - A replay restores the snapshot before applying the moves that follow.
+        """
+        self.flush()
+        writeVarint(self.buffer, SNAPSHOT)
+        writeVarint(self.buffer, len(data))
+        self.buffer += data
+        self._delay()
+
+    # Records a move
+    def recordMove(self, kind, x, y):
+        """
+        Records a left click (REVEAL) or right click (FLAG) on (x, y).
+
+        Postconditions:
+        - The entry is buffered; the file is written only once the buffer passes `BUFFER_LIMIT` bytes.
+        - Raises ValueError before anything is buffered if `x` or `y` is negative, so the journal never holds a partial entry.
+        """
+        if x < 0 or y < 0:
+            raise ValueError("Journal values must not be negative")
+        buffer = self.buffer
+        writeVarint(buffer, kind)
+        writeVarint(buffer, self._delay())
+        writeVarint(buffer, x)
+        writeVarint(buffer, y)
+        if len(buffer) >= BUFFER_LIMIT:
+            self.flush()
+
+    # Writes the buffered entries
+    def flush(self):
+        if self.buffer and not self.file.closed:
+            self.file.write(self.buffer)
+            self.file.flush()
+            self.buffer = bytearray()
+
+    # Writes the buffered entries and closes the file
+    def close(self):
+        if not self.file.closed:
+            self.flush()
+            self.file.close()
+        atexit.unregister(self.close)
+
+# Reads the entries of a journal
+def readJournal(file_path):
+    """
+    Decodes a journal.
+
+    Postconditions:
+    - Yields GameEntry, SnapshotEntry and MoveEntry tuples in the order they were recorded.
+    - Raises JournalError if the file is not a journal; a final entry cut short by a crash ends the journal early.
+    """
+    with open(file_path, "rb") as file:
+        data = file.read()
+    offset = _readHeader(data)
+
+    while offset < len(data):
+        try:
+            tag, offset = readVarint(data, offset)
+            if tag == GAME:
+                fields = []
+                for _ in range(4):
+                    value, offset = readVarint(data, offset)
+                    fields.append(value)
+                hasSeed, offset = readVarint(data, offset)
+                seed = None
+                if hasSeed:
+                    seed, offset = readVarint(data, offset)
+                cols = fields[1]
+                mines, offset = _readPositions(data, offset, cols)
+                treasures, offset = _readPositions(data, offset, cols)
+                entry = GameEntry(*fields, seed, mines, treasures)
+            elif tag == SNAPSHOT:
+                length, offset = readVarint(data, offset)
+                if offset + length > len(data):
+                    raise TruncatedJournalError("Truncated journal")
+                entry = SnapshotEntry(data[offset:offset + length])
+                offset += length
+            elif tag in (REVEAL, FLAG):
+                delay, offset = readVarint(data, offset)
+                x, offset = readVarint(data, offset)
+                y, offset = readVarint(data, offset)
+                entry = MoveEntry(tag, x, y, delay)
+            else:
+                raise JournalError("Invalid journal")
+        except TruncatedJournalError:
+            return
+        yield entry
+
+# Groups the entries of a journal by game
+def journalGames(file_path):
+    """
+    Splits a journal into games.
+
+    Postconditions:
+    - Yields (start, moves) pairs, where `start` is a GameEntry or SnapshotEntry and `moves` is the list of MoveEntry that followed it.
+    - Moves recorded before the first game are dropped.
+    """
+    start = None
+    moves = []
+    for entry in readJournal(file_path):
+        if isinstance(entry, MoveEntry):
+            if start is not None:
+                moves.append(entry)
+            continue
+        if start is not None:
+            yield start, moves
+        start, moves = entry, []
+    if start is not None:
+        yield start, moves
+
+# Creates the board and engine a recorded game starts from
+def startReplay(start, model=BoardModel):
+    """
+    Prepares a recorded game for replay.
+
+    Preconditions:
+    - `start` is a GameEntry or SnapshotEntry.
+    - `model` is `BoardModel` or one of its bounded subclasses.
+
+    Postconditions:
+    - Returns a GameEngine over a new `model` in the state the game was in when recording began.
+    """
+    if isinstance(start, SnapshotEntry):
+        engine = GameEngine(model())
+        restoreSnapshot(engine, start.data)
+        return engine
+    board = model(start.rows, start.cols, start.mines, start.treasures,
+                  start.mine_positions, start.treasure_positions, is_testing=True, seed=start.seed)
+    engine = GameEngine(board)
+    engine.newGame()
+    return engine
+
+# Replays a journal at full speed
+def replayJournal(file_path, model=BoardModel):
+    """
+    Re-runs every game of a journal without rendering.
+
+    Postconditions:
+    - Returns a list with one `GameEngine.getStatus` dictionary per game, after its last recorded move.
+    - The recorded delays are ignored, so the replay measures only game logic.
+    """
+    results = []
+    for start, moves in journalGames(file_path):
+        engine = startReplay(start, model)
+        for move in moves:
+            if move.kind == REVEAL:
+                engine.reveal(move.x, move.y)
+            else:
+                engine.flag(move.x, move.y)
+        results.append(engine.getStatus())
+    return results
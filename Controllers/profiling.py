@@ -0,0 +1,309 @@
+# Opt-in session profiling split into phases: startup and imports, board generation, UI construction and moves.
+# Entry points start it before their other imports. Phase boundaries are method wrappers, installed once startup ends.
+import argparse
+import atexit
+import collections
+import cProfile
+import functools
+import os
+import pstats
+import sys
+import threading
+import time
+from Controllers.method_wrappers import restoreMethods, wrapMethods
+
+# Environment variables that turn profiling on without a flag: the output directory and the profiler kind
+PROFILE_ENV = "MINESWEEPER_PROFILE"
+PROFILER_ENV = "MINESWEEPER_PROFILER"
+
+# Profiler kinds
+DETERMINISTIC = "deterministic"
+SAMPLING = "sampling"
+
+# Phases, in the order they are reported. Time outside every other phase, such as dialogs and waiting for input, is the session.
+STARTUP = "startup"
+BOARD_GENERATION = "board_generation"
+UI_CONSTRUCTION = "ui_construction"
+MOVES = "moves"
+SESSION = "session"
+PHASES = (STARTUP, BOARD_GENERATION, UI_CONSTRUCTION, MOVES, SESSION)
+
+# Seconds between two samples of the sampling profiler
+SAMPLE_INTERVAL = 0.005
+
+# Deepest stack recorded by one sample
+MAX_STACK_DEPTH = 128
+
+# Functions listed in each phase's text report
+TOP_FUNCTIONS = 40
+
+# Methods that run in a phase, as (module, class, method, phase)
+PHASED = (
+    ("Controllers.game_engine", "GameEngine", "newGame", BOARD_GENERATION),
+    ("Models.board_model", "BoardModel", "setup", BOARD_GENERATION),
+    ("Models.array_board_model", "ArrayBoardModel", "setup", BOARD_GENERATION),
+    ("Models.bit_board_model", "BitBoardModel", "setup", BOARD_GENERATION),
+    ("Models.endless_board_model", "EndlessBoardModel", "setup", BOARD_GENERATION),
+    ("Views.board_view", "BoardView", "generateUI", UI_CONSTRUCTION),
+    ("Views.board_view", "BoardView", "resetUI", UI_CONSTRUCTION),
+    ("Views.canvas_board_view", "CanvasBoardView", "generateUI", UI_CONSTRUCTION),
+    ("Views.canvas_board_view", "CanvasBoardView", "resetUI", UI_CONSTRUCTION),
+    ("Views.text_board_view", "TextBoardView", "resetUI", UI_CONSTRUCTION),
+    ("Controllers.game_controller", "GameController", "onClick", MOVES),
+    ("Controllers.game_controller", "GameController", "onRightClick", MOVES),
+    ("Controllers.game_engine", "GameEngine", "reveal", MOVES),
+    ("Controllers.game_engine", "GameEngine", "flag", MOVES),
+    ("Controllers.game_engine", "GameEngine", "endGame", MOVES),
+    # The end of a game waits for the player's answer, which is not move handling; its reveal is, through `endGame`
+    ("Controllers.game_controller", "GameController", "gameOver", SESSION),
+)
+
+class PhaseProfiler:
+    """
+    Base of the profilers: tracks the current phase and the wall time spent in each one.
+    """
+    kind = None
+
+    def __init__(self, output_dir):
+        """
+        Starts profiling in the startup phase.
+
+        Postconditions:
+        - The results are written to `output_dir`, which is created if needed, by `stop`, which also runs at exit.
+        - `self.seconds` and `self.entries` hold the wall time and the number of entries of each phase.
+        """
+        self.output_dir = output_dir
+        self.current = STARTUP
+        self.stack = []
+        self.seconds = collections.Counter()
+        self.entries = collections.Counter({STARTUP: 1})
+        self.since = time.perf_counter()
+        self.originals = []
+        self.stopped = False
+        atexit.register(self.stop)
+
+    # Moves the profiler to another phase
+    def _switch(self, phase):
+        now = time.perf_counter()
+        self.seconds[self.current] += now - self.since
+        self.since = now
+        self.current = phase
+
+    # Enters a phase, nested in the current one
+    def enter(self, phase):
+        self.stack.append(self.current)
+        if phase != self.current:
+            self.entries[phase] += 1
+            self._switch(phase)
+
+    # Returns to the phase that was current before the matching `enter`
+    def leave(self):
+        phase = self.stack.pop()
+        if phase != self.current:
+            self._switch(phase)
+
+    # Ends the startup phase and installs the phase boundaries
+    def endStartup(self):
+        """
+        Marks the end of startup.
+
+        Preconditions:
+        - The entry point has finished its imports and parsed its command line.
+
+        Postconditions:
+        - Every method in `PHASED` is wrapped with `wrapMethods` so it runs in its phase.
+        - Everything outside those methods is attributed to the session phase from now on.
+        """
+        self.originals = wrapMethods((module, cls, name, functools.partial(_inPhase, profiler=self, phase=phase))
+                                     for module, cls, name, phase in PHASED)
+        self.entries[SESSION] += 1
+        self._switch(SESSION)
+
+    # Stops profiling and writes the results
+    def stop(self):
+        """
+        Stops profiling.
+
+        Postconditions:
+        - The wrapped methods are restored.
+        - `summary.txt` and the profiler's per-phase files are written to the output directory. Phases never entered have no files.
+        - Calling it again does nothing.
+        """
+        if self.stopped:
+            return
+        self.stopped = True
+        self._switch(self.current)
+        self.finish()
+        restoreMethods(self.originals)
+        atexit.unregister(self.stop)
+
+        os.makedirs(self.output_dir, exist_ok=True)
+        for phase in PHASES:
+            if self.entries[phase]:
+                self.writePhase(phase)
+        with open(os.path.join(self.output_dir, "summary.txt"), "w") as file:
+            file.write(f"profiler: {self.kind}\n")
+            file.write(f"command: {' '.join(sys.argv)}\n")
+            file.write(f"{'phase':<18}{'seconds':>12}{'entries':>10}\n")
+            for phase in PHASES:
+                if self.entries[phase]:
+                    file.write(f"{phase:<18}{self.seconds[phase]:>12.4f}{self.entries[phase]:>10}\n")
+
+    # Stops collecting; implemented by each profiler
+    def finish(self):
+        pass
+
+    # Writes the results of one phase; implemented by each profiler
+    def writePhase(self, phase):
+        pass
+
+class DeterministicProfiler(PhaseProfiler):
+    """
+    Records every call with one `cProfile.Profile` per phase.
+    """
+    kind = DETERMINISTIC
+
+    def __init__(self, output_dir):
+        """
+        Starts a deterministic profile of the startup phase.
+
+        Postconditions:
+        - Each phase gets `<phase>.prof`, loadable with `pstats` or snakeviz, and `<phase>.txt` with the top functions by cumulative time.
+        """
+        self.profiles = {phase: cProfile.Profile() for phase in PHASES}
+        super().__init__(output_dir)
+        self.profiles[STARTUP].enable()
+
+    def _switch(self, phase):
+        self.profiles[self.current].disable()
+        super()._switch(phase)
+        self.profiles[phase].enable()
+
+    def finish(self):
+        self.profiles[self.current].disable()
+
+    def writePhase(self, phase):
+        profile = self.profiles[phase]
+        profile.dump_stats(os.path.join(self.output_dir, f"{phase}.prof"))
+        with open(os.path.join(self.output_dir, f"{phase}.txt"), "w") as file:
+            pstats.Stats(profile, stream=file).sort_stats(pstats.SortKey.CUMULATIVE).print_stats(TOP_FUNCTIONS)
+
+class SamplingProfiler(PhaseProfiler):
+    """
+    Samples the stack of the profiled thread every `SAMPLE_INTERVAL` seconds from a background thread.
+    Its overhead does not grow with the number of calls, so it suits long sessions on large boards.
+    """
+    kind = SAMPLING
+
+    def __init__(self, output_dir, interval=SAMPLE_INTERVAL):
+        """
+        Starts sampling the calling thread.
+
+        Postconditions:
+        - Each phase gets `<phase>.folded`, collapsed stacks for flame graph tools, and `<phase>.txt` with the functions seen most often.
+        """
+        self.interval = interval
+        self.thread_id = threading.get_ident()
+        self.samples = {phase: collections.Counter() for phase in PHASES}
+        self.halted = threading.Event()
+        super().__init__(output_dir)
+        self.thread = threading.Thread(target=self.run, name="sampling-profiler", daemon=True)
+        self.thread.start()
+
+    # Records the stack of the profiled thread at every interval, leaving out the phase wrappers
+    def run(self):
+        frames = sys._current_frames
+        while not self.halted.wait(self.interval):
+            frame = frames().get(self.thread_id)
+            stack = []
+            while frame is not None and len(stack) < MAX_STACK_DEPTH:
+                code = frame.f_code
+                if code.co_filename != __file__:
+                    stack.append((code.co_name, code.co_filename, code.co_firstlineno))
+                frame = frame.f_back
+            if stack:
+                self.samples[self.current][tuple(stack)] += 1
+
+    def finish(self):
+        self.halted.set()
+        self.thread.join()
+
+    def writePhase(self, phase):
+        samples = self.samples[phase]
+        selfCounts = collections.Counter()
+        totalCounts = collections.Counter()
+        with open(os.path.join(self.output_dir, f"{phase}.folded"), "w") as file:
+            for stack, count in samples.most_common():
+                labels = [_frameLabel(frame) for frame in stack]
+                file.write(f"{';'.join(reversed(labels))} {count}\n")
+                selfCounts[labels[0]] += count
+                for label in set(labels):
+                    totalCounts[label] += count
+
+        total = sum(samples.values())
+        with open(os.path.join(self.output_dir, f"{phase}.txt"), "w") as file:
+            file.write(f"{total} samples every {self.interval * 1000:g} ms\n\n")
+            file.write(f"{'self':>8}{'total':>8}  function\n")
+            for label, count in selfCounts.most_common(TOP_FUNCTIONS):
+                file.write(f"{count:>8}{totalCounts[label]:>8}  {label}\n")
+
+# Gets the name of a sampled frame
+def _frameLabel(frame):
+    name, fileName, line = frame
+    return f"{name} ({os.path.basename(fileName)}:{line})"
+
+# Wraps a method so it runs in a phase
+def _inPhase(function, profiler, phase):
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        profiler.enter(phase)
+        try:
+            return function(*args, **kwargs)
+        finally:
+            profiler.leave()
+    return wrapper
+
+# Starts a profiler
+def startProfiling(output_dir, kind=DETERMINISTIC):
+    """
+    Starts profiling the calling thread in the startup phase.
+
+    Preconditions:
+    - `kind` is DETERMINISTIC or SAMPLING.
+
+    Postconditions:
+    - Returns the profiler. The entry point calls its `endStartup` once its imports are done.
+    - The results are written to `output_dir` at exit.
+    """
+    if kind == SAMPLING:
+        return SamplingProfiler(output_dir)
+    return DeterministicProfiler(output_dir)
+
+# Adds the profiling options to an entry point's parser
+def addProfilingArguments(parser):
+    """
+    Adds `--profile DIR` and `--profiler KIND` to an argparse parser.
+
+    Postconditions:
+    - Their defaults come from the `MINESWEEPER_PROFILE` and `MINESWEEPER_PROFILER` environment variables.
+    """
+    parser.add_argument("--profile", metavar="DIR", default=os.environ.get(PROFILE_ENV) or None,
+                        help=f"profile the session by phase and write the results to DIR (or set {PROFILE_ENV})")
+    parser.add_argument("--profiler", choices=[DETERMINISTIC, SAMPLING], default=os.environ.get(PROFILER_ENV) or DETERMINISTIC,
+                        help=f"profiler used with --profile (or set {PROFILER_ENV})")
+
+# Starts a profiler if the command line or environment asks for one
+def startFromCommandLine(argv):
+    """
+    Reads only the profiling options of a command line, ahead of the entry point's own parsing.
+
+    Postconditions:
+    - Returns a started profiler if `--profile` or `MINESWEEPER_PROFILE` is given, otherwise None.
+    - Other arguments are ignored here; the entry point's parser still checks them.
+    """
+    parser = argparse.ArgumentParser(add_help=False)
+    addProfilingArguments(parser)
+    args, _ = parser.parse_known_args(argv)
+    if not args.profile:
+        return None
+    return startProfiling(args.profile, args.profiler)
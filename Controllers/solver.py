@@ -0,0 +1,267 @@
+# Constraint propagation solver that plays the game through a controller or engine
+import random
+
+class Solver:
+    """
+    Deduces safe cells and mines from the revealed numbers and plays them.
+    Only the frontier (revealed numbered cells next to unknown cells) is tracked, so the
+    bookkeeping grows with the frontier rather than with the board.
+    """
+    def __init__(self, board, flag_mines=True, rng=None):
+        """
+        Initializes the Solver.
+
+        Preconditions:
+        - `board` is the BoardModel of the game being played, already set up.
+        - `rng` is None or a `random.Random` used for guesses.
+
+        Postconditions:
+        - Cells already revealed on `board` are observed.
+        - If `flag_mines` is True, deduced mines are flagged on the board as moves.
+        """
+        self.board = board
+        self.flag_mines = flag_mines
+        self.rng = rng if rng is not None else random.Random()
+        self.frontier = set()
+        self.dirty = set()
+        self.mines = set()
+        self.unflagged_mines = []
+        self.safe = set()
+        self.revealed_count = 0
+        self.guess_count = 0
+        self.observe(board.revealedPositions())
+
+    # Updates the frontier after cells changed
+    def observe(self, changed):
+        """
+        Records the cells changed by a move.
+
+        Preconditions:
+        - `changed` is an iterable of (x, y) cells whose state changed since the last call.
+
+        Postconditions:
+        - Newly revealed numbered cells join the frontier.
+        - Frontier cells next to a changed cell are queued for another deduction.
+        """
+        board = self.board
+        for x, y in changed:
+            if not board.isRevealed(x, y):
+                continue
+            self.revealed_count += 1
+            self.safe.discard((x, y))
+            if board.adjacentMines(x, y) > 0 and not board.isMine(x, y):
+                self.frontier.add((x, y))
+                self.dirty.add((x, y))
+            for neighbor in self.board.getNeighbors(x, y):
+                if neighbor in self.frontier:
+                    self.dirty.add(neighbor)
+
+    # Gets the neighbors of a cell that are neither revealed nor known mines
+    def unknownNeighbors(self, x, y):
+        """
+        Gets the undecided neighbors of a cell.
+
+        Postconditions:
+        - Returns a list of neighbor cells that are not revealed and not known mines.
+        """
+        isRevealed = self.board.isRevealed
+        return [(nX, nY) for nX, nY in self.board.getNeighbors(x, y)
+                if not isRevealed(nX, nY) and (nX, nY) not in self.mines]
+
+    # Gets the number of mines around a cell that are not yet known
+    def remainingMines(self, x, y):
+        """
+        Gets how many of a cell's adjacent mines are still undecided.
+
+        Postconditions:
+        - Returns the cell's adjacent mine count minus its known mine neighbors.
+        """
+        known = sum(1 for neighbor in self.board.getNeighbors(x, y) if neighbor in self.mines)
+        return self.board.adjacentMines(x, y) - known
+
+    # Records deduced mines
+    def markMines(self, cells):
+        """
+        Records cells that must be mines.
+
+        Postconditions:
+        - Each cell is in `self.mines` and, if flagging is enabled, queued to be flagged.
+        - Frontier cells around each new mine are queued for another deduction.
+        """
+        for cell in cells:
+            if cell in self.mines:
+                continue
+            self.mines.add(cell)
+            self.safe.discard(cell)
+            if self.flag_mines:
+                self.unflagged_mines.append(cell)
+            for neighbor in self.board.getNeighbors(*cell):
+                if neighbor in self.frontier:
+                    self.dirty.add(neighbor)
+
+    # Applies the single cell rule to every frontier cell that may have changed
+    def deduceSingles(self):
+        """
+        Applies the single cell rule to the queued frontier cells.
+
+        Postconditions:
+        - A cell whose remaining mines is zero makes all of its unknown neighbors safe.
+        - A cell whose remaining mines equals its unknown neighbors makes all of them mines.
+        - Cells with no unknown neighbors leave the frontier.
+        """
+        while self.dirty:
+            x, y = self.dirty.pop()
+            if (x, y) not in self.frontier:
+                continue
+            unknown = self.unknownNeighbors(x, y)
+            if not unknown:
+                self.frontier.discard((x, y))
+                continue
+            remaining = self.remainingMines(x, y)
+            if remaining == 0:
+                self.safe.update(unknown)
+            elif remaining == len(unknown):
+                self.markMines(unknown)
+
+    # Compares pairs of nearby frontier cells
+    def deduceSubsets(self):
+        """
+        Applies the subset rule to pairs of frontier cells.
+
+        Postconditions:
+        - If the unknown neighbors of A are a subset of those of B, the cells only B sees
+          hold exactly remaining(B) - remaining(A) mines; they are marked safe or mines when that is 0 or all of them.
+        - Returns True if anything new was deduced.
+        """
+        constraints = {}
+        for x, y in self.frontier:
+            unknown = self.unknownNeighbors(x, y)
+            if unknown:
+                constraints[(x, y)] = (frozenset(unknown), self.remainingMines(x, y))
+
+        found = False
+        for (x, y), (unknownA, remainingA) in constraints.items():
+            # Only cells within two steps can share unknown neighbors
+            for dirX in range(-2, 3):
+                for dirY in range(-2, 3):
+                    other = constraints.get((x + dirX, y + dirY))
+                    if other is None or (dirX == 0 and dirY == 0):
+                        continue
+                    unknownB, remainingB = other
+                    if not unknownA < unknownB:
+                        continue
+                    extra = unknownB - unknownA
+                    extraMines = remainingB - remainingA
+                    if extraMines == 0 and not extra <= self.safe:
+                        self.safe.update(extra)
+                        found = True
+                    elif extraMines == len(extra) and not extra <= self.mines:
+                        self.markMines(extra)
+                        found = True
+        return found
+
+    # Picks the cell least likely to be a mine when nothing can be deduced
+    def guess(self):
+        """
+        Chooses a cell to reveal when no safe cell is known.
+
+        Postconditions:
+        - Returns the frontier neighbor with the lowest local mine estimate, or a random
+          unknown cell away from the frontier if the board-wide density is lower.
+        - Returns None if there are no unknown cells left.
+        """
+        board = self.board
+        best, bestChance = None, 2.0
+        frontierUnknown = set()
+        for x, y in self.frontier:
+            unknown = [cell for cell in self.unknownNeighbors(x, y) if not board.isFlagged(*cell)]
+            if not unknown:
+                continue
+            frontierUnknown.update(unknown)
+            chance = self.remainingMines(x, y) / len(unknown)
+            if chance < bestChance:
+                best, bestChance = self.rng.choice(unknown), chance
+
+        unknownCount = self.board.rows * self.board.cols - self.revealed_count - len(self.mines)
+        otherCount = unknownCount - len(frontierUnknown)
+        if otherCount > 0:
+            density = (self.board.mines - len(self.mines)) / unknownCount
+            if best is None or density < bestChance:
+                # Rejection sampling stays O(1) per try until the board is nearly solved
+                for _ in range(64):
+                    x, y = self.rng.randrange(self.board.rows), self.rng.randrange(self.board.cols)
+                    if not board.isRevealed(x, y) and not board.isFlagged(x, y) and (x, y) not in self.mines and (x, y) not in frontierUnknown:
+                        return (x, y)
+                if best is None:
+                    for x in range(self.board.rows):
+                        for y in range(self.board.cols):
+                            if not board.isRevealed(x, y) and not board.isFlagged(x, y) and (x, y) not in self.mines:
+                                return (x, y)
+        return best
+
+    # Chooses the next move
+    def nextMove(self):
+        """
+        Chooses the next move to play.
+
+        Postconditions:
+        - Returns ("R", x, y) to reveal a cell or ("F", x, y) to toggle a flag.
+        - Safe cells are revealed first, then deduced mines are flagged, and a guess is made only when nothing else is known.
+        - Returns None if no move is possible.
+        """
+        self.deduceSingles()
+        board = self.board
+
+        while True:
+            while self.safe:
+                x, y = self.safe.pop()
+                if board.isRevealed(x, y):
+                    continue
+                if board.isFlagged(x, y):
+                    # A wrong flag blocks the reveal, so it is removed first
+                    self.safe.add((x, y))
+                    return ("F", x, y)
+                return ("R", x, y)
+
+            while self.unflagged_mines:
+                x, y = self.unflagged_mines.pop()
+                if not board.isFlagged(x, y):
+                    return ("F", x, y)
+
+            if not self.deduceSubsets():
+                break
+            self.deduceSingles()
+
+        cell = self.guess()
+        if cell is None:
+            return None
+        self.guess_count += 1
+        return ("R", cell[0], cell[1])
+
+    # Plays moves until the game ends
+    def play(self, game, max_moves=None):
+        """
+        Plays the game through a controller or engine.
+
+        Preconditions:
+        - `game` has `onClick`, `onRightClick` and `game_over`, and its clicks return the set of changed cells,
+          like GameController and GameEngine.
+        - `game` plays on `self.board`.
+
+        Postconditions:
+        - Moves are played until the game is over, no move is possible, or `max_moves` moves were made.
+        - Returns the number of moves played.
+        """
+        moves = 0
+        while not game.game_over and (max_moves is None or moves < max_moves):
+            move = self.nextMove()
+            if move is None:
+                break
+            action, x, y = move
+            if action == "R":
+                changed = game.onClick(x, y)
+            else:
+                changed = game.onRightClick(x, y)
+            self.observe(changed or ())
+            moves += 1
+        return moves
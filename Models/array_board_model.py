@@ -0,0 +1,526 @@
+# Array-backed model for the game board. Stores each cell attribute as a dense NumPy plane.
+import random
+import numpy as np
+from Models.board_model import BoardModel
+
+class CellView:
+    """
+    Cell-compatible proxy for a single position of an ArrayBoardModel.
+    """
+    __slots__ = ("_board", "_x", "_y")
+
+    def __init__(self, board, x, y):
+        """
+        Initializes a CellView bound to the cell at (x, y).
+
+        Preconditions:
+        - `board` is an instance of ArrayBoardModel.
+        - `x` and `y` are valid indices within the board.
+
+        Postconditions:
+        - Attribute reads and writes are forwarded to the board's arrays.
+        """
+        self._board = board
+        self._x = x
+        self._y = y
+
+    @property
+    def is_mine(self):
+        return bool(self._board.is_mine[self._x, self._y])
+
+    @is_mine.setter
+    def is_mine(self, value):
+        self._board.is_mine[self._x, self._y] = value
+
+    @property
+    def is_treasure(self):
+        return bool(self._board.is_treasure[self._x, self._y])
+
+    @is_treasure.setter
+    def is_treasure(self, value):
+        self._board.is_treasure[self._x, self._y] = value
+
+    @property
+    def is_flagged(self):
+        return bool(self._board.is_flagged[self._x, self._y])
+
+    @is_flagged.setter
+    def is_flagged(self, value):
+        self._board.is_flagged[self._x, self._y] = value
+
+    @property
+    def is_revealed(self):
+        return bool(self._board.is_revealed[self._x, self._y])
+
+    @is_revealed.setter
+    def is_revealed(self, value):
+        self._board.is_revealed[self._x, self._y] = value
+
+    @property
+    def is_wrong_flag(self):
+        return bool(self._board.is_wrong_flag[self._x, self._y])
+
+    @is_wrong_flag.setter
+    def is_wrong_flag(self, value):
+        self._board.is_wrong_flag[self._x, self._y] = value
+
+    @property
+    def adjacent_mines(self):
+        return int(self._board.adjacent_mines[self._x, self._y])
+
+    @adjacent_mines.setter
+    def adjacent_mines(self, value):
+        self._board.adjacent_mines[self._x, self._y] = value
+
+    # Mirrors Cell.reveal
+    def reveal(self):
+        """
+        Reveals the cell if it is not flagged.
+
+        Postconditions:
+        - The revealed plane is set at this position if the cell is not flagged.
+        """
+        if not self.is_flagged:
+            self.is_revealed = True
+
+    # Mirrors Cell.toggle_flag
+    def toggle_flag(self):
+        """
+        Toggles the flagged state of the cell.
+
+        Postconditions:
+        - The flagged plane is toggled at this position if the cell is not revealed.
+        """
+        if not self.is_revealed:
+            self.is_flagged = not self.is_flagged
+
+class _RowView:
+    # Row of CellViews so `grid[x][y]` keeps working
+    __slots__ = ("_board", "_x")
+
+    def __init__(self, board, x):
+        self._board = board
+        self._x = x
+
+    def __getitem__(self, y):
+        if y < 0:
+            y += self._board.cols
+        if not 0 <= y < self._board.cols:
+            raise IndexError("grid column index out of range")
+        return CellView(self._board, self._x, y)
+
+    def __len__(self):
+        return self._board.cols
+
+    def __iter__(self):
+        for y in range(self._board.cols):
+            yield CellView(self._board, self._x, y)
+
+class _GridView:
+    # Two level view over the board planes, indexed as `grid[x][y]`
+    __slots__ = ("_board",)
+
+    def __init__(self, board):
+        self._board = board
+
+    def __getitem__(self, x):
+        if x < 0:
+            x += self._board.rows
+        if not 0 <= x < self._board.rows:
+            raise IndexError("grid row index out of range")
+        return _RowView(self._board, x)
+
+    def __len__(self):
+        return self._board.rows
+
+    def __iter__(self):
+        for x in range(self._board.rows):
+            yield _RowView(self._board, x)
+
+class ArrayBoardModel(BoardModel):
+    """
+    BoardModel backend that keeps cell state in dense typed arrays instead of `Cell` objects.
+    """
+    # Sets the initial board parameters
+    def __init__(self, rows=8, cols=8, mines=10, treasures=1, mine_positions=None, treasure_positions=None, is_testing=False, seed=None):
+        """
+        Initializes the ArrayBoardModel with the specified parameters.
+
+        Preconditions:
+        - Same as `BoardModel.__init__`.
+
+        Postconditions:
+        - `self.rows`, `self.cols`, `self.mines`, and `self.treasures` are set.
+        - One boolean array per cell flag and a uint8 array of adjacent mine counts are allocated.
+        - `self.grid[x][y]` returns a `CellView` over those arrays.
+        """
+        self.rows = rows
+        self.cols = cols
+        self.mines = mines
+        self.treasures = treasures
+        self.mine_positions = mine_positions if mine_positions is not None else []
+        self.treasure_positions = treasure_positions if treasure_positions is not None else []
+        self.is_testing = is_testing
+        self.seed = seed
+        self.rng = random.Random(seed)
+        # Neighbors are found with array operations, so no shared neighbor table is kept
+        self.neighbor_table = None
+        self._allocate()
+        self.resetCounters()
+
+    # Allocates zeroed planes for the current dimensions
+    def _allocate(self):
+        """
+        Allocates the cell state arrays.
+
+        Postconditions:
+        - Every plane has shape (`self.rows`, `self.cols`) and is zeroed.
+        """
+        shape = (self.rows, self.cols)
+        self.is_mine = np.zeros(shape, dtype=np.bool_)
+        self.is_treasure = np.zeros(shape, dtype=np.bool_)
+        self.is_flagged = np.zeros(shape, dtype=np.bool_)
+        self.is_revealed = np.zeros(shape, dtype=np.bool_)
+        self.is_wrong_flag = np.zeros(shape, dtype=np.bool_)
+        self.adjacent_mines = np.zeros(shape, dtype=np.uint8)
+
+    @property
+    def grid(self):
+        return _GridView(self)
+
+    @property
+    def mine_positions(self):
+        # Boards loaded from planes list their mines only when something asks for them
+        if self._mine_positions is None:
+            self._mine_positions = self._positionList(self.is_mine)
+        return self._mine_positions
+
+    @mine_positions.setter
+    def mine_positions(self, positions):
+        self._mine_positions = positions
+
+    @property
+    def treasure_positions(self):
+        if self._treasure_positions is None:
+            self._treasure_positions = self._positionList(self.is_treasure)
+        return self._treasure_positions
+
+    @treasure_positions.setter
+    def treasure_positions(self, positions):
+        self._treasure_positions = positions
+
+    # Sets up the initial board state using array operations
+    def setup(self):
+        """
+        Sets up the initial board state with mines, treasures, and adjacent mine counts.
+
+        Preconditions:
+        - `self.rows` and `self.cols` define the board dimensions.
+        - `self.mines` and `self.treasures` are non-negative integers.
+
+        Postconditions:
+        - Mines and treasures are randomly placed unless `is_testing` is True.
+        - `self.adjacent_mines` holds the number of mines around each cell.
+        - Apart from allocating the planes, the cost is proportional to the number of mines and treasures.
+        """
+        if not self.is_testing:
+            # Samples flat indices from a range so no coordinate list is built
+            cells = self.rng.sample(range(self.rows * self.cols), self.mines + self.treasures)
+            self.mine_positions = [divmod(i, self.cols) for i in cells[:self.mines]]
+            self.treasure_positions = [divmod(i, self.cols) for i in cells[self.mines:]]
+
+        # Positions of a loaded board are listed from its planes before they are cleared
+        mineX, mineY = self._positionArrays(self.mine_positions)
+        treasureX, treasureY = self._positionArrays(self.treasure_positions)
+        self._allocate()
+        self.resetCounters()
+
+        self.is_mine[mineX, mineY] = True
+        self.is_treasure[treasureX, treasureY] = True
+
+        # Increments the eight neighbors of each mine in a padded plane so edges need no bounds checks
+        padded = np.zeros((self.rows + 2, self.cols + 2), dtype=np.uint8)
+        for dirX in (0, 1, 2):
+            for dirY in (0, 1, 2):
+                if dirX == 1 and dirY == 1:
+                    continue
+                np.add.at(padded, (mineX + dirX, mineY + dirY), 1)
+        self.adjacent_mines = padded[1:-1, 1:-1].copy()
+
+        self.labelZeroRegions()
+
+    # Loads saved planes with array operations
+    def loadPlanes(self, mine_plane, treasure_plane, counts=None):
+        """
+        Sets up the board from packed mine and treasure planes instead of positions.
+
+        Preconditions:
+        - Same as `BoardModel.loadPlanes`.
+
+        Postconditions:
+        - Same as `BoardModel.loadPlanes`.
+        - The planes are unpacked and `counts` is copied with single array operations; without `counts`, the mine
+          plane is added up shifted eight ways. The position lists are only built when they are first read.
+        """
+        rows, cols = self.rows, self.cols
+        self._allocate()
+        self.is_mine = self._unpackPlane(mine_plane)
+        self.is_treasure = self._unpackPlane(treasure_plane)
+        self.mines = int(np.count_nonzero(self.is_mine))
+        self.treasures = int(np.count_nonzero(self.is_treasure))
+        self.mine_positions = None
+        self.treasure_positions = None
+        self.resetCounters(rows * cols - self.mines - self.treasures)
+
+        if counts is not None:
+            self.adjacent_mines = np.frombuffer(counts, dtype=np.uint8, count=rows * cols).reshape(rows, cols).copy()
+        else:
+            padded = np.zeros((rows + 2, cols + 2), dtype=np.uint8)
+            for dirX in (0, 1, 2):
+                for dirY in (0, 1, 2):
+                    if dirX == 1 and dirY == 1:
+                        continue
+                    padded[dirX:dirX + rows, dirY:dirY + cols] += self.is_mine
+            self.adjacent_mines = padded[1:-1, 1:-1].copy()
+
+        self.region_labels = None
+
+    # Unpacks saved flag planes with array operations
+    def restoreFlags(self, flagged_plane, wrong_flag_plane):
+        """
+        Flags every cell set in a bit plane and marks the wrong flags of another.
+
+        Preconditions:
+        - Same as `BoardModel.restoreFlags`.
+
+        Postconditions:
+        - Same as `BoardModel.restoreFlags`.
+        """
+        self.is_flagged = self._unpackPlane(flagged_plane)
+        self.is_wrong_flag = self._unpackPlane(wrong_flag_plane)
+        self.flagged_positions = set(self._positionList(self.is_flagged))
+
+    # Precomputes the cells revealed by clicking on each region of zero cells
+    def labelZeroRegions(self):
+        """
+        Labels the connected regions of zero cells and their numbered border.
+
+        Preconditions:
+        - Mines, treasures and adjacent mine counts have been set.
+
+        Postconditions:
+        - `self.region_labels[x, y]` is the region label of each safe zero cell, or -1.
+        - The flat indices of the cells in region `label` are
+          `self.region_cells[self.region_offsets[label]:self.region_offsets[label + 1]]`.
+        - Mines and treasures are never part of a region.
+        """
+        rows, cols = self.rows, self.cols
+        safe = ~(self.is_mine | self.is_treasure)
+        zero = safe & (self.adjacent_mines == 0)
+
+        # Finds horizontal runs of zero cells; row-major order keeps starts and ends aligned
+        edges = np.diff(np.pad(zero, ((0, 0), (1, 1))).astype(np.int8), axis=1)
+        runRows, runStarts = np.nonzero(edges == 1)
+        runEnds = np.nonzero(edges == -1)[1]
+
+        # Joins runs in neighboring rows that touch, including diagonally
+        parents = list(range(len(runRows)))
+
+        def find(run):
+            while parents[run] != run:
+                parents[run] = parents[parents[run]]
+                run = parents[run]
+            return run
+
+        rowStart = np.searchsorted(runRows, np.arange(rows + 1))
+        for row in range(1, rows):
+            above, aboveEnd = rowStart[row - 1], rowStart[row]
+            current, currentEnd = rowStart[row], rowStart[row + 1]
+            while above < aboveEnd and current < currentEnd:
+                if runStarts[above] <= runEnds[current] and runStarts[current] <= runEnds[above]:
+                    rootAbove, rootCurrent = find(above), find(current)
+                    if rootAbove != rootCurrent:
+                        parents[rootCurrent] = rootAbove
+                if runEnds[above] < runEnds[current]:
+                    above += 1
+                else:
+                    current += 1
+
+        roots = np.array([find(run) for run in range(len(parents))], dtype=np.int64)
+        runLabels = np.unique(roots, return_inverse=True)[1].reshape(-1)
+        regionCount = int(runLabels.max()) + 1 if len(runLabels) else 0
+
+        labels = np.full(rows * cols, -1, dtype=np.int64)
+        labels[np.flatnonzero(zero)] = np.repeat(runLabels, runEnds - runStarts)
+        self.region_labels = labels.reshape(rows, cols)
+
+        # Pairs every zero cell and every safe cell touching one with its region label
+        size = rows * cols
+        flat = np.arange(size, dtype=np.int64).reshape(rows, cols)
+        keys = [labels[zero.reshape(-1)] * size + flat[zero]]
+        paddedLabels = np.pad(self.region_labels, 1, constant_values=-1)
+        numbered = safe & ~zero
+        for dirX in (0, 1, 2):
+            for dirY in (0, 1, 2):
+                if dirX == 1 and dirY == 1:
+                    continue
+                neighborLabels = paddedLabels[dirX:dirX + rows, dirY:dirY + cols]
+                touching = numbered & (neighborLabels >= 0)
+                keys.append(neighborLabels[touching] * size + flat[touching])
+
+        keys = np.unique(np.concatenate(keys))
+        self.region_cells = keys % size
+        self.region_offsets = np.searchsorted(keys // size, np.arange(regionCount + 1))
+
+    # Reveals the precomputed region of a zero cell with array operations
+    def clearSurroundingTiles(self, x, y):
+        """
+        Clears all cells around (x, y) that meet necessary conditions.
+
+        Preconditions:
+        - `x` and `y` are valid indices within the grid.
+
+        Postconditions:
+        - The zero-region index is built first if the board was loaded from planes and has none yet.
+        - If (x, y) is a zero cell, its precomputed region is revealed in one pass.
+        - If a zero cell in that region is flagged, the flag blocks the clear and `floodClear` is used instead.
+        - Flagged cells are never revealed.
+        - `self.revealed_safe_count` grows by the number of cells revealed.
+        - Returns the set of (x, y) tuples that were newly revealed.
+        """
+        if self.region_labels is None:
+            self.labelZeroRegions()
+        label = self.region_labels[x, y]
+        if label < 0:
+            return self.floodClear(x, y)
+
+        cells = self.region_cells[self.region_offsets[label]:self.region_offsets[label + 1]]
+        flagged = self.is_flagged.reshape(-1)[cells]
+        if np.any(flagged & (self.adjacent_mines.reshape(-1)[cells] == 0)):
+            return self.floodClear(x, y)
+
+        revealed = self.is_revealed.reshape(-1)
+        cells = cells[~flagged & ~revealed[cells]]
+        revealed[cells] = True
+        self.revealed_safe_count += len(cells)
+        return self._positionSet(cells)
+
+    # Converts flat indices into a set of (x, y) tuples
+    def _positionSet(self, cells):
+        """
+        Converts an array of flat cell indices into positions.
+
+        Preconditions:
+        - `cells` is an integer array of valid flat indices.
+
+        Postconditions:
+        - Returns a set of (x, y) tuples.
+        """
+        return set(zip((cells // self.cols).tolist(), (cells % self.cols).tolist()))
+
+    # Converts a boolean plane into a list of (x, y) tuples
+    def _positionList(self, plane):
+        """
+        Lists the set cells of a plane.
+
+        Postconditions:
+        - Returns a list of (x, y) tuples in row-major order.
+        """
+        rows, cols = np.nonzero(plane)
+        return list(zip(rows.tolist(), cols.tolist()))
+
+    # Unpacks a bit plane into a boolean plane
+    def _unpackPlane(self, plane):
+        """
+        Converts a packed bit plane into a boolean array.
+
+        Preconditions:
+        - `plane` is a bytes-like plane in the `Models.bit_planes` layout for the board's dimensions.
+
+        Postconditions:
+        - Returns a new array of shape (`self.rows`, `self.cols`); `plane` is not referenced afterwards.
+        """
+        bits = np.unpackbits(np.frombuffer(plane, dtype=np.uint8), count=self.rows * self.cols, bitorder="little")
+        return bits.reshape(self.rows, self.cols).view(np.bool_)
+
+    # Converts a list of (x, y) tuples into index arrays
+    def _positionArrays(self, positions):
+        """
+        Splits a list of positions into row and column index arrays.
+
+        Preconditions:
+        - `positions` is a list of valid (x, y) tuples.
+
+        Postconditions:
+        - Returns a pair of integer arrays usable for fancy indexing.
+        """
+        if not positions:
+            return np.zeros(0, dtype=np.intp), np.zeros(0, dtype=np.intp)
+        coords = np.array(positions, dtype=np.intp)
+        return coords[:, 0], coords[:, 1]
+
+    # Gets the coordinates of every revealed cell
+    def revealedPositions(self):
+        """
+        Gets every revealed cell.
+
+        Postconditions:
+        - Returns a list of (x, y) tuples for each revealed cell in row-major order.
+        """
+        return [(int(x), int(y)) for x, y in np.argwhere(self.is_revealed)]
+
+    # Packs the revealed plane with a single array operation
+    def revealedPlane(self):
+        """
+        Gets the revealed state of every cell as a bit plane.
+
+        Postconditions:
+        - Same as `BoardModel.revealedPlane`.
+        """
+        return np.packbits(self.is_revealed.reshape(-1), bitorder="little").tobytes()
+
+    # Unpacks a revealed plane with a single array operation
+    def restoreRevealed(self, plane):
+        """
+        Reveals every cell set in a bit plane, as saved by `revealedPlane`.
+
+        Preconditions:
+        - Same as `BoardModel.restoreRevealed`.
+
+        Postconditions:
+        - Same as `BoardModel.restoreRevealed`.
+        """
+        self.is_revealed |= self._unpackPlane(plane)
+
+    # Reveals the end state a batch at a time with array operations on the indexed cells
+    def endStateBatches(self, batch_size=None):
+        """
+        Reveals the board at the end of the game in batches.
+
+        Preconditions:
+        - `batch_size` is None or a positive integer.
+
+        Postconditions:
+        - Same as `BoardModel.endStateBatches`, with each batch of up to `batch_size` indexed cells
+          updated by one set of array operations.
+        """
+        positions = self.mine_positions + self.treasure_positions + list(self.flagged_positions)
+        rows, cols = self._positionArrays(positions)
+        cells = np.unique(rows * self.cols + cols)
+        step = batch_size or max(len(cells), 1)
+
+        isMine = self.is_mine.reshape(-1)
+        isTreasure = self.is_treasure.reshape(-1)
+        isFlagged = self.is_flagged.reshape(-1)
+        isRevealed = self.is_revealed.reshape(-1)
+        isWrongFlag = self.is_wrong_flag.reshape(-1)
+        for start in range(0, len(cells), step):
+            part = cells[start:start + step]
+            flagged, revealed = isFlagged[part], isRevealed[part]
+            wrong = flagged & ~isMine[part] & ~isWrongFlag[part] & ~revealed
+            reveal = (isTreasure[part] | isMine[part]) & ~flagged & ~revealed
+            isWrongFlag[part[wrong]] = True
+            isRevealed[part[reveal]] = True
+            changed = part[wrong | reveal]
+            if len(changed):
+                yield self._positionSet(changed)
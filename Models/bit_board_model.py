@@ -0,0 +1,648 @@
+# Bitboard model for the game board. Stores each cell attribute as one arbitrary-precision int.
+import random
+from Models.bit_planes import planeSize
+from Models.board_model import BoardModel
+
+# Bit planes of the adjacent mine counts; four planes hold counts up to 15
+COUNT_PLANES = 4
+
+# The eight bits of every byte value spread over eight bytes, for turning a bitboard into one byte per cell
+SPREAD_BYTES = [bytes(value >> bit & 1 for bit in range(8)) for value in range(256)]
+
+# For each count plane, the ASCII digit of that bit of every byte value, for turning byte per cell counts back into bitboards
+COUNT_DIGITS = [bytes(b"01"[value >> plane & 1] for value in range(256)) for plane in range(COUNT_PLANES)]
+
+# Spreads a bitboard into one byte per bit
+def spreadBits(bits, length):
+    """
+    Converts a bitboard into a byte per bit.
+
+    Preconditions:
+    - `bits` has no bit at or past `length`.
+
+    Postconditions:
+    - Returns an int whose byte i is bit i of `bits`, as 0 or 1, for the first `length` bits rounded up to a multiple of 8.
+    - Runs one table lookup per byte of `bits` rather than per bit.
+    """
+    data = bits.to_bytes((length + 7) // 8, "little")
+    return int.from_bytes(b"".join(map(SPREAD_BYTES.__getitem__, data)), "little")
+
+class BitCellView:
+    """
+    Cell-compatible proxy for a single position of a BitBoardModel.
+    """
+    __slots__ = ("_board", "_index")
+
+    def __init__(self, board, x, y):
+        """
+        Initializes a BitCellView bound to the cell at (x, y).
+
+        Preconditions:
+        - `board` is an instance of BitBoardModel.
+        - `x` and `y` are valid indices within the board.
+
+        Postconditions:
+        - Attribute reads and writes are forwarded to the board's bitboards.
+        - Only the bit index is stored; a mask would be an int as long as the board.
+        """
+        self._board = board
+        self._index = x * board.stride + y
+
+    @property
+    def is_mine(self):
+        return bool(self._board.mine_bits >> self._index & 1)
+
+    @is_mine.setter
+    def is_mine(self, value):
+        self._board.setBit("mine_bits", 1 << self._index, value)
+
+    @property
+    def is_treasure(self):
+        return bool(self._board.treasure_bits >> self._index & 1)
+
+    @is_treasure.setter
+    def is_treasure(self, value):
+        self._board.setBit("treasure_bits", 1 << self._index, value)
+
+    @property
+    def is_flagged(self):
+        return bool(self._board.flagged_bits >> self._index & 1)
+
+    @is_flagged.setter
+    def is_flagged(self, value):
+        self._board.setBit("flagged_bits", 1 << self._index, value)
+
+    @property
+    def is_revealed(self):
+        return bool(self._board.revealed_cells[self._index])
+
+    @is_revealed.setter
+    def is_revealed(self, value):
+        self._board.setBit("revealed_bits", 1 << self._index, value)
+        self._board.revealed_cells[self._index] = 1 if value else 0
+
+    @property
+    def is_wrong_flag(self):
+        return bool(self._board.wrong_flag_bits >> self._index & 1)
+
+    @is_wrong_flag.setter
+    def is_wrong_flag(self, value):
+        self._board.setBit("wrong_flag_bits", 1 << self._index, value)
+
+    @property
+    def adjacent_mines(self):
+        return self._board.counts[self._index]
+
+    @adjacent_mines.setter
+    def adjacent_mines(self, value):
+        bit = 1 << self._index
+        for plane in range(COUNT_PLANES):
+            self._board.count_bits[plane] = (self._board.count_bits[plane] & ~bit) | (bit if value >> plane & 1 else 0)
+        self._board.counts[self._index] = value
+
+    # Mirrors Cell.reveal
+    def reveal(self):
+        """
+        Reveals the cell if it is not flagged.
+
+        Postconditions:
+        - The revealed bit is set at this position if the cell is not flagged.
+        """
+        if not self.is_flagged:
+            self.is_revealed = True
+
+    # Mirrors Cell.toggle_flag
+    def toggle_flag(self):
+        """
+        Toggles the flagged state of the cell.
+
+        Postconditions:
+        - The flagged bit is toggled at this position if the cell is not revealed.
+        """
+        if not self.is_revealed:
+            self._board.flagged_bits ^= 1 << self._index
+
+class _RowView:
+    # Row of BitCellViews so `grid[x][y]` keeps working
+    __slots__ = ("_board", "_x")
+
+    def __init__(self, board, x):
+        self._board = board
+        self._x = x
+
+    def __getitem__(self, y):
+        if y < 0:
+            y += self._board.cols
+        if not 0 <= y < self._board.cols:
+            raise IndexError("grid column index out of range")
+        return BitCellView(self._board, self._x, y)
+
+    def __len__(self):
+        return self._board.cols
+
+    def __iter__(self):
+        for y in range(self._board.cols):
+            yield BitCellView(self._board, self._x, y)
+
+class _GridView:
+    # Two level view over the bitboards, indexed as `grid[x][y]`; views are made on access, never stored
+    __slots__ = ("_board",)
+
+    def __init__(self, board):
+        self._board = board
+
+    def __getitem__(self, x):
+        if x < 0:
+            x += self._board.rows
+        if not 0 <= x < self._board.rows:
+            raise IndexError("grid row index out of range")
+        return _RowView(self._board, x)
+
+    def __len__(self):
+        return self._board.rows
+
+    def __iter__(self):
+        for x in range(self._board.rows):
+            yield _RowView(self._board, x)
+
+class BitBoardModel(BoardModel):
+    """
+    BoardModel backend that keeps each cell attribute in one int, with bit `x * (cols + 1) + y` for cell (x, y).
+    The extra column in every row is always clear, so shifting a row sideways never wraps into the next one.
+    Setup and the end state are a few big-int operations, several times faster than `BoardModel.setup`. A flood clear
+    dilates the whole board once per step of its radius, so moves cost about as much as on `BoardModel` on small and
+    medium boards and more on large ones. The engine and solver read single cells through `isRevealed`, `isFlagged` and
+    `adjacentMines`, which use byte per cell copies instead of shifting a board-sized int. `self.grid` is only for views.
+    """
+    # Sets the initial board parameters
+    def __init__(self, rows=8, cols=8, mines=10, treasures=1, mine_positions=None, treasure_positions=None, is_testing=False, seed=None):
+        """
+        Initializes the BitBoardModel with the specified parameters.
+
+        Preconditions:
+        - Same as `BoardModel.__init__`.
+
+        Postconditions:
+        - `self.rows`, `self.cols`, `self.mines`, and `self.treasures` are set.
+        - Every bitboard is zero and `self.grid[x][y]` is a `BitCellView` over them, made when it is accessed.
+        """
+        self.rows = rows
+        self.cols = cols
+        self.mines = mines
+        self.treasures = treasures
+        self.mine_positions = mine_positions if mine_positions is not None else []
+        self.treasure_positions = treasure_positions if treasure_positions is not None else []
+        self.is_testing = is_testing
+        self.seed = seed
+        self.rng = random.Random(seed)
+        # Neighbors are found with bitwise operations, so no shared neighbor table is kept
+        self.neighbor_table = None
+        self._allocate()
+        self.resetCounters()
+
+    # Clears every bitboard for the current dimensions
+    def _allocate(self):
+        """
+        Resets the bitboards.
+
+        Postconditions:
+        - `self.stride` is the number of bits per row, including the padding column.
+        - `self.full_bits` has a bit set for every cell and none for the padding column.
+        - Every other bitboard is zero, as are `self.revealed_cells` and `self.counts`, one byte per bit position.
+        - No object is created per cell.
+        """
+        self.stride = self.cols + 1
+        # One set bit at the start of every row, times a full row, without a loop of board-sized ORs
+        rowStarts = ((1 << (self.rows * self.stride)) - 1) // ((1 << self.stride) - 1)
+        self.full_bits = rowStarts * ((1 << self.cols) - 1)
+        self.mine_bits = 0
+        self.treasure_bits = 0
+        self.flagged_bits = 0
+        self.revealed_bits = 0
+        self.revealed_cells = bytearray(self.rows * self.stride)
+        self.wrong_flag_bits = 0
+        self.count_bits = [0] * COUNT_PLANES
+        self.counts = bytearray(self.rows * self.stride)
+        self.zero_bits = 0
+
+    @property
+    def grid(self):
+        return _GridView(self)
+
+    @property
+    def mine_positions(self):
+        # Boards loaded from planes list their mines only when something asks for them
+        if self._mine_positions is None:
+            self._mine_positions = sorted(self.positionSet(self.mine_bits))
+        return self._mine_positions
+
+    @mine_positions.setter
+    def mine_positions(self, positions):
+        self._mine_positions = positions
+
+    @property
+    def treasure_positions(self):
+        if self._treasure_positions is None:
+            self._treasure_positions = sorted(self.positionSet(self.treasure_bits))
+        return self._treasure_positions
+
+    @treasure_positions.setter
+    def treasure_positions(self, positions):
+        self._treasure_positions = positions
+
+    # Checks whether a cell is a mine
+    def isMine(self, x, y):
+        return bool(self.mine_bits >> (x * self.stride + y) & 1)
+
+    # Checks whether a cell is revealed from the byte per cell copy of the revealed bitboard
+    def isRevealed(self, x, y):
+        return bool(self.revealed_cells[x * self.stride + y])
+
+    # Checks whether a cell is flagged from the index of flagged cells
+    def isFlagged(self, x, y):
+        return (x, y) in self.flagged_positions
+
+    # Checks whether a cell is a safe cell with no adjacent mines
+    def isZeroCell(self, x, y):
+        return bool(self.zero_bits >> (x * self.stride + y) & 1)
+
+    # Gets the number of mines around a cell from the byte per cell counts
+    def adjacentMines(self, x, y):
+        return self.counts[x * self.stride + y]
+
+    # Reveals a single cell with bit operations
+    def revealCell(self, x, y):
+        """
+        Reveals the cell at (x, y).
+
+        Preconditions:
+        - Same as `BoardModel.revealCell`.
+
+        Postconditions:
+        - Same as `BoardModel.revealCell`.
+        """
+        index = x * self.stride + y
+        if self.revealed_cells[index] or (x, y) in self.flagged_positions:
+            return set()
+        self.revealed_bits |= 1 << index
+        self.revealed_cells[index] = 1
+        if self.mine_bits >> index & 1:
+            self.mine_revealed = True
+        elif self.treasure_bits >> index & 1:
+            self.treasure_found = True
+        else:
+            self.revealed_safe_count += 1
+        return {(x, y)}
+
+    # Toggles the flag on a single cell with bit operations
+    def toggleFlag(self, x, y):
+        """
+        Toggles the flagged state of the cell at (x, y).
+
+        Preconditions:
+        - Same as `BoardModel.toggleFlag`.
+
+        Postconditions:
+        - Same as `BoardModel.toggleFlag`.
+        """
+        index = x * self.stride + y
+        if self.revealed_cells[index]:
+            return set()
+        self.flagged_bits ^= 1 << index
+        if self.flagged_bits >> index & 1:
+            step = 1
+            self.flagged_positions.add((x, y))
+        else:
+            step = -1
+            self.flagged_positions.discard((x, y))
+        self.flag_count += step
+        if self.mine_bits >> index & 1:
+            self.correct_flag_count += step
+        return {(x, y)}
+
+    # Sets or clears one bit of a bitboard
+    def setBit(self, name, bit, value):
+        """
+        Sets or clears a single bit.
+
+        Preconditions:
+        - `name` is the attribute name of a bitboard and `bit` is a power of two.
+
+        Postconditions:
+        - The bit is set if `value` is true, otherwise cleared.
+        """
+        bits = getattr(self, name)
+        setattr(self, name, bits | bit if value else bits & ~bit)
+
+    # Moves every bit one cell in a direction
+    def shift(self, bits, dirX, dirY):
+        """
+        Shifts a bitboard by (dirX, dirY) cells.
+
+        Postconditions:
+        - Returns a bitboard with bit (x + dirX, y + dirY) set for every bit (x, y) of `bits`.
+        - Bits shifted off the board, including across a row's edge, are dropped.
+        """
+        offset = dirX * self.stride + dirY
+        shifted = bits << offset if offset >= 0 else bits >> -offset
+        return shifted & self.full_bits
+
+    # Grows a bitboard by one cell in all eight directions
+    def dilate(self, bits):
+        """
+        Adds the eight neighbors of every set cell.
+
+        Postconditions:
+        - Returns `bits` together with every cell adjacent to one of its cells.
+        """
+        row = bits | (bits << 1) | (bits >> 1)
+        return (row | (row << self.stride) | (row >> self.stride)) & self.full_bits
+
+    # Sets up the initial board state using bitwise operations
+    def setup(self):
+        """
+        Sets up the initial board state with mines, treasures, and adjacent mine counts.
+
+        Preconditions:
+        - `self.rows` and `self.cols` define the board dimensions.
+        - `self.mines` and `self.treasures` are non-negative integers.
+
+        Postconditions:
+        - Mines and treasures are randomly placed unless `is_testing` is True.
+        - `self.count_bits` holds the adjacent mine counts, one bit of the count per plane.
+        - `self.counts[x * self.stride + y]` is the same count as a byte, so a single cell is read without a shift.
+        - `self.zero_bits` has every safe cell with no adjacent mines.
+        """
+        if not self.is_testing:
+            # Samples flat indices from a range so no coordinate list is built
+            cells = self.rng.sample(range(self.rows * self.cols), self.mines + self.treasures)
+            self.mine_positions = [divmod(i, self.cols) for i in cells[:self.mines]]
+            self.treasure_positions = [divmod(i, self.cols) for i in cells[self.mines:]]
+
+        # Positions of a loaded board are listed from its bitboards before they are cleared
+        minePositions, treasurePositions = self.mine_positions, self.treasure_positions
+        self._allocate()
+        self.resetCounters()
+
+        self.mine_bits = self.positionBits(minePositions)
+        self.treasure_bits = self.positionBits(treasurePositions)
+        self.countAdjacentMines()
+
+    # Loads saved planes with a few big-int operations
+    def loadPlanes(self, mine_plane, treasure_plane, counts=None):
+        """
+        Sets up the board from packed mine and treasure planes instead of positions.
+
+        Preconditions:
+        - Same as `BoardModel.loadPlanes`.
+
+        Postconditions:
+        - Same as `BoardModel.loadPlanes`.
+        - The planes are converted into bitboards with string operations, never per cell, and `counts` is used as the
+          byte per cell counts. The position lists are only built when they are first read.
+        """
+        self._allocate()
+        self.mine_bits = self.planeBits(mine_plane)
+        self.treasure_bits = self.planeBits(treasure_plane)
+        self.mines = self.mine_bits.bit_count()
+        self.treasures = self.treasure_bits.bit_count()
+        self.mine_positions = None
+        self.treasure_positions = None
+        self.resetCounters(self.rows * self.cols - self.mines - self.treasures)
+        self.countAdjacentMines(counts)
+
+    # Fills in the adjacent mine counts and the zero cells
+    def countAdjacentMines(self, counts=None):
+        """
+        Computes the adjacent mine counts from the mine bitboard, or takes them from saved counts.
+
+        Preconditions:
+        - `self.mine_bits` and `self.treasure_bits` are set and the count planes are zero.
+        - `counts` is None or a bytes-like object with the count of every cell in row-major order.
+
+        Postconditions:
+        - `self.count_bits`, `self.counts` and `self.zero_bits` are set as `setup` describes.
+        """
+        size = self.rows * self.stride
+        if counts is None:
+            # Adds the eight shifted mine boards with a bit-sliced ripple carry adder
+            countBits = self.count_bits
+            for dirX in (-1, 0, 1):
+                for dirY in (-1, 0, 1):
+                    if dirX == 0 and dirY == 0:
+                        continue
+                    carry = self.shift(self.mine_bits, dirX, dirY)
+                    for plane in range(COUNT_PLANES):
+                        if not carry:
+                            break
+                        countBits[plane], carry = countBits[plane] ^ carry, countBits[plane] & carry
+
+            # Each byte holds one count, so adding the shifted planes never carries into the next cell
+            total = 0
+            for plane, bits in enumerate(countBits):
+                if bits:
+                    total += spreadBits(bits, size) << plane
+            self.counts = bytearray(total.to_bytes((size + 7) // 8 * 8, "little")[:size])
+        else:
+            # Adds a zero count for the padding column of every row, then reads each bit of the counts as binary digits
+            cols = self.cols
+            counts = bytes(counts)
+            self.counts = bytearray(b"".join(counts[x * cols:(x + 1) * cols] + b"\0" for x in range(self.rows)))
+            self.count_bits = [int(self.counts.translate(digits)[::-1], 2) for digits in COUNT_DIGITS]
+
+        nonzero = 0
+        for bits in self.count_bits:
+            nonzero |= bits
+        self.zero_bits = self.full_bits & ~nonzero & ~self.mine_bits & ~self.treasure_bits
+
+    # Unpacks saved flag planes into the bitboards
+    def restoreFlags(self, flagged_plane, wrong_flag_plane):
+        """
+        Flags every cell set in a bit plane and marks the wrong flags of another.
+
+        Preconditions:
+        - Same as `BoardModel.restoreFlags`.
+
+        Postconditions:
+        - Same as `BoardModel.restoreFlags`.
+        """
+        self.flagged_bits = self.planeBits(flagged_plane)
+        self.wrong_flag_bits = self.planeBits(wrong_flag_plane)
+        self.flagged_positions = self.positionSet(self.flagged_bits)
+
+    # Converts a bitboard into one byte per bit position
+    def spreadCells(self, bits):
+        """
+        Spreads a bitboard over a byte per cell.
+
+        Postconditions:
+        - Returns a bytearray of `self.rows * self.stride` bytes whose byte i is bit i of `bits`.
+        """
+        size = self.rows * self.stride
+        return bytearray(spreadBits(bits, size).to_bytes((size + 7) // 8 * 8, "little")[:size])
+
+    # Reveals every cell of a bitboard
+    def revealBits(self, bits):
+        """
+        Marks the cells of a bitboard revealed.
+
+        Postconditions:
+        - `self.revealed_bits` and `self.revealed_cells` include every cell of `bits`; no game rule runs.
+        - Returns the set of (x, y) tuples of `bits`. The cost is proportional to the number of cells in `bits`.
+        """
+        self.revealed_bits |= bits
+        changed = self.positionSet(bits)
+        cells = self.revealed_cells
+        stride = self.stride
+        for x, y in changed:
+            cells[x * stride + y] = 1
+        return changed
+
+    # Converts positions into a bitboard
+    def positionBits(self, positions):
+        """
+        Builds a bitboard from positions.
+
+        Postconditions:
+        - Returns a bitboard with the bit of every (x, y) in `positions` set.
+        - The bits are set in a bytearray and converted once, so the cost is linear rather than one board-sized OR per position.
+        """
+        stride = self.stride
+        plane = bytearray((self.rows * stride + 7) // 8)
+        for x, y in positions:
+            index = x * stride + y
+            plane[index >> 3] |= 1 << (index & 7)
+        return int.from_bytes(plane, "little")
+
+    # Gets the bitboard of cells that are neither mines nor treasures
+    def safeBits(self):
+        return self.full_bits & ~self.mine_bits & ~self.treasure_bits
+
+    # Converts a bitboard into a set of positions
+    def positionSet(self, bits):
+        """
+        Converts a bitboard into positions.
+
+        Postconditions:
+        - Returns a set with the (x, y) tuple of every set bit.
+        """
+        positions = set()
+        text = format(bits, "b")[::-1]
+        index = text.find("1")
+        while index >= 0:
+            positions.add(divmod(index, self.stride))
+            index = text.find("1", index + 1)
+        return positions
+
+    # Clears the region around a zero cell by repeated dilation
+    def clearSurroundingTiles(self, x, y):
+        """
+        Clears all cells around (x, y) that meet necessary conditions.
+
+        Preconditions:
+        - `x` and `y` are valid indices within the grid.
+
+        Postconditions:
+        - Reveals (x, y) unless it is flagged, with `revealCell` if it is not a zero cell.
+        - If it is a zero cell, the connected unflagged zero cells around it are found by dilating and
+          masking until nothing changes, and they and their unflagged safe neighbors are revealed.
+        - `self.revealed_safe_count` grows by the number of cells revealed.
+        - Returns the set of (x, y) tuples that were newly revealed.
+        """
+        bit = 1 << (x * self.stride + y)
+        if not self.zero_bits & bit:
+            return self.revealCell(x, y)
+        if self.flagged_bits & bit:
+            return set()
+
+        region = bit
+        passable = self.zero_bits & ~self.flagged_bits
+        while True:
+            grown = self.dilate(region) & passable
+            if grown == region:
+                break
+            region = grown
+        region = self.dilate(region) & self.safeBits()
+
+        newly = region & ~self.flagged_bits & ~self.revealed_bits
+        changed = self.revealBits(newly)
+        self.revealed_safe_count += len(changed)
+        return changed
+
+    # The dilation based clear already walks outward from the clicked cell
+    def floodClear(self, x, y):
+        return self.clearSurroundingTiles(x, y)
+
+    # Gets the coordinates of every revealed cell
+    def revealedPositions(self):
+        """
+        Gets every revealed cell.
+
+        Postconditions:
+        - Returns a list of (x, y) tuples for each revealed cell in row-major order.
+        """
+        return sorted(self.positionSet(self.revealed_bits))
+
+    # Packs the revealed bitboard without its padding column
+    def revealedPlane(self):
+        """
+        Gets the revealed state of every cell as a bit plane.
+
+        Postconditions:
+        - Same as `BoardModel.revealedPlane`. The padding column is dropped with string slicing rather than per cell.
+        """
+        text = format(self.revealed_bits, "b").zfill(self.rows * self.stride)[::-1]
+        flat = "".join(text[x * self.stride:x * self.stride + self.cols] for x in range(self.rows))
+        return int(flat[::-1] or "0", 2).to_bytes(planeSize(self.rows, self.cols), "little")
+
+    # Unpacks a revealed plane into the bitboard, adding the padding column back
+    def restoreRevealed(self, plane):
+        """
+        Reveals every cell set in a bit plane, as saved by `revealedPlane`.
+
+        Preconditions:
+        - Same as `BoardModel.restoreRevealed`.
+
+        Postconditions:
+        - Same as `BoardModel.restoreRevealed`.
+        """
+        self.revealed_bits |= self.planeBits(plane)
+        self.revealed_cells = self.spreadCells(self.revealed_bits)
+
+    # Converts a bit plane into a bitboard, adding the padding column back
+    def planeBits(self, plane):
+        """
+        Converts a packed bit plane into a bitboard.
+
+        Preconditions:
+        - `plane` is a bytes-like plane in the `Models.bit_planes` layout for the board's dimensions.
+
+        Postconditions:
+        - Returns a bitboard with the bit of every cell set in `plane`. The padding column is inserted with string
+          slicing rather than per cell, and `plane` is not referenced afterwards.
+        """
+        cols = self.cols
+        text = format(int.from_bytes(plane, "little"), "b").zfill(self.rows * cols)[::-1]
+        padded = "".join(text[x * cols:(x + 1) * cols] + "0" for x in range(self.rows))
+        return int(padded[::-1], 2) & self.full_bits
+
+    # Reveals mines, treasures and wrong flags when the game ends
+    def endStateBatches(self, batch_size=None):
+        """
+        Reveals the board at the end of the game in batches.
+
+        Preconditions:
+        - `batch_size` is None or a positive integer.
+
+        Postconditions:
+        - Same as `BoardModel.endStateBatches`, except that the whole end state is applied with a few
+          bitwise operations before the first batch is yielded; only the reported positions are batched.
+        """
+        wrong = self.flagged_bits & ~self.mine_bits & ~self.wrong_flag_bits
+        revealed = (self.treasure_bits | self.mine_bits) & ~self.flagged_bits & ~self.revealed_bits
+        self.wrong_flag_bits |= wrong
+        self.revealBits(revealed)
+        changed = sorted(self.positionSet(wrong | revealed))
+        step = batch_size or max(len(changed), 1)
+        for start in range(0, len(changed), step):
+            yield set(changed[start:start + step])
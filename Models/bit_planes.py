@@ -0,0 +1,54 @@
+# Packed bit planes shared by the board and snapshot file formats. Bit `i % 8` of byte `i // 8` is set for flat cell index `i = x * cols + y`.
+
+# Gets the number of bytes in a bit plane
+def planeSize(rows, cols):
+    return (rows * cols + 7) // 8
+
+# Packs positions into a bit plane
+def packPositions(rows, cols, positions):
+    """
+    Builds a bit plane from positions.
+
+    Preconditions:
+    - `positions` is an iterable of valid (x, y) tuples.
+
+    Postconditions:
+    - Returns a bytearray of `planeSize(rows, cols)` bytes with the bit of every position set.
+    - Apart from allocating the plane, the cost is proportional to the number of positions.
+    """
+    plane = bytearray(planeSize(rows, cols))
+    for x, y in positions:
+        index = x * cols + y
+        plane[index >> 3] |= 1 << (index & 7)
+    return plane
+
+# Finds the set bits of a bit plane
+def planePositions(plane, cols):
+    """
+    Converts a bit plane into positions.
+
+    Preconditions:
+    - `plane` is a bytes-like bit plane of a board with `cols` columns.
+
+    Postconditions:
+    - Returns a list of (x, y) tuples in row-major order. Only set bits are visited in Python.
+    """
+    text = format(int.from_bytes(plane, "little"), "b")[::-1]
+    positions = []
+    index = text.find("1")
+    while index >= 0:
+        positions.append(divmod(index, cols))
+        index = text.find("1", index + 1)
+    return positions
+
+# Counts the set bits of a bit plane
+def planeCount(plane):
+    return int.from_bytes(plane, "little").bit_count()
+
+# Checks that no bit past the last cell of a bit plane is set
+def planePaddingClear(plane, rows, cols):
+    return int.from_bytes(plane, "little") >> (rows * cols) == 0
+
+# Checks whether two bit planes of the same board share a set bit
+def planesOverlap(first, second):
+    return int.from_bytes(first, "little") & int.from_bytes(second, "little") != 0
@@ -0,0 +1,308 @@
+# Packed binary board files: a fixed header followed by one bit per cell for mines and for treasures,
+# and optionally one byte per cell of adjacent mine counts. Files are memory mapped, so opening one reads nothing but the header.
+import mmap
+import struct
+from Models.board_loader import ANY_SIZE_RULES, BoardLoadError, LoadedBoard, mineRuleViolation, readBoard
+from Models.bit_planes import packPositions, planeCount, planePaddingClear, planePositions, planeSize, planesOverlap
+from Models.board_model import BoardModel
+from Models.neighbor_table import computeNeighbors
+
+# File name extension of packed board files
+BOARD_FILE_EXTENSION = ".msb"
+
+# First bytes of every packed board file
+MAGIC = b"MSWB"
+
+# Format version written by this module
+VERSION = 1
+
+# Header layout: magic, version, flags, rows, cols, seed, mine count, treasure count
+HEADER = struct.Struct("<4sHHIIQQQ")
+
+# Header flags
+FLAG_SEED = 1
+FLAG_COUNTS = 2
+
+class BoardFile:
+    """
+    Read-only view of a packed board file. The planes are memoryviews over the mapped file, so nothing is copied until it is used.
+    """
+    def __init__(self, file_path):
+        """
+        Opens and maps a packed board file.
+
+        Preconditions:
+        - `file_path` is the path of a file written by `writeBoardFile`.
+
+        Postconditions:
+        - `self.rows`, `self.cols`, `self.seed`, `self.mines` and `self.treasures` are read from the header; `self.seed` is None if none was saved.
+        - `self.mine_plane` and `self.treasure_plane` are memoryviews of the bit planes.
+        - `self.count_plane` is a memoryview with one adjacent mine count per cell in row-major order, or None if the file has no counts.
+        - Raises BoardLoadError if the file is not a packed board file or is shorter than its header says.
+        """
+        self.file_path = file_path
+        self._file = open(file_path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise BoardLoadError("Invalid board file", "format")
+        self._view = memoryview(self._map)
+
+        try:
+            if len(self._view) < HEADER.size:
+                raise BoardLoadError("Invalid board file", "format")
+            magic, version, flags, rows, cols, seed, mines, treasures = HEADER.unpack_from(self._view)
+            if magic != MAGIC or version != VERSION:
+                raise BoardLoadError("Invalid board file", "format")
+
+            size = planeSize(rows, cols)
+            countsEnd = HEADER.size + 2 * size + (rows * cols if flags & FLAG_COUNTS else 0)
+            if len(self._view) < countsEnd:
+                raise BoardLoadError("Invalid board file", "format")
+        except BoardLoadError:
+            self.close()
+            raise
+
+        self.rows = rows
+        self.cols = cols
+        self.seed = seed if flags & FLAG_SEED else None
+        self.mines = mines
+        self.treasures = treasures
+        self.mine_plane = self._view[HEADER.size:HEADER.size + size]
+        self.treasure_plane = self._view[HEADER.size + size:HEADER.size + 2 * size]
+        self.count_plane = self._view[HEADER.size + 2 * size:countsEnd] if flags & FLAG_COUNTS else None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    # Releases the views and the mapping
+    def close(self):
+        """
+        Closes the file.
+
+        Postconditions:
+        - The planes are released and must not be used afterwards.
+        """
+        for name in ("mine_plane", "treasure_plane", "count_plane", "_view"):
+            view = getattr(self, name, None)
+            if view is not None:
+                view.release()
+                setattr(self, name, None)
+        if getattr(self, "_map", None) is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    # Tests one bit of a plane
+    def _bitAt(self, plane, x, y):
+        index = x * self.cols + y
+        return bool(plane[index >> 3] >> (index & 7) & 1)
+
+    # Checks whether a cell is a mine
+    def isMine(self, x, y):
+        return self._bitAt(self.mine_plane, x, y)
+
+    # Checks whether a cell is a treasure
+    def isTreasure(self, x, y):
+        return self._bitAt(self.treasure_plane, x, y)
+
+    # Gets the saved adjacent mine count of a cell
+    def countAt(self, x, y):
+        """
+        Gets the number of mines around (x, y).
+
+        Preconditions:
+        - `x` and `y` are valid indices within the board.
+
+        Postconditions:
+        - Returns the saved count, or computes it from the mine plane if the file has no counts.
+        """
+        if self.count_plane is not None:
+            return self.count_plane[x * self.cols + y]
+        return sum(self.isMine(nX, nY) for nX, nY in computeNeighbors(self.rows, self.cols, x, y))
+
+    # Gets the positions of every mine
+    def minePositions(self):
+        return planePositions(self.mine_plane, self.cols)
+
+    # Gets the positions of every treasure
+    def treasurePositions(self):
+        return planePositions(self.treasure_plane, self.cols)
+
+    # Converts the file into the result of a CSV read
+    def loaded(self):
+        """
+        Reads the positions of the file.
+
+        Postconditions:
+        - Returns a LoadedBoard equal to what `readBoard` returns for the same board stored as CSV.
+        """
+        return LoadedBoard(self.rows, self.cols, self.minePositions(), self.treasurePositions())
+
+# Writes a board as a packed board file
+def writeBoardFile(file_path, board, include_counts=False):
+    """
+    Writes a packed board file.
+
+    Preconditions:
+    - `board` has `rows`, `cols`, `mine_positions` and `treasure_positions`, such as a board model or a LoadedBoard.
+
+    Postconditions:
+    - The file holds the board's dimensions, positions and integer seed if it has one.
+    - With `include_counts`, the adjacent mine count of every cell is stored as well.
+    - The cost, apart from allocating the planes, is proportional to the number of mines and treasures.
+    """
+    rows, cols = board.rows, board.cols
+    seed = getattr(board, "seed", None)
+    hasSeed = isinstance(seed, int) and 0 <= seed < 1 << 64
+
+    planes = [packPositions(rows, cols, board.mine_positions), packPositions(rows, cols, board.treasure_positions)]
+
+    counts = None
+    if include_counts:
+        counts = bytearray(rows * cols)
+        for x, y in board.mine_positions:
+            for nX, nY in computeNeighbors(rows, cols, x, y):
+                counts[nX * cols + nY] += 1
+
+    flags = (FLAG_SEED if hasSeed else 0) | (FLAG_COUNTS if include_counts else 0)
+    with open(file_path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, VERSION, flags, rows, cols, seed if hasSeed else 0,
+                               len(board.mine_positions), len(board.treasure_positions)))
+        for plane in planes:
+            file.write(plane)
+        if counts is not None:
+            file.write(counts)
+
+# Checks a packed board file against a rule set, apart from the mine placement rules
+def _checkBoardFile(boardFile, rules):
+    """
+    Validates the header and planes of an open packed board file.
+
+    Postconditions:
+    - Raises BoardLoadError with the same messages and rule names as `readBoard` if the size or count rules of
+      `rules` are broken, checked from the header before any plane is read.
+    - Raises BoardLoadError with the rule "format" if a plane has bits set past the last cell, a plane's count differs
+      from the header, a cell is both a mine and a treasure, or a saved count is above 8.
+      The saved counts are otherwise trusted, since checking them costs as much as computing them.
+    """
+    if boardFile.rows * boardFile.cols == 0:
+        raise BoardLoadError("Invalid board size", "format")
+    if rules.rows is not None and boardFile.rows != rules.rows:
+        raise BoardLoadError("Invalid board size", "rows")
+    if rules.cols is not None and boardFile.cols != rules.cols:
+        raise BoardLoadError("Invalid board size", "cols")
+    if rules.max_rows is not None and boardFile.rows > rules.max_rows:
+        raise BoardLoadError("Invalid board size", "max_rows")
+    if rules.max_cols is not None and boardFile.cols > rules.max_cols:
+        raise BoardLoadError("Invalid board size", "max_cols")
+    if rules.max_mines is not None and boardFile.mines > rules.max_mines:
+        raise BoardLoadError("Invalid number of mines", "max_mines")
+    if rules.max_treasures is not None and boardFile.treasures > rules.max_treasures:
+        raise BoardLoadError("Invalid number of treasures", "max_treasures")
+    rows, cols = boardFile.rows, boardFile.cols
+    minePlane, treasurePlane = boardFile.mine_plane, boardFile.treasure_plane
+    if not (planePaddingClear(minePlane, rows, cols) and planePaddingClear(treasurePlane, rows, cols)) \
+            or planeCount(minePlane) != boardFile.mines or planeCount(treasurePlane) != boardFile.treasures \
+            or planesOverlap(minePlane, treasurePlane):
+        raise BoardLoadError("Invalid board file", "format")
+    if boardFile.count_plane is not None and bytes(boardFile.count_plane).translate(None, bytes(range(9))):
+        raise BoardLoadError("Invalid board file", "format")
+
+# Checks whether a rule set constrains where mines are placed
+def _hasMineRules(rules):
+    return rules.require_diagonal_mine or rules.require_adjacent_mines or rules.require_separated_mines
+
+# Reads a packed board file and checks it against a rule set
+def readBoardFile(file_path, rules=ANY_SIZE_RULES):
+    """
+    Reads and validates a packed board file.
+
+    Preconditions:
+    - `file_path` is the path of a packed board file.
+
+    Postconditions:
+    - Returns a LoadedBoard.
+    - Raises BoardLoadError as `_checkBoardFile` describes, or with the same message and rule names as `readBoard`
+      if the mines break the placement rules of `rules`, so a valid file always loads into a board.
+    """
+    with BoardFile(file_path) as boardFile:
+        _checkBoardFile(boardFile, rules)
+        board = boardFile.loaded()
+
+    rule = mineRuleViolation(board.mine_positions, rules)
+    if rule is not None:
+        raise BoardLoadError("Invalid mine locations", rule)
+    return board
+
+# Loads a packed board file straight into a board backend
+def loadBoard(file_path, model=BoardModel, rules=ANY_SIZE_RULES):
+    """
+    Loads and validates a packed board file into a board backend.
+
+    Preconditions:
+    - `model` is `BoardModel` or one of its bounded subclasses.
+
+    Postconditions:
+    - Returns a `model` in testing mode with the file's mines, treasures and seed, set up and ready to play.
+    - Raises BoardLoadError in the same cases as `readBoardFile`.
+    - The planes are handed to `loadPlanes`, with the saved counts if the file has them, so no position list is built
+      unless the backend needs one or `rules` has placement rules. A 2048 by 2048 board loads into `ArrayBoardModel`
+      in about 20 ms and into `BitBoardModel` in a few tenths of a second, less with saved counts; `BoardModel`
+      still allocates a `Cell` per cell, which takes seconds.
+    """
+    with BoardFile(file_path) as boardFile:
+        _checkBoardFile(boardFile, rules)
+        # The model starts empty, since `loadPlanes` allocates the board for the file's dimensions
+        board = model(1, 1, 0, 0, is_testing=True, seed=boardFile.seed)
+        board.rows, board.cols = boardFile.rows, boardFile.cols
+        board.loadPlanes(boardFile.mine_plane, boardFile.treasure_plane, boardFile.count_plane)
+
+    if _hasMineRules(rules):
+        rule = mineRuleViolation(board.mine_positions, rules)
+        if rule is not None:
+            raise BoardLoadError("Invalid mine locations", rule)
+    return board
+
+# Converts a CSV test board into a packed board file
+def csvToBoardFile(csv_path, file_path, rules=ANY_SIZE_RULES, include_counts=False):
+    """
+    Converts a CSV board into a packed board file.
+
+    Postconditions:
+    - The CSV file is streamed through `readBoard` with `rules`, which raises BoardLoadError if it breaks them.
+    - Returns the LoadedBoard that was written.
+    """
+    board = readBoard(csv_path, rules)
+    writeBoardFile(file_path, board, include_counts)
+    return board
+
+# Converts a packed board file into a CSV test board
+def boardFileToCsv(file_path, csv_path):
+    """
+    Converts a packed board file into a CSV board.
+
+    Postconditions:
+    - The CSV file has one line per row of comma separated 0 (empty), 1 (mine) and 2 (treasure) values.
+    - Rows are written one at a time, so only one row of text is held in memory.
+    """
+    with BoardFile(file_path) as boardFile:
+        rows, cols = boardFile.rows, boardFile.cols
+        mines = iter(boardFile.minePositions())
+        treasures = iter(boardFile.treasurePositions())
+
+    nextMine, nextTreasure = next(mines, None), next(treasures, None)
+    with open(csv_path, "w", newline="") as file:
+        for x in range(rows):
+            cells = ["0"] * cols
+            while nextMine is not None and nextMine[0] == x:
+                cells[nextMine[1]] = "1"
+                nextMine = next(mines, None)
+            while nextTreasure is not None and nextTreasure[0] == x:
+                cells[nextTreasure[1]] = "2"
+                nextTreasure = next(treasures, None)
+            file.write(",".join(cells) + "\n")
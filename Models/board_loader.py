@@ -0,0 +1,226 @@
+# Streaming loader and rule checks for test boards stored as CSV files of 0 (empty), 1 (mine) and 2 (treasure)
+import csv
+from collections import namedtuple
+
+# Cell values allowed in a test board file
+EMPTY = 0
+MINE = 1
+TREASURE = 2
+
+# Board read from a file: its dimensions and the positions of its mines and treasures in row-major order
+LoadedBoard = namedtuple("LoadedBoard", ["rows", "cols", "mine_positions", "treasure_positions"])
+
+class BoardLoadError(Exception):
+    """
+    Raised when a test board file breaks a rule. The message says which one.
+    """
+    def __init__(self, message, rule=None):
+        """
+        Initializes the BoardLoadError.
+
+        Postconditions:
+        - `self.rule` names the `BoardRules` attribute whose rule failed, "format" if the file is not a well-formed board,
+          or None if not given.
+        """
+        super().__init__(message)
+        self.rule = rule
+
+class BoardRules:
+    """
+    Rules a test board must satisfy. Any limit set to None is not checked.
+    """
+    def __init__(self, rows=8, cols=8, max_rows=None, max_cols=None, max_mines=10, max_treasures=9,
+                 require_diagonal_mine=True, require_adjacent_mines=True, require_separated_mines=True):
+        """
+        Initializes the BoardRules.
+
+        Preconditions:
+        - Every limit is None or a non-negative integer.
+
+        Postconditions:
+        - `rows` and `cols` are the exact dimensions required, and `max_rows` and `max_cols` upper bounds on them.
+        - `max_mines` and `max_treasures` cap the number of mines and treasures.
+        - `require_diagonal_mine` requires a mine whose row equals its column.
+        - `require_adjacent_mines` requires two mines next to each other.
+        - `require_separated_mines` requires two mines that are not next to each other.
+        - The defaults are the rules of the hand-written boards in `TestBoards/`.
+        """
+        self.rows = rows
+        self.cols = cols
+        self.max_rows = max_rows
+        self.max_cols = max_cols
+        self.max_mines = max_mines
+        self.max_treasures = max_treasures
+        self.require_diagonal_mine = require_diagonal_mine
+        self.require_adjacent_mines = require_adjacent_mines
+        self.require_separated_mines = require_separated_mines
+
+# Rules of the original 8x8 test boards
+CLASSIC_RULES = BoardRules()
+
+# Rules for generated boards of any size: only the file format is checked
+ANY_SIZE_RULES = BoardRules(rows=None, cols=None, max_mines=None, max_treasures=None,
+                            require_diagonal_mine=False, require_adjacent_mines=False, require_separated_mines=False)
+
+# Parses one row that the fast path could not handle
+def _parseRow(line):
+    """
+    Parses a CSV row cell by cell.
+
+    Postconditions:
+    - Returns the list of integer cell values.
+    - Raises BoardLoadError naming the first cell that is not 0, 1 or 2.
+    """
+    values = []
+    for text in next(csv.reader([line]), []):
+        try:
+            value = int(text)
+        except ValueError:
+            raise BoardLoadError(f"Invalid cell value: {text}", "format")
+        if value not in (EMPTY, MINE, TREASURE):
+            raise BoardLoadError(f"Invalid cell value: {value}", "format")
+        values.append(value)
+    return values
+
+# Finds every column of a row holding a value
+def _columnsOf(line, char):
+    """
+    Finds the columns of a fast-path row that hold `char`.
+
+    Preconditions:
+    - `line` is single-character cells separated by commas, with no other characters.
+
+    Postconditions:
+    - Returns the list of column indices in increasing order. Only matching cells are visited in Python.
+    """
+    columns = []
+    index = line.find(char)
+    while index >= 0:
+        columns.append(index // 2)
+        index = line.find(char, index + 2)
+    return columns
+
+# Checks the size rules against the dimensions seen so far
+def _checkSize(rules, rows, cols):
+    if rules.cols is not None and cols != rules.cols:
+        raise BoardLoadError("Invalid board size", "cols")
+    if rules.max_cols is not None and cols > rules.max_cols:
+        raise BoardLoadError("Invalid board size", "max_cols")
+    if rules.rows is not None and rows > rules.rows:
+        raise BoardLoadError("Invalid board size", "rows")
+    if rules.max_rows is not None and rows > rules.max_rows:
+        raise BoardLoadError("Invalid board size", "max_rows")
+
+# Reads a board one row at a time
+def readBoard(file_path, rules=CLASSIC_RULES):
+    """
+    Reads and validates a test board file without holding more than one row of it in memory.
+
+    Preconditions:
+    - `file_path` is the path of a CSV file.
+
+    Postconditions:
+    - Returns a LoadedBoard.
+    - Raises BoardLoadError as soon as a row breaks a size or value rule, without reading the rest of the file.
+      Count and placement rules are checked once the whole file has the right size, in the order `TestController`
+      always reported them: mine count, mine locations, then treasure count. The error's `rule` names the rule.
+    - Rows of single-digit cells separated by commas are checked with string operations;
+      other rows, such as ones with spaces or quotes, are parsed cell by cell.
+    """
+    rows = 0
+    cols = None
+    minePositions = []
+    treasurePositions = []
+    tooManyMines = tooManyTreasures = False
+    allowed = frozenset("012,")
+
+    with open(file_path, mode="r", newline="") as file:
+        for line in file:
+            line = line.rstrip("\r\n")
+            if not line:
+                continue
+
+            width = (len(line) + 1) // 2
+            if len(line) % 2 == 1 and line[1::2] == "," * (width - 1) and set(line) <= allowed and "," not in line[0::2]:
+                mines = _columnsOf(line, "1")
+                treasures = _columnsOf(line, "2")
+            else:
+                values = _parseRow(line)
+                width = len(values)
+                mines = [col for col, value in enumerate(values) if value == MINE]
+                treasures = [col for col, value in enumerate(values) if value == TREASURE]
+
+            _checkSize(rules, rows + 1, width)
+            if cols is None:
+                cols = width
+            elif width != cols:
+                raise BoardLoadError("Invalid board size", "format")
+
+            # Past a cap the positions are no longer kept; the count error waits until the size is known to be valid
+            if not tooManyMines:
+                minePositions.extend((rows, col) for col in mines)
+                tooManyMines = rules.max_mines is not None and len(minePositions) > rules.max_mines
+            if not tooManyTreasures:
+                treasurePositions.extend((rows, col) for col in treasures)
+                tooManyTreasures = rules.max_treasures is not None and len(treasurePositions) > rules.max_treasures
+            rows += 1
+
+    if rows == 0:
+        raise BoardLoadError("Invalid board size", "format")
+    if rules.rows is not None and rows != rules.rows:
+        raise BoardLoadError("Invalid board size", "rows")
+    if tooManyMines:
+        raise BoardLoadError("Invalid number of mines", "max_mines")
+    rule = mineRuleViolation(minePositions, rules)
+    if rule is not None:
+        raise BoardLoadError("Invalid mine locations", rule)
+    if tooManyTreasures:
+        raise BoardLoadError("Invalid number of treasures", "max_treasures")
+    return LoadedBoard(rows, cols, minePositions, treasurePositions)
+
+# Checks the mine placement rules
+def validateMines(mines, rules=CLASSIC_RULES):
+    """
+    Validates the placement of mines against the adjacency rules.
+
+    Preconditions:
+    - `mines` is a list of (row, column) tuples representing mine positions.
+
+    Postconditions:
+    - Returns True if every placement rule enabled in `rules` holds, otherwise False.
+    """
+    return mineRuleViolation(mines, rules) is None
+
+# Finds the first mine placement rule that fails
+def mineRuleViolation(mines, rules=CLASSIC_RULES):
+    """
+    Checks the placement of mines against the adjacency rules.
+
+    Preconditions:
+    - `mines` is a list of (row, column) tuples representing mine positions.
+
+    Postconditions:
+    - Returns None if every placement rule enabled in `rules` holds, otherwise the name of the first
+      `BoardRules` attribute that fails: "require_diagonal_mine", "require_adjacent_mines" or "require_separated_mines".
+    - Runs in time proportional to the number of mines: neighbors are looked up in a set instead of comparing every pair.
+    """
+    if rules.require_diagonal_mine and not any(row == col for row, col in mines):
+        return "require_diagonal_mine"
+
+    if rules.require_adjacent_mines:
+        mineSet = set(mines)
+        if not any((row + dirX, col + dirY) in mineSet
+                   for row, col in mines
+                   for dirX, dirY in ((0, 1), (1, -1), (1, 0), (1, 1))):
+            return "require_adjacent_mines"
+
+    if rules.require_separated_mines:
+        # Mines are all next to each other only if they fit in a 2x2 square
+        if len(mines) < 2:
+            return "require_separated_mines"
+        rowsUsed = [row for row, _ in mines]
+        colsUsed = [col for _, col in mines]
+        if max(rowsUsed) - min(rowsUsed) <= 1 and max(colsUsed) - min(colsUsed) <= 1:
+            return "require_separated_mines"
+
+    return None
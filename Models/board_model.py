@@ -1,11 +1,21 @@
 # Model for the game board
 from collections import deque
+from itertools import chain
 import random
+from Models.bit_planes import packPositions, planePositions
 from Models.cell_model import Cell
+from Models.neighbor_table import computeNeighbors, getNeighborTable
+
+# Board parameters for each difficulty level, as (rows, cols, mines, treasures)
+DIFFICULTY_PRESETS = {
+    "beginner": (8, 8, 10, 1),
+    "intermediate": (16, 16, 40, 3),
+    "expert": (30, 16, 99, 5),
+}
 
 class BoardModel:
     # Sets the initial board parameters
-    def __init__(self, rows=8, cols=8, mines=10, treasures=1, mine_positions=None, treasure_positions=None, is_testing=False):
+    def __init__(self, rows=8, cols=8, mines=10, treasures=1, mine_positions=None, treasure_positions=None, is_testing=False, seed=None):
         """
         Initializes the BoardModel with the specified parameters.
 
@@ -13,12 +23,16 @@ class BoardModel:
         - `rows` and `cols` are positive integers representing the board dimensions.
         - `mines` and `treasures` are non-negative integers.
         - If provided, `mine_positions` and `treasure_positions` are lists of valid cell coordinates.
+        - `seed` is None or a value accepted by `random.Random`.
 
         Postconditions:
         - `self.rows`, `self.cols`, `self.mines`, and `self.treasures` are set.
         - `self.grid` is initialized as a 2D list of `Cell` instances.
         - `self.mine_positions` and `self.treasure_positions` are set or initialized as empty lists.
         - `self.is_testing` determines whether the board is in testing mode.
+        - `self.rng` is a `random.Random` seeded with `seed`, so a seeded board generates the same games in the same order.
+        - `self.neighbor_table` is the shared neighbor table for the board's geometry, or None if the board is too large for one.
+        - The move counters are zero.
         """
         self.rows = rows
         self.cols = cols
@@ -28,7 +42,45 @@ class BoardModel:
         self.treasure_positions = treasure_positions if treasure_positions is not None else []
         self.grid = [[Cell() for _ in range(cols)] for _ in range(rows)]
         self.is_testing = is_testing
-    
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.neighbor_table = getNeighborTable(rows, cols)
+        self.resetCounters()
+
+    # Resets the counters kept up to date by every move
+    def resetCounters(self, safe_total=None):
+        """
+        Resets the incremental game counters.
+
+        Preconditions:
+        - `self.mine_positions` and `self.treasure_positions` hold the positions of the game being started,
+          unless `safe_total` is given.
+
+        Postconditions:
+        - `self.revealed_safe_count`, `self.flag_count` and `self.correct_flag_count` are zero.
+        - `self.safe_total` is `safe_total`, or the number of cells that are neither mines nor treasures if it is None.
+        - `self.mine_revealed` and `self.treasure_found` are False.
+        - `self.flagged_positions`, the index of flagged cells, is empty.
+        """
+        self.revealed_safe_count = 0
+        self.flag_count = 0
+        self.correct_flag_count = 0
+        if safe_total is None:
+            safe_total = self.rows * self.cols - len(self.mine_positions) - len(self.treasure_positions)
+        self.safe_total = safe_total
+        self.mine_revealed = False
+        self.treasure_found = False
+        self.flagged_positions = set()
+
+    @property
+    def is_won(self):
+        # A found treasure wins, as does revealing every safe cell
+        return self.treasure_found or self.revealed_safe_count == self.safe_total
+
+    @property
+    def is_lost(self):
+        return self.mine_revealed
+
     # Sets up the initial board state. A reengineered version of the setup function.
     def setup(self):
         """
@@ -42,37 +94,189 @@ class BoardModel:
         - Mines and treasures are randomly placed unless `is_testing` is True.
         - Adjacent mine counts are calculated for each cell.
         - The board is ready for gameplay.
+        - Apart from allocating the grid, the cost is proportional to the number of mines and treasures.
+        - The move counters are reset.
         """
-        self.flagCount = 0
-        self.correctFlagCount = 0
-        self.clickedCount = 0
-        self.startTime = None
         self.grid = [[Cell() for _ in range(self.cols)] for _ in range(self.rows)]
+        self.neighbor_table = getNeighborTable(self.rows, self.cols)
 
         if not self.is_testing:
-            # Creates the mine positions if positions aren't know
-            self.mine_positions = random.sample(
-                [(x, y) for x in range(self.rows) for y in range(self.cols)], self.mines
-            )
-            
-
-            # Creates the treasure positions if positions aren't know
-            self.treasure_positions = random.sample(
-                [(x, y) for x in range(self.rows) for y in range(self.cols) if (x, y) not in self.mine_positions], self.treasures
-            )
-            
+            # Creates the mine and treasure positions if positions aren't know.
+            # Sampling flat indices from a range avoids building a list of every coordinate.
+            cells = self.rng.sample(range(self.rows * self.cols), self.mines + self.treasures)
+            self.mine_positions = [divmod(i, self.cols) for i in cells[:self.mines]]
+            self.treasure_positions = [divmod(i, self.cols) for i in cells[self.mines:]]
+        self.resetCounters()
+
         # Sets is_mine property to true for each mine position
         for x, y in self.mine_positions:
             self.grid[x][y].is_mine = True
         for x, y in self.treasure_positions:
             self.grid[x][y].is_treasure = True
-        
-        # Determines adjacent mines for each cell
-        for x in range(self.rows):
-            for y in range(self.cols):
-                neighbors = self.getNeighbors(x, y)
-                num_mines = sum(1 for nX, nY in neighbors if self.grid[nX][nY].is_mine)
-                self.grid[x][y].adjacent_mines = num_mines
+
+        # Determines adjacent mines by incrementing the neighbors of each mine
+        getNeighbors = self.getNeighbors
+        for x, y in self.mine_positions:
+            for nX, nY in getNeighbors(x, y):
+                self.grid[nX][nY].adjacent_mines += 1
+
+        self.labelZeroRegions()
+
+    # Sets up a saved layout from bit planes
+    def loadPlanes(self, mine_plane, treasure_plane, counts=None):
+        """
+        Sets up the board from packed mine and treasure planes instead of positions.
+
+        Preconditions:
+        - `self.rows` and `self.cols` are the dimensions of the planes, which are in the `Models.bit_planes` layout,
+          have no bits past the last cell and share no bit.
+        - `counts` is None or a bytes-like object with the adjacent mine count of every cell in row-major order.
+
+        Postconditions:
+        - The board is in the state `setup` leaves it in for the planes' positions, and `self.mines` and
+          `self.treasures` are their counts. `self.is_testing` and `self.rng` are unchanged.
+        - Adjacent mine counts are taken from `counts` when given, otherwise counted from the mines.
+        - The zero-region index is built by the first `clearSurroundingTiles` rather than here.
+        """
+        rows, cols = self.rows, self.cols
+        self.mine_positions = planePositions(mine_plane, cols)
+        self.treasure_positions = planePositions(treasure_plane, cols)
+        self.mines = len(self.mine_positions)
+        self.treasures = len(self.treasure_positions)
+        self.neighbor_table = getNeighborTable(rows, cols)
+        self.resetCounters()
+
+        if counts is not None:
+            counts = bytes(counts)
+            self.grid = [[Cell(adj_mines=count) for count in counts[x * cols:(x + 1) * cols]] for x in range(rows)]
+        else:
+            self.grid = [[Cell() for _ in range(cols)] for _ in range(rows)]
+        for x, y in self.mine_positions:
+            self.grid[x][y].is_mine = True
+        for x, y in self.treasure_positions:
+            self.grid[x][y].is_treasure = True
+        if counts is None:
+            getNeighbors = self.getNeighbors
+            for x, y in self.mine_positions:
+                for nX, nY in getNeighbors(x, y):
+                    self.grid[nX][nY].adjacent_mines += 1
+
+        self.region_labels = None
+
+    # Marks the cells of saved flag planes as flagged
+    def restoreFlags(self, flagged_plane, wrong_flag_plane):
+        """
+        Flags every cell set in a bit plane and marks the wrong flags of another.
+
+        Preconditions:
+        - The board has been set up or loaded, and the planes match its dimensions.
+        - Every wrong flag is also flagged, and no flagged cell is revealed.
+
+        Postconditions:
+        - The cells are flagged and `self.flagged_positions` lists them; the flag counters are unchanged.
+        """
+        grid = self.grid
+        flagged = planePositions(flagged_plane, self.cols)
+        for x, y in flagged:
+            grid[x][y].is_flagged = True
+        for x, y in planePositions(wrong_flag_plane, self.cols):
+            grid[x][y].is_wrong_flag = True
+        self.flagged_positions = set(flagged)
+
+    # Precomputes the cells revealed by clicking on each region of zero cells
+    def labelZeroRegions(self):
+        """
+        Labels the connected regions of zero cells and their numbered border.
+
+        Preconditions:
+        - Mines, treasures and adjacent mine counts have been set.
+
+        Postconditions:
+        - `self.region_labels` maps each safe zero cell to the label of its region.
+        - `self.regions[label]` lists the zero cells of the region followed by the numbered
+          cells bordering it, which is exactly what a flood clear from any of them reveals.
+        - Mines and treasures are never part of a region.
+        """
+        self.region_labels = {}
+        self.regions = []
+        getNeighbors = self.getNeighbors
+
+        for x, row in enumerate(self.grid):
+            for y, cell in enumerate(row):
+                if cell.adjacent_mines > 0 or cell.is_mine or cell.is_treasure or (x, y) in self.region_labels:
+                    continue
+
+                label = len(self.regions)
+                self.region_labels[(x, y)] = label
+                zeros = [(x, y)]
+                border = set()
+
+                # The zero list doubles as the BFS queue
+                index = 0
+                while index < len(zeros):
+                    currX, currY = zeros[index]
+                    index += 1
+                    for neighborX, neighborY in getNeighbors(currX, currY):
+                        cell = self.grid[neighborX][neighborY]
+                        if cell.is_mine or cell.is_treasure:
+                            continue
+                        if cell.adjacent_mines > 0:
+                            border.add((neighborX, neighborY))
+                        elif (neighborX, neighborY) not in self.region_labels:
+                            self.region_labels[(neighborX, neighborY)] = label
+                            zeros.append((neighborX, neighborY))
+
+                self.regions.append(zeros + sorted(border))
+
+    # Determines if a cell is a safe cell with no adjacent mines
+    def isZeroCell(self, x, y):
+        """
+        Checks whether the cell at (x, y) can propagate a flood clear.
+
+        Preconditions:
+        - `x` and `y` are valid indices within the grid.
+
+        Postconditions:
+        - Returns True if the cell is not a mine or treasure and has no adjacent mines.
+        """
+        cell = self.grid[x][y]
+        return not cell.is_mine and not cell.is_treasure and cell.adjacent_mines == 0
+
+    # Checks whether a cell is a mine
+    def isMine(self, x, y):
+        return self.grid[x][y].is_mine
+
+    # Checks whether a cell is revealed
+    def isRevealed(self, x, y):
+        return self.grid[x][y].is_revealed
+
+    # Checks whether a cell is flagged
+    def isFlagged(self, x, y):
+        return self.grid[x][y].is_flagged
+
+    # Gets the number of mines around a cell
+    def adjacentMines(self, x, y):
+        """
+        Gets the adjacent mine count of the cell at (x, y).
+
+        Preconditions:
+        - `x` and `y` are valid indices within the grid.
+
+        Postconditions:
+        - Returns the count. Like `isMine`, `isRevealed` and `isFlagged`, it reads one cell without going through
+          `self.grid`, so compact backends answer it from their planes without building a cell view.
+        """
+        return self.grid[x][y].adjacent_mines
+
+    # Gets the cell a new game should open on
+    def startCell(self):
+        """
+        Gets the cell views should center on when a game starts.
+
+        Postconditions:
+        - Returns None, since a bounded board is shown from its top-left corner.
+        """
+        return None
 
     # Gets all neighboring cells of the provided cell
     def getNeighbors(self, x, y):
@@ -83,17 +287,14 @@ class BoardModel:
         - `x` and `y` are valid indices within the grid.
 
         Postconditions:
-        - Returns a list of (x, y) tuples representing valid neighbor coordinates.
+        - Returns a tuple of (x, y) tuples representing valid neighbor coordinates.
+        - The tuple comes from the shared neighbor table and is not allocated per call,
+          except on boards too large for a table.
         """
-        directions = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
-        neighbor_cells = []
-
-        for dirX, dirY in directions:
-            nextX, nextY = x + dirX, y + dirY
-
-            if 0 <= nextX < self.rows and 0 <= nextY < self.cols:
-                neighbor_cells.append((nextX, nextY))
-        return neighbor_cells
+        table = self.neighbor_table
+        if table is not None:
+            return table[x][y]
+        return computeNeighbors(self.rows, self.cols, x, y)
     
     # Clears all cells surronding the given coordinates that match necessary conditions
     def clearSurroundingTiles(self, x, y):
@@ -104,21 +305,62 @@ class BoardModel:
         - `x` and `y` are valid indices within the grid.
 
         Postconditions:
+        - The zero-region index is built first if the board was loaded from planes and has none yet.
+        - If (x, y) is a zero cell, its precomputed region is revealed in one pass.
+        - If a zero cell in that region is flagged, the flag blocks the clear and `floodClear` is used instead.
+        - Flagged cells are never revealed.
+        - `self.revealed_safe_count` grows by the number of cells revealed.
+        - Returns the set of (x, y) tuples that were newly revealed.
+        """
+        if self.region_labels is None:
+            self.labelZeroRegions()
+        label = self.region_labels.get((x, y))
+        if label is None:
+            return self.floodClear(x, y)
+
+        region = self.regions[label]
+        for regionX, regionY in region:
+            cell = self.grid[regionX][regionY]
+            if cell.is_flagged and cell.adjacent_mines == 0:
+                return self.floodClear(x, y)
+
+        changed = set()
+        for regionX, regionY in region:
+            cell = self.grid[regionX][regionY]
+            if not cell.is_revealed and not cell.is_flagged:
+                cell.reveal()
+                changed.add((regionX, regionY))
+        self.revealed_safe_count += len(changed)
+        return changed
+
+    # Clears surrounding cells by walking outward from the given coordinates
+    def floodClear(self, x, y):
+        """
+        Clears all cells around (x, y) using a breadth first search.
+
+        Preconditions:
+        - `x` and `y` are valid indices within the grid.
+
+        Postconditions:
+        - Reveals (x, y) unless it is flagged.
         - Reveals cells recursively if they have no adjacent mines.
         - Stops clearing at cells with adjacent mines or flagged cells.
+        - Returns the set of (x, y) tuples that were newly revealed.
         """
+        changed = self.revealCell(x, y)
         queue = deque([(x, y)])
+        getNeighbors = self.getNeighbors
 
         while queue:
             currX, currY = queue.popleft()
-            for neighborX, neighborY in self.getNeighbors(currX, currY):
-                if neighborX < 0 or neighborX >= self.rows or neighborY < 0 or neighborY >= self.cols:
-                    continue
-                
+            for neighborX, neighborY in getNeighbors(currX, currY):
                 cell = self.grid[neighborX][neighborY]
                 
                 if not cell.is_revealed and not cell.is_flagged:
                     self.clearTile(neighborX, neighborY, queue)
+                    if cell.is_revealed:
+                        changed.add((neighborX, neighborY))
+        return changed
     
     # Determines if a cell should be cleared and revealed.
     def clearTile(self, x, y, queue):
@@ -130,7 +372,7 @@ class BoardModel:
         - `queue` is a deque used for recursive clearing.
 
         Postconditions:
-        - The tile is revealed if it is not a mine or treasure.
+        - The tile is revealed if it is not a mine or treasure, and counted in `self.revealed_safe_count`.
         - If the tile has no adjacent mines, it is added to the queue for further clearing.
         """
         cell = self.grid[x][y]
@@ -140,6 +382,152 @@ class BoardModel:
         
         if cell.adjacent_mines == 0 and not cell.is_mine and not cell.is_treasure:
             cell.reveal()
+            self.revealed_safe_count += 1
             queue.append((x, y))
         elif cell.adjacent_mines > 0 and not cell.is_mine and not cell.is_treasure:
-            cell.reveal()
\ No newline at end of file
+            cell.reveal()
+            self.revealed_safe_count += 1
+
+    # Gets the coordinates of every revealed cell
+    def revealedPositions(self):
+        """
+        Gets every revealed cell.
+
+        Preconditions:
+        - `self.grid` is populated.
+
+        Postconditions:
+        - Returns a list of (x, y) tuples for each revealed cell in row-major order.
+        """
+        return [(x, y) for x in range(self.rows) for y in range(self.cols) if self.grid[x][y].is_revealed]
+
+    # Packs the revealed cells into a bit plane
+    def revealedPlane(self):
+        """
+        Gets the revealed state of every cell as a bit plane.
+
+        Postconditions:
+        - Returns a bytes-like plane in the `Models.bit_planes` layout with the bit of every revealed cell set.
+        """
+        return packPositions(self.rows, self.cols, self.revealedPositions())
+
+    # Marks the cells of a bit plane as revealed
+    def restoreRevealed(self, plane):
+        """
+        Reveals every cell set in a bit plane, as saved by `revealedPlane`.
+
+        Preconditions:
+        - The board has been set up or loaded and `plane` matches its dimensions.
+
+        Postconditions:
+        - The cells are marked revealed without running any game rule; the counters are unchanged.
+        """
+        grid = self.grid
+        for x, y in planePositions(plane, self.cols):
+            grid[x][y].is_revealed = True
+
+    # Reveals a single cell
+    def revealCell(self, x, y):
+        """
+        Reveals the cell at (x, y).
+
+        Preconditions:
+        - `x` and `y` are valid indices within the grid.
+
+        Postconditions:
+        - The cell is revealed unless it is flagged.
+        - Revealing a mine sets `self.mine_revealed`, revealing a treasure sets `self.treasure_found`,
+          and revealing any other cell increments `self.revealed_safe_count`.
+        - Returns {(x, y)} if the cell was newly revealed, otherwise an empty set.
+        """
+        cell = self.grid[x][y]
+        if cell.is_revealed or cell.is_flagged:
+            return set()
+        cell.reveal()
+        if cell.is_mine:
+            self.mine_revealed = True
+        elif cell.is_treasure:
+            self.treasure_found = True
+        else:
+            self.revealed_safe_count += 1
+        return {(x, y)}
+
+    # Toggles the flag on a single cell
+    def toggleFlag(self, x, y):
+        """
+        Toggles the flagged state of the cell at (x, y).
+
+        Preconditions:
+        - `x` and `y` are valid indices within the grid.
+
+        Postconditions:
+        - The flag is toggled unless the cell is revealed.
+        - `self.flag_count`, `self.flagged_positions` and, for a mine, `self.correct_flag_count` follow the change.
+        - Returns {(x, y)} if the flag changed, otherwise an empty set.
+        """
+        cell = self.grid[x][y]
+        if cell.is_revealed:
+            return set()
+        cell.toggle_flag()
+        if cell.is_flagged:
+            step = 1
+            self.flagged_positions.add((x, y))
+        else:
+            step = -1
+            self.flagged_positions.discard((x, y))
+        self.flag_count += step
+        if cell.is_mine:
+            self.correct_flag_count += step
+        return {(x, y)}
+
+    # Reveals mines, treasures and wrong flags when the game ends
+    def revealEndState(self):
+        """
+        Reveals the board at the end of the game.
+
+        Preconditions:
+        - `self.grid` is populated.
+
+        Postconditions:
+        - Same as running `endStateBatches` to the end.
+        - Returns the set of (x, y) tuples whose state changed.
+        """
+        changed = set()
+        for batch in self.endStateBatches():
+            changed |= batch
+        return changed
+
+    # Reveals the end state a batch at a time, so a view can draw between batches
+    def endStateBatches(self, batch_size=None):
+        """
+        Reveals the board at the end of the game in batches.
+
+        Preconditions:
+        - `batch_size` is None or a positive integer.
+
+        Postconditions:
+        - Returns a generator. Each step applies the next batch of changes and yields the set of
+          (x, y) tuples it changed, of at most `batch_size` cells, or all of them if it is None.
+        - Treasures and unflagged mines are revealed.
+        - Flagged cells that are not mines are marked as wrong flags.
+        - Only the indexed mine, treasure and flagged positions are visited, never the whole grid.
+        - The move counters, `is_won` and `is_lost` are unchanged.
+        """
+        grid = self.grid
+        batch = set()
+        for x, y in chain(self.mine_positions, self.treasure_positions, list(self.flagged_positions)):
+            cell = grid[x][y]
+            if cell.is_revealed:
+                continue
+            if (cell.is_treasure or cell.is_mine) and not cell.is_flagged:
+                cell.reveal()
+                batch.add((x, y))
+            elif cell.is_flagged and not cell.is_mine and not cell.is_wrong_flag:
+                # Mark wrong flags
+                cell.is_wrong_flag = True
+                batch.add((x, y))
+            if batch_size is not None and len(batch) >= batch_size:
+                yield batch
+                batch = set()
+        if batch:
+            yield batch
@@ -12,12 +12,14 @@ class Cell:
 
         Postconditions:
         - `self.is_mine`, `self.is_flagged`, `self.is_revealed`, `self.adjacent_mines`, and `self.is_treasure` are initialized.
+        - `self.is_wrong_flag` is False until the game ends with this cell wrongly flagged.
         """
         self.is_mine = is_mine
         self.is_flagged = is_flagged
         self.is_revealed = is_revealed
         self.adjacent_mines = adj_mines
         self.is_treasure = is_treasure
+        self.is_wrong_flag = False
     
     # Returns true if a cell is a mine when it is revealed and false otherwise.
     def reveal(self):
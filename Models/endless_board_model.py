@@ -0,0 +1,335 @@
+# Endless board model. Cells are generated chunk by chunk as they are touched, so memory grows with the explored area.
+from collections import OrderedDict
+import random
+from Models.board_model import BoardModel
+from Models.cell_model import Cell
+
+# Side of the square chunks the board is generated in
+CHUNK_SIZE = 32
+
+# Rows and columns of an endless board. Coordinates stay non-negative, and the canvas scroll region stays within Tk's limits.
+ENDLESS_SIZE = 1 << 20
+
+# Fraction of cells that are mines by default
+DEFAULT_DENSITY = 0.15
+
+# Fraction of cells that are treasures by default
+DEFAULT_TREASURE_DENSITY = 0.0005
+
+# Lowest mine density allowed. Below it, zero regions can be unbounded and a flood clear would never end.
+MIN_DENSITY = 0.12
+
+# Unexplored chunks kept in memory before the least recently used are evicted
+CHUNK_CACHE_LIMIT = 256
+
+# Cell kinds returned by `EndlessBoardModel.kindAt`
+SAFE = 0
+MINE = 1
+TREASURE = 2
+
+_MASK = (1 << 64) - 1
+
+# Hashes a position into 64 bits
+def cellHash(seed, x, y):
+    """
+    Mixes a seed and a position into a well distributed 64 bit integer.
+
+    Preconditions:
+    - `seed`, `x` and `y` are integers.
+
+    Postconditions:
+    - Returns the same value for the same arguments in every process and on every platform.
+    """
+    h = (seed ^ (x * 0x9E3779B97F4A7C15) ^ (y * 0xC2B2AE3D27D4EB4F)) & _MASK
+    h = ((h ^ (h >> 30)) * 0xBF58476D1CE4E5B9) & _MASK
+    h = ((h ^ (h >> 27)) * 0x94D049BB133111EB) & _MASK
+    return h ^ (h >> 31)
+
+class _RowView:
+    # Row of cells so `grid[x][y]` keeps working
+    __slots__ = ("_board", "_x")
+
+    def __init__(self, board, x):
+        self._board = board
+        self._x = x
+
+    def __getitem__(self, y):
+        if not 0 <= y < self._board.cols:
+            raise IndexError("grid column index out of range")
+        return self._board.cellAt(self._x, y)
+
+    def __len__(self):
+        return self._board.cols
+
+class _GridView:
+    # Two level view over the chunks, indexed as `grid[x][y]`
+    __slots__ = ("_board",)
+
+    def __init__(self, board):
+        self._board = board
+
+    def __getitem__(self, x):
+        if not 0 <= x < self._board.rows:
+            raise IndexError("grid row index out of range")
+        return _RowView(self._board, x)
+
+    def __len__(self):
+        return self._board.rows
+
+class EndlessBoardModel(BoardModel):
+    """
+    BoardModel backend for a board too large to allocate. Whether a cell is a mine or a treasure is
+    a pure function of the game seed and its position, and cells are created a chunk at a time on first touch.
+    """
+    # Sets the initial board parameters
+    def __init__(self, density=DEFAULT_DENSITY, treasure_density=DEFAULT_TREASURE_DENSITY, seed=None, size=ENDLESS_SIZE):
+        """
+        Initializes the EndlessBoardModel.
+
+        Preconditions:
+        - `density` is at least `MIN_DENSITY` and `density + treasure_density` is below 1.
+        - `seed` is None or a value accepted by `random.Random`.
+        - `size` is a positive integer.
+
+        Postconditions:
+        - The board has `size` rows and columns. Nothing is allocated until `setup` is called and cells are touched.
+        - `self.mines` and `self.treasures` are the expected counts for the whole board, not exact ones.
+        - Mine positions are never listed, so `self.safe_total` is the whole board and only a treasure wins.
+        - Raises ValueError if the density is too low for flood clears to end.
+        """
+        if density < MIN_DENSITY:
+            raise ValueError(f"Mine density must be at least {MIN_DENSITY}.")
+        if density + treasure_density >= 1:
+            raise ValueError("Mine and treasure densities must add up to less than 1.")
+        self.rows = size
+        self.cols = size
+        self.density = density
+        self.treasure_density = treasure_density
+        self.mines = round(size * size * density)
+        self.treasures = round(size * size * treasure_density)
+        self.mine_positions = []
+        self.treasure_positions = []
+        self.is_testing = False
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.neighbor_table = None
+        self.mine_limit = int(density * (1 << 64))
+        self.treasure_limit = self.mine_limit + int(treasure_density * (1 << 64))
+        self.game_seed = 0
+        self.chunks = OrderedDict()
+        self.explored = {}
+        self.start = None
+        self.resetCounters()
+
+    @property
+    def grid(self):
+        return _GridView(self)
+
+    # Starts a new game on a new map
+    def setup(self):
+        """
+        Sets up a new game.
+
+        Postconditions:
+        - `self.game_seed` is drawn from `self.rng`, so every game has a different map and a seeded board repeats its games.
+        - All chunks are dropped.
+        - `self.start` is a zero cell near the middle of the board, which the views open on.
+        """
+        self.resetCounters()
+        self.game_seed = self.rng.getrandbits(64)
+        self.chunks = OrderedDict()
+        self.explored = {}
+        self.start = self.findStart()
+
+    # Classifies a position without creating its chunk
+    def kindAt(self, x, y):
+        """
+        Determines what is at (x, y) from the game seed alone.
+
+        Postconditions:
+        - Returns MINE, TREASURE or SAFE. Positions outside the board are SAFE.
+        """
+        if not (0 <= x < self.rows and 0 <= y < self.cols):
+            return SAFE
+        h = cellHash(self.game_seed, x, y)
+        if h < self.mine_limit:
+            return MINE
+        if h < self.treasure_limit:
+            return TREASURE
+        return SAFE
+
+    # Generates the cells of one chunk
+    def generateChunk(self, chunkX, chunkY):
+        """
+        Creates the cells of the chunk at (chunkX, chunkY).
+
+        Postconditions:
+        - Returns a CHUNK_SIZE x CHUNK_SIZE list of lists of `Cell`, clipped at the board's edges.
+        - Mines, treasures and adjacent mine counts follow `kindAt`, including mines in neighboring chunks.
+        """
+        firstX, firstY = chunkX * CHUNK_SIZE, chunkY * CHUNK_SIZE
+        height = min(CHUNK_SIZE, self.rows - firstX)
+        width = min(CHUNK_SIZE, self.cols - firstY)
+
+        # Kinds of the chunk plus a one cell margin, so counts at the chunk's edges see their neighbors
+        kinds = [[self.kindAt(x, y) for y in range(firstY - 1, firstY + width + 1)]
+                 for x in range(firstX - 1, firstX + height + 1)]
+
+        cells = []
+        for i in range(1, height + 1):
+            above, current, below = kinds[i - 1], kinds[i], kinds[i + 1]
+            row = []
+            for j in range(1, width + 1):
+                count = (above[j - 1] == MINE) + (above[j] == MINE) + (above[j + 1] == MINE) \
+                    + (current[j - 1] == MINE) + (current[j + 1] == MINE) \
+                    + (below[j - 1] == MINE) + (below[j] == MINE) + (below[j + 1] == MINE)
+                kind = current[j]
+                row.append(Cell(is_mine=kind == MINE, adj_mines=count, is_treasure=kind == TREASURE))
+            cells.append(row)
+        return cells
+
+    # Gets a chunk, creating it on first touch
+    def chunkAt(self, chunkX, chunkY):
+        """
+        Gets the cells of the chunk at (chunkX, chunkY).
+
+        Postconditions:
+        - Returns the chunk from memory, or generates it and evicts unexplored chunks
+          beyond `CHUNK_CACHE_LIMIT`, least recently used first.
+        - A chunk found to hold a revealed or flagged cell when it would be evicted is moved to
+          `self.explored` and kept for the rest of the game.
+        """
+        key = (chunkX, chunkY)
+        chunk = self.explored.get(key)
+        if chunk is not None:
+            return chunk
+        chunk = self.chunks.get(key)
+        if chunk is not None:
+            self.chunks.move_to_end(key)
+            return chunk
+
+        chunk = self.generateChunk(chunkX, chunkY)
+        self.chunks[key] = chunk
+        while len(self.chunks) > CHUNK_CACHE_LIMIT:
+            oldKey, oldChunk = self.chunks.popitem(last=False)
+            if any(cell.is_revealed or cell.is_flagged for row in oldChunk for cell in row):
+                self.explored[oldKey] = oldChunk
+        return chunk
+
+    # Gets a single cell
+    def cellAt(self, x, y):
+        """
+        Gets the cell at (x, y).
+
+        Preconditions:
+        - `x` and `y` are valid indices within the board.
+
+        Postconditions:
+        - Returns the `Cell`, creating its chunk if needed.
+        """
+        chunkX, localX = divmod(x, CHUNK_SIZE)
+        chunkY, localY = divmod(y, CHUNK_SIZE)
+        return self.chunkAt(chunkX, chunkY)[localX][localY]
+
+    # Finds the cell a new game opens on
+    def findStart(self):
+        """
+        Finds a zero cell to start from.
+
+        Postconditions:
+        - Returns the first zero cell found in square rings around the middle of the board,
+          or the middle itself if there is none within the first chunk's distance.
+        """
+        middleX, middleY = self.rows // 2, self.cols // 2
+        for radius in range(CHUNK_SIZE):
+            for x in range(middleX - radius, middleX + radius + 1):
+                for y in range(middleY - radius, middleY + radius + 1):
+                    if max(abs(x - middleX), abs(y - middleY)) != radius:
+                        continue
+                    if self.isZeroCell(x, y):
+                        return (x, y)
+        return (middleX, middleY)
+
+    # Gets the cell a new game opens on
+    def startCell(self):
+        """
+        Gets the cell views should center on when a game starts.
+
+        Postconditions:
+        - Returns `self.start`.
+        """
+        return self.start
+
+    # Zero regions are unbounded in advance, so every clear walks outward from the clicked cell
+    def clearSurroundingTiles(self, x, y):
+        """
+        Clears all cells around (x, y) that meet necessary conditions.
+
+        Preconditions:
+        - `x` and `y` are valid indices within the board.
+
+        Postconditions:
+        - Same as `BoardModel.floodClear`; the clear crosses chunk boundaries and creates chunks as it goes.
+        - Returns the set of (x, y) tuples that were newly revealed.
+        """
+        return self.floodClear(x, y)
+
+    # Iterates over every cell held in memory
+    def loadedCells(self):
+        """
+        Iterates over the cells of every chunk in memory.
+
+        Postconditions:
+        - Yields (x, y, cell) for each cell of the explored and cached chunks.
+        """
+        for chunks in (self.explored, self.chunks):
+            for (chunkX, chunkY), chunk in list(chunks.items()):
+                firstX, firstY = chunkX * CHUNK_SIZE, chunkY * CHUNK_SIZE
+                for localX, row in enumerate(chunk):
+                    for localY, cell in enumerate(row):
+                        yield firstX + localX, firstY + localY, cell
+
+    # Gets the coordinates of every revealed cell
+    def revealedPositions(self):
+        """
+        Gets every revealed cell.
+
+        Postconditions:
+        - Returns a list of (x, y) tuples for each revealed cell. Cells that were never touched are never revealed.
+        """
+        return [(x, y) for x, y, cell in self.loadedCells() if cell.is_revealed]
+
+    # An endless board has no finite plane to save
+    def revealedPlane(self):
+        raise ValueError("Endless boards cannot be saved.")
+
+    def restoreRevealed(self, plane):
+        raise ValueError("Endless boards cannot be restored.")
+
+    # Reveals mines, treasures and wrong flags in the explored area when the game ends
+    def endStateBatches(self, batch_size=None):
+        """
+        Reveals the explored part of the board at the end of the game in batches.
+
+        Preconditions:
+        - `batch_size` is None or a positive integer.
+
+        Postconditions:
+        - Same as `BoardModel.endStateBatches`, except that mine positions are not listed, so the
+          cells of every chunk in memory are visited instead.
+        """
+        batch = set()
+        for x, y, cell in self.loadedCells():
+            if cell.is_revealed:
+                continue
+            if (cell.is_treasure or cell.is_mine) and not cell.is_flagged:
+                cell.reveal()
+                batch.add((x, y))
+            elif cell.is_flagged and not cell.is_mine and not cell.is_wrong_flag:
+                cell.is_wrong_flag = True
+                batch.add((x, y))
+            if batch_size is not None and len(batch) >= batch_size:
+                yield batch
+                batch = set()
+        if batch:
+            yield batch
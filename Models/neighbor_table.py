@@ -0,0 +1,86 @@
+# Neighbor lists precomputed once per board geometry and shared by every board with that geometry
+
+# Offsets of the eight neighbors, in the order neighbor lists are returned
+DIRECTIONS = ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
+
+# Approximate memory of a table, in bytes per cell of its board
+TABLE_BYTES_PER_CELL = 170
+
+# Memory all cached tables may take together, in bytes
+CACHE_BYTE_LIMIT = 32 * 1024 * 1024
+
+# Largest board, in cells, that gets a table, so a single table takes at most about a third of the cache
+TABLE_CELL_LIMIT = 256 * 256
+
+# Tables by (rows, cols), oldest first
+_tables = {}
+
+# Builds the neighbor table for one geometry
+def _build(rows, cols):
+    """
+    Builds the neighbor lists of every cell.
+
+    Preconditions:
+    - `rows` and `cols` are positive integers.
+
+    Postconditions:
+    - Returns a list of rows; `table[x][y]` is a tuple of the (x, y) tuples around that cell, in `DIRECTIONS` order.
+    - Each coordinate tuple is allocated once and shared by all the lists that contain it.
+    """
+    coords = [[(x, y) for y in range(cols)] for x in range(rows)]
+    empty = []
+    table = []
+    for x in range(rows):
+        above = coords[x - 1] if x > 0 else empty
+        current = coords[x]
+        below = coords[x + 1] if x + 1 < rows else empty
+        table.append([
+            tuple(above[max(y - 1, 0):y + 2] + current[max(y - 1, 0):y] + current[y + 1:y + 2] + below[max(y - 1, 0):y + 2])
+            for y in range(cols)
+        ])
+    return table
+
+# Gets the shared neighbor table for a geometry
+def getNeighborTable(rows, cols):
+    """
+    Gets the neighbor table for a board with `rows` rows and `cols` columns.
+
+    Preconditions:
+    - `rows` and `cols` are positive integers.
+
+    Postconditions:
+    - Returns the table built by `_build`, building it on first use, or None if the board
+      has more than `TABLE_CELL_LIMIT` cells.
+    - Boards with the same geometry receive the same table, which must not be modified.
+    - The cached tables hold at most about `CACHE_BYTE_LIMIT` bytes; the oldest are dropped first.
+    """
+    if rows * cols > TABLE_CELL_LIMIT:
+        return None
+    key = (rows, cols)
+    table = _tables.get(key)
+    if table is None:
+        table = _build(rows, cols)
+        cells = rows * cols + sum(cachedRows * cachedCols for cachedRows, cachedCols in _tables)
+        while _tables and cells * TABLE_BYTES_PER_CELL > CACHE_BYTE_LIMIT:
+            cachedRows, cachedCols = next(iter(_tables))
+            del _tables[(cachedRows, cachedCols)]
+            cells -= cachedRows * cachedCols
+        _tables[key] = table
+    return table
+
+# Computes the neighbors of one cell, for boards too large for a table
+def computeNeighbors(rows, cols, x, y):
+    """
+    Computes the neighbors of the cell at (x, y).
+
+    Preconditions:
+    - `x` and `y` are valid indices on a board with `rows` rows and `cols` columns.
+
+    Postconditions:
+    - Returns a tuple equal to `getNeighborTable(rows, cols)[x][y]` when that table exists.
+    - Cells away from the edges are listed directly; only edge cells check their neighbors against the bounds.
+    """
+    if 0 < x < rows - 1 and 0 < y < cols - 1:
+        return ((x - 1, y - 1), (x - 1, y), (x - 1, y + 1), (x, y - 1), (x, y + 1), (x + 1, y - 1), (x + 1, y), (x + 1, y + 1))
+    return tuple((x + dirX, y + dirY) for dirX, dirY in DIRECTIONS
+                 if 0 <= x + dirX < rows and 0 <= y + dirY < cols)
@@ -4,6 +4,7 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 import tkinter as tk
 from tkinter import *
 from Models.board_model import BoardModel
+from Views.sprite_cache import getSprites
 
 class BoardView:
     def __init__(self, board, root, controller=None):
@@ -20,6 +21,7 @@ class BoardView:
         - `self.controller` is set to the provided `controller`.
         - `self.window` is created as a Toplevel window for the game.
         - `self.tiles` is initialized as an empty dictionary.
+        - `self.dirty_tiles` is initialized as an empty set.
         - `self.status_label` is initialized as None.
         """
         # Defines controller and game board
@@ -31,6 +33,8 @@ class BoardView:
         self.frame = None
 
         self.tiles = {}
+        self.dirty_tiles = set()
+        self.ui_size = None
         self.status_label = None
     
     # Builds the graphical UI for the game
@@ -53,15 +57,10 @@ class BoardView:
         self.frame = tk.Frame(self.window)
         self.frame.pack()
 
-        self.images = {
-            "plain": PhotoImage(file = "images/tile_plain.gif"),
-            "clicked": PhotoImage(file = "images/tile_clicked.gif"),
-            "mine": PhotoImage(file = "images/tile_mine.gif"),
-            "treasure": PhotoImage(file = "images/tile_treasure.gif"),
-            "flag": PhotoImage(file = "images/tile_flag.gif"),
-            "wrong": PhotoImage(file = "images/tile_wrong.gif"),
-            "numbers": [PhotoImage(file = f"images/tile_{i}.gif") for i in range(1, 9)]
-        }
+        self.loadImages()
+        self.tiles = {}
+        self.dirty_tiles = set()
+        self.ui_size = (self.board.rows, self.board.cols)
      
         # Generates tiles for the game board
         for x in range(self.board.rows):
@@ -78,6 +77,46 @@ class BoardView:
         self.status_label = tk.Label(self.frame, text="Mines: {self.board.mines} Time: 0")
         self.status_label.grid(row=self.board.rows + 1, column=0, columnspan=self.board.cols)
 
+    # Loads the tile images
+    def loadImages(self):
+        """
+        Loads the tile images used to draw the board.
+
+        Preconditions:
+        - The `images` directory is reachable from the working directory.
+
+        Postconditions:
+        - `self.images` maps each tile state to a PhotoImage, with "numbers" holding the images for 1 to 8.
+        - The images come from the process-wide sprite cache, so they are only decoded once.
+        """
+        self.images = getSprites(self.window)
+
+    # Chooses the image for a cell according to its state
+    def tileImage(self, cell):
+        """
+        Gets the image that represents a cell's current state.
+
+        Preconditions:
+        - `self.images` has been loaded.
+        - `cell` has `is_revealed`, `is_mine`, `is_treasure`, `is_flagged`, and `adjacent_mines` attributes.
+
+        Postconditions:
+        - Returns the PhotoImage to display for the cell.
+        """
+        if cell.is_revealed:
+            if cell.is_mine:
+                return self.images["mine"]
+            elif cell.is_treasure:
+                return self.images["treasure"]
+            elif cell.adjacent_mines > 0:
+                return self.images["numbers"][cell.adjacent_mines - 1]
+            else:
+                return self.images["clicked"]
+        elif cell.is_flagged:
+            return self.images["flag"]
+        else:
+            return self.images["plain"]
+
     # Updates cells according to their state
     def updateCell(self, x, y):
         """
@@ -93,23 +132,48 @@ class BoardView:
         if not self.window.winfo_exists():
             return
 
-        cell = self.board.grid[x][y]
-        button = self.tiles[x][y]
-
-        if cell.is_revealed:
-            if cell.is_mine:
-                button.config(image=self.images["mine"])
-            elif cell.is_treasure:
-                button.config(image=self.images["treasure"])
-            elif cell.adjacent_mines > 0:
-                button.config(image=self.images["numbers"][cell.adjacent_mines - 1])
-            else:
-                button.config(image=self.images["clicked"])
-        elif cell.is_flagged:
-            button.config(image=self.images["flag"])
+        image = self.tileImage(self.board.grid[x][y])
+        self.tiles[x][y].config(image=image)
+        if image is self.images["plain"]:
+            self.dirty_tiles.discard((x, y))
         else:
-            button.config(image=self.images["plain"])
+            self.dirty_tiles.add((x, y))
+
+    # Resets the board for a new game, reusing the existing widgets when possible
+    def resetUI(self):
+        """
+        Resets the graphical UI for a new game on `self.board`.
+
+        Preconditions:
+        - `self.board` has been set up for the new game.
+
+        Postconditions:
+        - If the board dimensions are unchanged, the existing buttons are kept and only tiles
+          that are not plain are reset.
+        - Otherwise the UI is rebuilt with `generateUI`.
+        """
+        if self.frame is None or not self.frame.winfo_exists() or self.ui_size != (self.board.rows, self.board.cols):
+            self.generateUI()
+            return
+
+        for x, y in self.dirty_tiles:
+            self.tiles[x][y].config(image=self.images["plain"])
+        self.dirty_tiles = set()
     
+    # Updates a collection of cells, such as the change set returned by a board operation
+    def updateCells(self, cells):
+        """
+        Updates the display of every given cell.
+
+        Preconditions:
+        - `cells` is an iterable of valid (x, y) tuples.
+
+        Postconditions:
+        - `updateCell` has been called for each cell and no others.
+        """
+        for x, y in cells:
+            self.updateCell(x, y)
+
     # Updates elements of the game status including the remaining mines and time elapsed
     def refreshLabel(self, remaining_mines, time_elapsed):
         """
@@ -0,0 +1,348 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import tkinter as tk
+from Views.board_view import BoardView
+from Views.sprite_cache import ZOOM_LEVELS, getSprites, tileSize
+
+# Largest canvas drawn on screen before the board scrolls
+MAX_VIEWPORT_WIDTH = 800
+MAX_VIEWPORT_HEIGHT = 600
+
+# Boards with more cells than this use a CanvasBoardView instead of one button per cell
+BUTTON_GRID_LIMIT = 1024
+
+class CanvasBoardView(BoardView):
+    """
+    Graphical view that draws the board on a single scrollable Canvas.
+    Only the cells inside the visible viewport have canvas items.
+    """
+    def __init__(self, board, root, controller=None):
+        """
+        Initializes the CanvasBoardView.
+
+        Preconditions:
+        - Same as `BoardView.__init__`.
+
+        Postconditions:
+        - `self.canvas` is None until `generateUI` is called.
+        - `self.items` maps each drawn (x, y) cell to its canvas image item.
+        - `self.zoom` starts at 1 and persists across restarts.
+        """
+        super().__init__(board, root, controller)
+        self.canvas = None
+        self.items = {}
+        self.visible = (0, 0, 0, 0)
+        self.zoom = 1
+        self.tile_size = tileSize(self.zoom)
+
+    # Builds the canvas, scrollbars and status label
+    def generateUI(self):
+        """
+        Builds the graphical UI for the game board.
+
+        Preconditions:
+        - `self.board` contains valid rows and columns.
+
+        Postconditions:
+        - If `self.frame` exists, it is destroyed before creating a new one.
+        - `self.canvas` covers the whole board as its scroll region, with scrollbars.
+        - Left and right clicks on the canvas are mapped to cells and forwarded to the controller.
+        - A `status_label` is added to display the game status.
+        """
+        if self.frame is not None and self.frame.winfo_exists():
+            self.frame.destroy()
+
+        self.frame = tk.Frame(self.window)
+        self.frame.pack(fill=tk.BOTH, expand=True)
+        self.frame.rowconfigure(0, weight=1)
+        self.frame.columnconfigure(0, weight=1)
+
+        self.loadImages()
+        self.items = {}
+        self.visible = (0, 0, 0, 0)
+        self.ui_size = (self.board.rows, self.board.cols)
+
+        width = self.board.cols * self.tile_size
+        height = self.board.rows * self.tile_size
+        self.canvas = tk.Canvas(
+            self.frame,
+            width=min(width, MAX_VIEWPORT_WIDTH),
+            height=min(height, MAX_VIEWPORT_HEIGHT),
+            scrollregion=(0, 0, width, height),
+            highlightthickness=0,
+            xscrollincrement=self.tile_size,
+            yscrollincrement=self.tile_size
+        )
+        xScroll = tk.Scrollbar(self.frame, orient=tk.HORIZONTAL, command=self.canvas.xview)
+        yScroll = tk.Scrollbar(self.frame, orient=tk.VERTICAL, command=self.canvas.yview)
+        self.canvas.config(xscrollcommand=self.scrollWrapper(xScroll), yscrollcommand=self.scrollWrapper(yScroll))
+
+        self.canvas.grid(row=0, column=0, sticky="nsew")
+        yScroll.grid(row=0, column=1, sticky="ns")
+        xScroll.grid(row=1, column=0, sticky="ew")
+
+        self.canvas.bind("<Button-1>", self.onCanvasClick)
+        self.canvas.bind("<Button-3>", self.onCanvasRightClick)
+        self.canvas.bind("<Configure>", lambda event: self.drawViewport())
+        self.canvas.bind("<MouseWheel>", lambda event: self.canvas.yview_scroll(-1 if event.delta > 0 else 1, "units"))
+        self.canvas.bind("<Shift-MouseWheel>", lambda event: self.canvas.xview_scroll(-1 if event.delta > 0 else 1, "units"))
+        self.canvas.bind("<Button-4>", lambda event: self.canvas.yview_scroll(-1, "units"))
+        self.canvas.bind("<Button-5>", lambda event: self.canvas.yview_scroll(1, "units"))
+        self.canvas.bind("<Control-MouseWheel>", lambda event: self.stepZoom(1 if event.delta > 0 else -1))
+        self.canvas.bind("<Control-Button-4>", lambda event: self.stepZoom(1))
+        self.canvas.bind("<Control-Button-5>", lambda event: self.stepZoom(-1))
+        self.window.bind("<plus>", lambda event: self.stepZoom(1))
+        self.window.bind("<minus>", lambda event: self.stepZoom(-1))
+        self.window.bind("<Up>", lambda event: self.canvas.yview_scroll(-1, "units"))
+        self.window.bind("<Down>", lambda event: self.canvas.yview_scroll(1, "units"))
+        self.window.bind("<Left>", lambda event: self.canvas.xview_scroll(-1, "units"))
+        self.window.bind("<Right>", lambda event: self.canvas.xview_scroll(1, "units"))
+
+        self.status_label = tk.Label(self.frame, text=f"Mines: {self.board.mines} Time: 0")
+        self.status_label.grid(row=2, column=0, columnspan=2)
+
+        self.drawViewport()
+        self.centerOnStart()
+
+    # Resets the board for a new game, reusing the canvas when possible
+    def resetUI(self):
+        """
+        Resets the graphical UI for a new game on `self.board`.
+
+        Preconditions:
+        - `self.board` has been set up for the new game.
+
+        Postconditions:
+        - If the board dimensions are unchanged, the canvas, scrollbars and bindings are kept
+          and only the items in the viewport are redrawn.
+        - Otherwise the UI is rebuilt with `generateUI`.
+        - The view moves to the board's start cell, if it has one.
+        """
+        if self.canvas is None or not self.canvas.winfo_exists() or self.ui_size != (self.board.rows, self.board.cols):
+            self.generateUI()
+            return
+
+        plain = self.images["plain"]
+        for item in self.items.values():
+            self.canvas.itemconfig(item, image=plain)
+        self.centerOnStart()
+
+    # Loads the shared tile images for the current zoom level
+    def loadImages(self):
+        """
+        Loads the tile images used to draw the board at the current zoom.
+
+        Postconditions:
+        - `self.images` is the cached sprite set for `self.zoom`.
+        - `self.tile_size` is the pixel size of one tile at `self.zoom`.
+        """
+        self.images = getSprites(self.window, self.zoom)
+        self.tile_size = tileSize(self.zoom)
+
+    # Moves to the next or previous zoom level
+    def stepZoom(self, step):
+        """
+        Zooms in or out by one level.
+
+        Preconditions:
+        - `step` is 1 to zoom in or -1 to zoom out.
+
+        Postconditions:
+        - `setZoom` is called with the neighboring entry of `ZOOM_LEVELS`, if there is one.
+        """
+        index = ZOOM_LEVELS.index(self.zoom) + step
+        if 0 <= index < len(ZOOM_LEVELS):
+            self.setZoom(ZOOM_LEVELS[index])
+
+    # Redraws the board at another zoom level
+    def setZoom(self, zoom):
+        """
+        Changes the zoom level of the board.
+
+        Preconditions:
+        - `zoom` is one of `ZOOM_LEVELS`.
+
+        Postconditions:
+        - The canvas uses the pre-scaled sprites for `zoom`; no image is decoded or resampled.
+        - The cell at the center of the viewport stays centered where possible.
+        """
+        if zoom == self.zoom or self.canvas is None:
+            return
+        firstRow, lastRow, firstCol, lastCol = self.visibleRange()
+        centerRow = (firstRow + lastRow) / 2
+        centerCol = (firstCol + lastCol) / 2
+
+        self.zoom = zoom
+        self.loadImages()
+        self.canvas.delete("all")
+        self.items = {}
+        self.visible = (0, 0, 0, 0)
+
+        width = self.board.cols * self.tile_size
+        height = self.board.rows * self.tile_size
+        self.canvas.config(
+            scrollregion=(0, 0, width, height),
+            xscrollincrement=self.tile_size,
+            yscrollincrement=self.tile_size
+        )
+        self.centerOn(centerRow, centerCol)
+
+    # Scrolls so a cell is in the middle of the viewport
+    def centerOn(self, x, y):
+        """
+        Scrolls the canvas to a cell.
+
+        Preconditions:
+        - `self.canvas` exists.
+
+        Postconditions:
+        - The cell at (x, y) is at the center of the viewport where the board's edges allow it,
+          and the newly visible cells are drawn.
+        """
+        halfRows = max(self.canvas.winfo_height(), int(self.canvas.cget("height"))) / self.tile_size / 2
+        halfCols = max(self.canvas.winfo_width(), int(self.canvas.cget("width"))) / self.tile_size / 2
+        self.canvas.yview_moveto(max(x - halfRows, 0) / self.board.rows)
+        self.canvas.xview_moveto(max(y - halfCols, 0) / self.board.cols)
+        self.drawViewport()
+
+    # Scrolls to the cell a new game opens on
+    def centerOnStart(self):
+        """
+        Scrolls the canvas to the board's start cell.
+
+        Postconditions:
+        - Calls `centerOn` with `self.board.startCell()`, unless it is None.
+        """
+        start = self.board.startCell()
+        if start is not None:
+            self.centerOn(*start)
+
+    # Keeps a scrollbar in sync and redraws the newly visible cells
+    def scrollWrapper(self, scrollbar):
+        """
+        Creates the scroll command for one axis of the canvas.
+
+        Preconditions:
+        - `scrollbar` is the Scrollbar for that axis.
+
+        Postconditions:
+        - Returns a function that updates `scrollbar` and then redraws the viewport.
+        """
+        def onScroll(first, last):
+            scrollbar.set(first, last)
+            self.drawViewport()
+        return onScroll
+
+    # Gets the range of cells currently visible on the canvas
+    def visibleRange(self):
+        """
+        Gets the rows and columns that intersect the visible area of the canvas.
+
+        Preconditions:
+        - `self.canvas` exists.
+
+        Postconditions:
+        - Returns (first_row, last_row, first_col, last_col), with the last values exclusive and clamped to the board.
+        """
+        left = int(self.canvas.canvasx(0))
+        top = int(self.canvas.canvasy(0))
+        width = max(self.canvas.winfo_width(), int(self.canvas.cget("width")))
+        height = max(self.canvas.winfo_height(), int(self.canvas.cget("height")))
+
+        firstRow = max(top // self.tile_size, 0)
+        firstCol = max(left // self.tile_size, 0)
+        lastRow = min((top + height) // self.tile_size + 1, self.board.rows)
+        lastCol = min((left + width) // self.tile_size + 1, self.board.cols)
+        return firstRow, lastRow, firstCol, lastCol
+
+    # Creates items for cells that scrolled into view and deletes the rest
+    def drawViewport(self):
+        """
+        Draws the cells inside the visible viewport.
+
+        Preconditions:
+        - `self.canvas` exists.
+
+        Postconditions:
+        - Every visible cell has exactly one image item showing its current state.
+        - Cells outside the viewport have no canvas items.
+        """
+        if self.canvas is None or not self.canvas.winfo_exists():
+            return
+
+        visible = self.visibleRange()
+        if visible == self.visible:
+            return
+        firstRow, lastRow, firstCol, lastCol = visible
+        self.visible = visible
+
+        for (x, y) in list(self.items):
+            if not (firstRow <= x < lastRow and firstCol <= y < lastCol):
+                self.canvas.delete(self.items.pop((x, y)))
+
+        grid = self.board.grid
+        for x in range(firstRow, lastRow):
+            for y in range(firstCol, lastCol):
+                if (x, y) not in self.items:
+                    self.items[(x, y)] = self.canvas.create_image(
+                        y * self.tile_size, x * self.tile_size, image=self.tileImage(grid[x][y]), anchor=tk.NW
+                    )
+
+    # Updates cells according to their state
+    def updateCell(self, x, y):
+        """
+        Updates the display of a cell based on its current state.
+
+        Preconditions:
+        - `x` and `y` are valid indices within the grid dimensions.
+
+        Postconditions:
+        - If the cell is in the viewport, its canvas item shows the cell's current state.
+        - Cells outside the viewport are drawn when they are scrolled into view.
+        """
+        item = self.items.get((x, y))
+        if item is None or not self.window.winfo_exists():
+            return
+        self.canvas.itemconfig(item, image=self.tileImage(self.board.grid[x][y]))
+
+    # Maps a pixel on the canvas to the cell under it
+    def cellAt(self, event):
+        """
+        Gets the cell under a mouse event.
+
+        Preconditions:
+        - `event` is a Tkinter mouse event on `self.canvas`.
+
+        Postconditions:
+        - Returns the (x, y) cell under the pointer, or None if it is outside the board.
+        """
+        x = int(self.canvas.canvasy(event.y)) // self.tile_size
+        y = int(self.canvas.canvasx(event.x)) // self.tile_size
+        if 0 <= x < self.board.rows and 0 <= y < self.board.cols:
+            return x, y
+        return None
+
+    # Handles left clicks anywhere on the canvas
+    def onCanvasClick(self, event):
+        """
+        Forwards a left click on the canvas to the controller.
+
+        Postconditions:
+        - Calls `self.controller.onClick(x, y)` for the cell under the pointer, if any.
+        """
+        cell = self.cellAt(event)
+        if cell is not None:
+            self.controller.onClick(*cell)
+
+    # Handles right clicks anywhere on the canvas
+    def onCanvasRightClick(self, event):
+        """
+        Forwards a right click on the canvas to the controller.
+
+        Postconditions:
+        - Calls `self.controller.onRightClick(x, y)` for the cell under the pointer, if any.
+        """
+        cell = self.cellAt(event)
+        if cell is not None:
+            self.controller.onRightClick(*cell)
@@ -0,0 +1,78 @@
+# Process-wide cache of the tile images, decoded once and pre-scaled to every zoom level
+from tkinter import PhotoImage
+
+# Size in pixels of one unscaled tile image
+TILE_SIZE = 16
+
+# Zoom factors the tiles are pre-scaled to. Factors below 1 subsample, factors above 1 zoom.
+ZOOM_LEVELS = (0.5, 1, 2, 3)
+
+# Sprite sets keyed by Tcl interpreter, then by zoom factor
+_sprites = {}
+
+def _scale(image, zoom):
+    """
+    Scales a tile image by a zoom factor.
+
+    Preconditions:
+    - `zoom` is one of `ZOOM_LEVELS`.
+
+    Postconditions:
+    - Returns `image` itself for a factor of 1, otherwise a new PhotoImage of the scaled tile.
+    """
+    if zoom == 1:
+        return image
+    if zoom > 1:
+        return image.zoom(int(zoom))
+    return image.subsample(int(round(1 / zoom)))
+
+def _load(master):
+    """
+    Decodes every tile image and builds the scaled copies.
+
+    Preconditions:
+    - `master` is a Tkinter widget whose interpreter will own the images.
+    - The `images` directory is reachable from the working directory.
+
+    Postconditions:
+    - Returns a dictionary mapping each zoom factor to a sprite set shaped like `BoardView.images`.
+    """
+    names = ["plain", "clicked", "mine", "treasure", "flag", "wrong"]
+    base = {name: PhotoImage(master=master, file=f"images/tile_{name}.gif") for name in names}
+    base["numbers"] = [PhotoImage(master=master, file=f"images/tile_{i}.gif") for i in range(1, 9)]
+
+    levels = {}
+    for zoom in ZOOM_LEVELS:
+        sprites = {name: _scale(base[name], zoom) for name in names}
+        sprites["numbers"] = [_scale(image, zoom) for image in base["numbers"]]
+        levels[zoom] = sprites
+    return levels
+
+def getSprites(master, zoom=1):
+    """
+    Gets the shared tile images for a zoom level.
+
+    Preconditions:
+    - `master` is any widget of the Tkinter application.
+    - `zoom` is one of `ZOOM_LEVELS`.
+
+    Postconditions:
+    - The images are decoded and scaled at most once per interpreter, on the first call.
+    - Returns the sprite set for `zoom`, shared with every other caller.
+    """
+    interpreter = master.tk
+    if interpreter not in _sprites:
+        _sprites[interpreter] = _load(master)
+    return _sprites[interpreter][zoom]
+
+def tileSize(zoom=1):
+    """
+    Gets the size in pixels of a tile at a zoom level.
+
+    Preconditions:
+    - `zoom` is one of `ZOOM_LEVELS`.
+
+    Postconditions:
+    - Returns the width and height of one scaled tile.
+    """
+    return int(TILE_SIZE * zoom)
@@ -31,7 +31,7 @@ class TestingView:
         - Returns the file path to the selected CSV file if the user selects a file.
         - Displays an error message and returns None if no file is selected.
         """
-        file_path = filedialog.askopenfilename(filetypes=[("CSV files", "*.csv")], parent=root)
+        file_path = filedialog.askopenfilename(filetypes=[("Board files", "*.csv *.msb"), ("CSV files", "*.csv"), ("Packed board files", "*.msb")], parent=root)
         if file_path:
             return file_path
         else:
@@ -1,21 +1,215 @@
+import os
+import sys
+import shutil
+
+# Lines written above the first board row: a blank line, the title, the column header and the top border
+HEADER_LINES = 4
+
+# Most rows and columns shown at once; larger boards are shown through a viewport that can be moved
+VIEWPORT_ROWS = 30
+VIEWPORT_COLS = 40
+
 class TextBoardView:
     """
     Represents a text-based view for a Minesweeper game.
     """
-    def __init__(self, board, controller=None):
+    def __init__(self, board, controller=None, stream=None, ansi=None, viewport=None):
         """
         Initializes the TextBoardView.
 
         Preconditions:
         - `board` is an instance of BoardModel.
         - `controller` is either None or an instance of GameController.
+        - `stream` is None or a writable text stream.
+        - `ansi` is None to detect terminal support, or a boolean to force it.
+        - `viewport` is None, or the (rows, cols) shown at once as positive integers.
 
         Postconditions:
         - `self.board` is set to the provided `board`.
         - `self.controller` is set to the provided `controller`.
+        - Frames are written to `stream`, or to the current `sys.stdout` if it is None.
+        - `self.ansi` is True if changed cells can be redrawn in place with ANSI escape codes.
+        - `self.top` and `self.left` are the first row and column shown, starting at the top-left corner.
+        - `self.viewport_rows` and `self.viewport_cols` bound the cells shown at once: `viewport`, or
+          `VIEWPORT_ROWS` by `VIEWPORT_COLS` if it is None.
+        - `self.lines_below` counts the lines written under the last frame, so in-place redraws stop once they could have scrolled it.
         """
         self.board = board
         self.controller = controller
+        self.stream = stream
+        self.ansi = self._supportsAnsi() if ansi is None else ansi
+        self.viewport_rows, self.viewport_cols = viewport if viewport is not None else (VIEWPORT_ROWS, VIEWPORT_COLS)
+        self.top = 0
+        self.left = 0
+        self.last_rows = None
+        self.last_origin = None
+        self.last_frame = None
+        self.lines_below = 0
+
+    def _supportsAnsi(self):
+        """
+        Determines if the output stream is a terminal that understands ANSI cursor movement.
+
+        Postconditions:
+        - Returns True for a TTY whose TERM is set and not "dumb", otherwise False.
+        """
+        stream = self.stream if self.stream is not None else sys.stdout
+        isatty = getattr(stream, "isatty", None)
+        if os.name == "nt" or isatty is None or not isatty():
+            return False
+        return os.environ.get("TERM", "dumb") != "dumb"
+
+    def _write(self, text):
+        """
+        Writes text to the output stream in a single call and flushes it.
+
+        Postconditions:
+        - `text` is on the output stream.
+        """
+        stream = self.stream if self.stream is not None else sys.stdout
+        stream.write(text)
+        stream.flush()
+
+    def _screenLines(self, text):
+        """
+        Counts the terminal lines taken by text.
+
+        Postconditions:
+        - Returns the number of lines `text` occupies once followed by a newline, counting lines that wrap at the terminal width.
+        """
+        columns = max(1, shutil.get_terminal_size().columns)
+        return sum(max(1, -(-len(line) // columns)) for line in text.split("\n"))
+
+    def message(self, text):
+        """
+        Writes a line of text under the board.
+
+        Postconditions:
+        - `text` is written followed by a newline, and the lines it takes are counted in `self.lines_below`.
+        """
+        self._write(text + "\n")
+        self.lines_below += self._screenLines(text)
+
+    def ask(self, prompt):
+        """
+        Reads a line from the player under the board.
+
+        Postconditions:
+        - Returns the answer with surrounding whitespace removed.
+        - The prompt and the echoed answer are counted in `self.lines_below`.
+        """
+        answer = input(prompt)
+        self.lines_below += self._screenLines(prompt + answer)
+        return answer.strip()
+
+    def viewSize(self):
+        """
+        Gets the size of the viewport.
+
+        Postconditions:
+        - Returns (rows, cols) shown at once: the whole board, or at most `self.viewport_rows` by `self.viewport_cols`.
+        """
+        return min(self.board.rows, self.viewport_rows), min(self.board.cols, self.viewport_cols)
+
+    def centerOn(self, x, y):
+        """
+        Moves the viewport so the cell at (x, y) is as close to its center as the board's edges allow.
+
+        Postconditions:
+        - `self.top` and `self.left` keep the whole viewport on the board.
+        """
+        height, width = self.viewSize()
+        self.top = min(max(x - height // 2, 0), self.board.rows - height)
+        self.left = min(max(y - width // 2, 0), self.board.cols - width)
+
+    def _labelWidth(self):
+        """
+        Gets the width of the row labels.
+
+        Postconditions:
+        - Returns the number of characters needed for the largest row number shown, and at least 2.
+        """
+        return max(2, len(str(self.top + self.viewSize()[0] - 1)))
+
+    def _renderRows(self):
+        """
+        Builds the display character of every cell in the viewport.
+
+        Postconditions:
+        - Returns a list with one list of characters per row shown.
+        """
+        grid = self.board.grid
+        height, width = self.viewSize()
+        if width == self.board.cols:
+            return [[self._cellDisplay(cell) for cell in grid[x]] for x in range(self.top, self.top + height)]
+        columns = range(self.left, self.left + width)
+        return [[self._cellDisplay(row[y]) for y in columns] for row in (grid[x] for x in range(self.top, self.top + height))]
+
+    def _frameText(self, rows):
+        """
+        Builds the complete text of one frame.
+
+        Preconditions:
+        - `rows` was returned by `_renderRows`.
+
+        Postconditions:
+        - Returns the board, its title, column header and borders as one string.
+        - When only part of the board is shown, the title gives the rows and columns shown
+          and the header gives the last digit of each column number.
+        """
+        height, width = self.viewSize()
+        label = self._labelWidth()
+        border = " " * label + "+" + "---" * width + "+"
+        columns = range(self.left, self.left + width)
+        if (height, width) == (self.board.rows, self.board.cols):
+            title = "Current Board:"
+            header = " ".join([f"{col}" for col in columns])
+        else:
+            title = (f"Current Board (rows {self.top}-{self.top + height - 1}, "
+                     f"columns {self.left}-{self.left + width - 1}):")
+            header = " ".join([f"{col % 10}" for col in columns])
+        lines = ["", title, " " * (label + 1) + header, border]
+        lines.extend(f"{x:{label}}|" + " ".join(row) + "|" for x, row in enumerate(rows, self.top))
+        lines.append(border)
+        return "\n".join(lines) + "\n"
+
+    def _canRedrawInPlace(self):
+        """
+        Determines if the last frame can be patched instead of written again.
+
+        Postconditions:
+        - Returns True if ANSI output is enabled, a frame of the same size is on screen,
+          and the frame plus every line written under it since still fit in the terminal,
+          so nothing has scrolled the frame away from the top of the screen.
+        """
+        if not self.ansi or self.last_rows is None or self.last_origin != (self.top, self.left):
+            return False
+        height, width = self.viewSize()
+        if len(self.last_rows) != height or len(self.last_rows[0]) != width:
+            return False
+        size = shutil.get_terminal_size()
+        return size.lines > HEADER_LINES + height + 1 + self.lines_below and size.columns >= 2 * width + self._labelWidth() + 2
+
+    def _cellCode(self, x, y, char):
+        """
+        Builds the escape sequence that redraws one cell in place.
+
+        Preconditions:
+        - (x, y) is relative to the top-left cell of the viewport.
+
+        Postconditions:
+        - Returns a string that moves the cursor to cell (x, y) and writes `char`.
+        """
+        return f"\x1b[{HEADER_LINES + 1 + x};{self._labelWidth() + 2 + 2 * y}H{char}"
+
+    def _cursorBelowBoard(self):
+        """
+        Builds the escape sequence that parks the cursor under the board.
+
+        Postconditions:
+        - Returns a string that moves the cursor to the line after the bottom border and clears the rest of the screen.
+        """
+        return f"\x1b[{HEADER_LINES + self.viewSize()[0] + 2};1H\x1b[J"
 
     def displayBoard(self):
         """
@@ -26,17 +220,85 @@ class TextBoardView:
         - Each cell in `self.board.grid` has `is_revealed`, `is_mine`, `is_flagged`, and `adjacent_mines` attributes.
 
         Postconditions:
-        - Outputs the current board state to the console.
+        - Outputs the current board state to the console with a single write.
+        - On an ANSI terminal only cells that differ from the last frame are redrawn.
+        - Otherwise the frame is written in full, unless it is identical to the last one.
+        """
+        rows = self._renderRows()
+
+        if self._canRedrawInPlace():
+            codes = [
+                self._cellCode(x, y, char)
+                for x, (row, lastRow) in enumerate(zip(rows, self.last_rows))
+                if row != lastRow
+                for y, char in enumerate(row)
+                if char != lastRow[y]
+            ]
+            if codes:
+                self._write("".join(codes) + self._cursorBelowBoard())
+                self.lines_below = 0
+            self.last_frame = None
+        else:
+            frame = self._frameText(rows)
+            if frame != self.last_frame:
+                self._write("\x1b[H\x1b[2J" + frame if self.ansi else frame)
+                self.lines_below = 0
+            self.last_frame = frame
+
+        self.last_rows = rows
+        self.last_origin = (self.top, self.left)
+
+    def updateCells(self, cells):
         """
-        print("\nCurrent Board:")
-        print("   " + " ".join([f"{col}" for col in range(self.board.cols)]))
-        print("  +" + "---" * self.board.cols + "+")
+        Redraws the board after the given cells changed.
 
-        for x in range(self.board.rows):
-            row = [self._cellDisplay(self.board.grid[x][y]) for y in range(self.board.cols)]
-            print(f"{x:2}|" + " ".join(row) + "|")
+        Preconditions:
+        - `cells` is an iterable of valid (x, y) tuples.
 
-        print("  +" + "---" * self.board.cols + "+")
+        Postconditions:
+        - On an ANSI terminal with a frame on screen, only the given cells are rewritten.
+        - Otherwise the board is redisplayed if any cell changed.
+        - Cells outside the viewport are skipped.
+        """
+        if not cells:
+            return
+        if not self._canRedrawInPlace():
+            self.displayBoard()
+            return
+
+        codes = []
+        grid = self.board.grid
+        height, width = self.viewSize()
+        for x, y in cells:
+            localX, localY = x - self.top, y - self.left
+            if not (0 <= localX < height and 0 <= localY < width):
+                continue
+            char = self._cellDisplay(grid[x][y])
+            if char != self.last_rows[localX][localY]:
+                self.last_rows[localX][localY] = char
+                codes.append(self._cellCode(localX, localY, char))
+        if codes:
+            self._write("".join(codes) + self._cursorBelowBoard())
+            self.lines_below = 0
+        self.last_frame = None
+
+    def resetUI(self):
+        """
+        Shows a new game.
+
+        Preconditions:
+        - `self.board` has been set up for the new game.
+
+        Postconditions:
+        - The viewport is centered on the board's start cell, or at the top-left corner if it has none.
+        - The board is displayed.
+        """
+        start = self.board.startCell()
+        if start is None:
+            self.top, self.left = 0, 0
+        else:
+            self.centerOn(*start)
+        self.displayBoard()
 
     def _cellDisplay(self, cell):
         """
@@ -69,17 +331,18 @@ class TextBoardView:
         Prompts the user to enter a move, processes it, and forwards it to the controller.
 
         Preconditions:
-        - The user input follows the format "R x y" (reveal) or "F x y" (flag) or "exit".
+        - The user input follows the format "R x y" (reveal), "F x y" (flag), "G x y" (go to) or "exit".
 
         Postconditions:
         - Calls `self.controller.onClick(x, y)` if the user enters "R x y".
         - Calls `self.controller.onRightClick(x, y)` if the user enters "F x y".
+        - Centers the viewport on (x, y) and redisplays the board if the user enters "G x y".
         - Exits the game if the user enters "exit".
         - Prints an error message if the input format is invalid.
         """
-        move = input("Enter your move (e.g., 'R 1 2' for reveal or 'F 1 2' for flag): ").strip()
+        move = self.ask("Enter your move (e.g., 'R 1 2' for reveal, 'F 1 2' for flag or 'G 1 2' to move the view): ")
         if move == "exit":
-            print("Thanks for playing! Exiting the game...")
+            self.message("Thanks for playing! Exiting the game...")
             exit()
         parts = move.split()
         if len(parts) == 3:
@@ -90,12 +353,15 @@ class TextBoardView:
                     self.controller.onClick(x, y)
                 elif action == "F":
                     self.controller.onRightClick(x, y)
+                elif action == "G":
+                    self.centerOn(x, y)
+                    self.displayBoard()
                 else:
-                    print("Invalid action. Use 'R' to reveal or 'F' to flag.")
+                    self.message("Invalid action. Use 'R' to reveal, 'F' to flag or 'G' to move the view.")
             except ValueError:
-                print("Invalid input. Please enter numeric coordinates.")
+                self.message("Invalid input. Please enter numeric coordinates.")
         else:
-            print("Invalid input format. Use 'R x y' or 'F x y'.")
+            self.message("Invalid input format. Use 'R x y' or 'F x y'.")
 
     def gameOver(self, won):
         """
@@ -111,15 +377,12 @@ class TextBoardView:
         - Exits the game if the user chooses not to replay.
         """
         self.displayBoard()
-        if won:
-            print("Congratulations! You Win!")
-        else:
-            print("Game Over! You Lose.")
-        replay = input("Play again? (y/n): ").strip().lower()
+        self.message("Congratulations! You Win!" if won else "Game Over! You Lose.")
+        replay = self.ask("Play again? (y/n): ").lower()
         if replay == "y":
             self.controller.restart()
         else:
-            print("Thanks for playing!")
+            self.message("Thanks for playing!")
             exit()
 
     def refresh(self):
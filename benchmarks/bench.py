@@ -0,0 +1,288 @@
+# Micro and macro benchmarks for the model, controller and text view hot paths
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import argparse
+import io
+import json
+import platform
+import statistics
+import time
+
+from Models.board_model import BoardModel
+from Controllers.game_controller import GameController
+from Views.text_board_view import TextBoardView
+
+# Board sides measured by default; every board is square
+DEFAULT_SIZES = (8, 32, 128, 512, 2048)
+
+# Fraction of cells that are mines
+MINE_DENSITY = 0.15
+
+# Minimum repeats per measurement, and the wall time, including preparation, after which no further repeats are started
+MIN_REPEATS = 3
+TIME_BUDGET = 1.0
+
+class NullView:
+    """
+    View that draws nothing, so controller benchmarks measure only game logic.
+    """
+    def __init__(self):
+        self.controller = None
+
+    def updateCells(self, cells):
+        pass
+
+    def displayBoard(self):
+        pass
+
+    def refreshLabel(self, remaining_mines, time_elapsed):
+        pass
+
+def makeBoard(size, seed, backend, density=MINE_DENSITY):
+    """
+    Creates a seeded square board without setting it up.
+
+    Preconditions:
+    - `backend` is "list", "array" or "bit".
+
+    Postconditions:
+    - Returns a BoardModel, ArrayBoardModel or BitBoardModel with `size` rows and columns and one treasure.
+    """
+    mines = max(1, int(size * size * density))
+    if backend == "array":
+        from Models.array_board_model import ArrayBoardModel
+        return ArrayBoardModel(size, size, mines, 1, seed=seed)
+    if backend == "bit":
+        from Models.bit_board_model import BitBoardModel
+        return BitBoardModel(size, size, mines, 1, seed=seed)
+    return BoardModel(size, size, mines, 1, seed=seed)
+
+def reseed(board, seed):
+    """
+    Resets a board's random generator so its next setup repeats the same game.
+
+    Postconditions:
+    - Returns `board`.
+    """
+    board.rng.seed(seed)
+    return board
+
+def findCell(board, predicate):
+    """
+    Finds the first cell in row-major order matching a predicate.
+
+    Postconditions:
+    - Returns (x, y), or None if no cell matches.
+    """
+    for x in range(board.rows):
+        for y in range(board.cols):
+            if predicate(board.grid[x][y]):
+                return x, y
+    return None
+
+def measure(prepare, run):
+    """
+    Times `run` repeatedly on fresh state from `prepare`.
+
+    Preconditions:
+    - `prepare()` returns the state passed to `run(state)`; only `run` is timed.
+
+    Postconditions:
+    - Returns a list of timings in seconds, at least `MIN_REPEATS` long.
+    """
+    timings = []
+    began = time.perf_counter()
+    while len(timings) < MIN_REPEATS or time.perf_counter() - began < TIME_BUDGET:
+        state = prepare()
+        start = time.perf_counter()
+        run(state)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+# Board generation, including zero region labelling
+def benchSetup(size, seed, backend):
+    board = makeBoard(size, seed, backend)
+    return measure(lambda: reseed(board, seed), lambda board: board.setup())
+
+# 10000 neighbor lookups at random cells
+def benchGetNeighbors(size, seed, backend):
+    board = makeBoard(size, seed, backend)
+    board.setup()
+    cells = [(board.rng.randrange(size), board.rng.randrange(size)) for _ in range(10000)]
+
+    def run(board):
+        for x, y in cells:
+            board.getNeighbors(x, y)
+    return measure(lambda: board, run)
+
+# One flood clear from the first zero cell on a freshly set up board
+def benchClearSurroundingTiles(size, seed, backend):
+    # A sparse board gives the large openings that make flood clears expensive
+    board = makeBoard(size, seed, backend, density=0.05)
+    board.setup()
+    cell = findCell(board, lambda cell: not cell.is_mine and not cell.is_treasure and cell.adjacent_mines == 0)
+
+    def prepare():
+        reseed(board, seed).setup()
+        return board
+    return measure(prepare, lambda board: board.clearSurroundingTiles(*cell))
+
+# Controller over a NullView, set up and ready to play
+def makeController(size, seed, backend):
+    board = makeBoard(size, seed, backend)
+    return GameController(board, NullView())
+
+# Left clicks on a 32x32 lattice of safe cells, starting from a new game
+def benchOnClick(size, seed, backend):
+    controller = makeController(size, seed, backend)
+    cells = [(x, y) for x in range(0, size, max(1, size // 32)) for y in range(0, size, max(1, size // 32))]
+
+    def prepare():
+        reseed(controller.board, seed)
+        controller.restart()
+        return [cell for cell in cells if not controller.board.grid[cell[0]][cell[1]].is_mine]
+
+    def run(safeCells):
+        for x, y in safeCells:
+            controller.onClick(x, y)
+    return measure(prepare, run)
+
+# Right clicks on a 32x32 lattice, toggling flags on and off between repeats
+def benchOnRightClick(size, seed, backend):
+    controller = makeController(size, seed, backend)
+    cells = [(x, y) for x in range(0, size, max(1, size // 32)) for y in range(0, size, max(1, size // 32))]
+
+    def run(controller):
+        for x, y in cells:
+            controller.onRightClick(x, y)
+    return measure(lambda: controller, run)
+
+# End-of-game reveal on a fresh board
+def benchGameOver(size, seed, backend):
+    controller = makeController(size, seed, backend)
+
+    def prepare():
+        reseed(controller.board, seed)
+        controller.restart()
+        return controller
+    return measure(prepare, lambda controller: controller.gameOver(False))
+
+# One full text frame of the whole board written to an in-memory stream
+def benchDisplayBoard(size, seed, backend):
+    board = makeBoard(size, seed, backend)
+    board.setup()
+    # The viewport covers the board, so the frame grows with the size as it did before viewports
+    view = TextBoardView(board, stream=io.StringIO(), ansi=False, viewport=(size, size))
+
+    def prepare():
+        # Forgets the last frame so every repeat writes a full frame
+        view.stream = io.StringIO()
+        view.last_frame = None
+        return view
+    return measure(prepare, lambda view: view.displayBoard())
+
+# Benchmarks by name, with the largest board side each one is run at
+BENCHMARKS = {
+    "BoardModel.setup": (benchSetup, 2048),
+    "BoardModel.getNeighbors": (benchGetNeighbors, 2048),
+    "BoardModel.clearSurroundingTiles": (benchClearSurroundingTiles, 2048),
+    "GameController.onClick": (benchOnClick, 2048),
+    "GameController.onRightClick": (benchOnRightClick, 2048),
+    "GameController.gameOver": (benchGameOver, 2048),
+    "TextBoardView.displayBoard": (benchDisplayBoard, 512),
+}
+
+def runBenchmarks(names, sizes, seed, backend):
+    """
+    Runs the selected benchmarks at every size.
+
+    Postconditions:
+    - Returns a list of result dictionaries with the benchmark name, size, repeats and timing statistics.
+    """
+    results = []
+    for name in names:
+        function, largest = BENCHMARKS[name]
+        for size in sizes:
+            if size > largest:
+                continue
+            timings = function(size, seed, backend)
+            result = {
+                "name": name,
+                "size": size,
+                "backend": backend,
+                "repeats": len(timings),
+                "min": min(timings),
+                "median": statistics.median(timings),
+                "mean": statistics.fmean(timings),
+            }
+            results.append(result)
+            print(f"{name:36} {size:>5} {result['min'] * 1000:12.3f} ms (median {result['median'] * 1000:.3f} ms, {len(timings)} runs)",
+                  file=sys.stderr)
+    return results
+
+def compare(results, baseline, threshold):
+    """
+    Compares results with a saved baseline.
+
+    Preconditions:
+    - `baseline` is a report previously written by this script.
+
+    Postconditions:
+    - Returns a list of (name, size, baseline_min, current_min, ratio) for every result whose minimum
+      time grew by more than `threshold` (a fraction) over the baseline.
+    """
+    previous = {(result["name"], result["size"], result["backend"]): result for result in baseline["results"]}
+    regressions = []
+    for result in results:
+        old = previous.get((result["name"], result["size"], result["backend"]))
+        if old is None or old["min"] <= 0:
+            continue
+        ratio = result["min"] / old["min"]
+        if ratio > 1 + threshold:
+            regressions.append((result["name"], result["size"], old["min"], result["min"], ratio))
+    return regressions
+
+if __name__ == "__main__":
+    """
+    Preconditions:
+    - Run from any directory; the repository root is added to the import path.
+
+    Postconditions:
+    - Writes a JSON report of every measurement to `--output` (or stdout).
+    - With `--baseline`, prints regressions and exits with status 1 if any were found.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the Minesweeper hot paths.")
+    parser.add_argument("--sizes", default=",".join(str(size) for size in DEFAULT_SIZES),
+                        help="comma separated board sides")
+    parser.add_argument("--bench", action="append", choices=sorted(BENCHMARKS), help="benchmark to run; may be repeated")
+    parser.add_argument("--seed", type=int, default=671, help="seed for every board")
+    parser.add_argument("--backend", choices=["list", "array", "bit"], default="list", help="board storage backend")
+    parser.add_argument("--output", help="file to write the JSON report to")
+    parser.add_argument("--baseline", help="JSON report to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10, help="allowed slowdown before a result counts as a regression")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    results = runBenchmarks(args.bench or list(BENCHMARKS), sizes, args.seed, args.backend)
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": args.seed,
+        "results": results,
+    }
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(text + "\n")
+    else:
+        print(text)
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            regressions = compare(results, json.load(file), args.threshold)
+        for name, size, old, new, ratio in regressions:
+            print(f"REGRESSION {name} size {size}: {old * 1000:.3f} ms -> {new * 1000:.3f} ms ({ratio:.2f}x)", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
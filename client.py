@@ -0,0 +1,139 @@
+# Command line stand-in client for server.py: plays interactively, or runs many random players at once as a load test
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import time
+
+from Models.board_model import DIFFICULTY_PRESETS
+from Controllers.game_server import DEFAULT_HOST, DEFAULT_PORT, readReply
+
+# Text the server sends when a game has ended
+GAME_OVER_TEXT = "Send NEW to play again"
+
+# Opens a connection to the server
+async def connect(host, port, unix_path):
+    if unix_path is not None:
+        return await asyncio.open_unix_connection(unix_path)
+    return await asyncio.open_connection(host, port)
+
+# Sends one command and waits for its reply
+async def send(reader, writer, command):
+    """
+    Sends a command line to the server.
+
+    Postconditions:
+    - Returns the reply, or None if the server closed the connection.
+    """
+    writer.write((command + "\n").encode())
+    await writer.drain()
+    return await readReply(reader)
+
+async def playInteractive(host, port, unix_path):
+    """
+    Plays one session from the terminal.
+
+    Postconditions:
+    - Each line typed is sent to the server and its reply is printed, until QUIT or the server closes the connection.
+    """
+    reader, writer = await connect(host, port, unix_path)
+    reply = await readReply(reader)
+    loop = asyncio.get_running_loop()
+    command = ""
+    while reply is not None:
+        print(reply)
+        if command.strip().upper() in ("QUIT", "EXIT"):
+            break
+        try:
+            command = await loop.run_in_executor(None, input, "> ")
+        except EOFError:
+            command = "QUIT"
+        reply = await send(reader, writer, command)
+    writer.close()
+
+async def playBot(host, port, unix_path, level, games, rng, latencies):
+    """
+    Plays `games` games of random reveals in one session.
+
+    Postconditions:
+    - The time of every reply is appended to `latencies`.
+    - Returns the number of moves sent.
+    """
+    rows, cols, _, _ = DIFFICULTY_PRESETS[level]
+    reader, writer = await connect(host, port, unix_path)
+    await readReply(reader)
+    moves = 0
+    for _ in range(games):
+        command = f"NEW {level}"
+        while True:
+            start = time.perf_counter()
+            reply = await send(reader, writer, command)
+            latencies.append(time.perf_counter() - start)
+            if reply is None:
+                return moves
+            if command.startswith("R") and GAME_OVER_TEXT in reply:
+                break
+            command = f"R {rng.randrange(rows)} {rng.randrange(cols)}"
+            moves += 1
+    await send(reader, writer, "QUIT")
+    writer.close()
+    return moves
+
+async def runBots(host, port, unix_path, bots, level, games, seed):
+    """
+    Runs `bots` concurrent sessions of random play.
+
+    Postconditions:
+    - Returns a dictionary with the sessions, moves, wall time, moves per second and reply latency percentiles.
+    """
+    latencies = []
+    start = time.perf_counter()
+    moves = await asyncio.gather(*(playBot(host, port, unix_path, level, games, random.Random(seed + index), latencies)
+                                   for index in range(bots)))
+    seconds = time.perf_counter() - start
+    latencies.sort()
+    return {
+        "sessions": bots,
+        "games": bots * games,
+        "moves": sum(moves),
+        "seconds": seconds,
+        "moves_per_second": sum(moves) / seconds if seconds > 0 else 0.0,
+        "median_latency": statistics.median(latencies) if latencies else 0.0,
+        "p99_latency": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] if latencies else 0.0,
+    }
+
+def parseArguments(argv):
+    """
+    Parses the command line.
+
+    Postconditions:
+    - Returns the argparse namespace.
+    """
+    parser = argparse.ArgumentParser(description="Play on a Minesweeper game server.")
+    parser.add_argument("--host", default=DEFAULT_HOST, help="server address")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="server TCP port")
+    parser.add_argument("--unix", metavar="PATH", help="connect to this Unix socket instead of TCP")
+    parser.add_argument("--bots", type=int, help="run this many concurrent random players instead of playing")
+    parser.add_argument("--level", choices=sorted(DIFFICULTY_PRESETS), default="beginner", help="board the bots play on")
+    parser.add_argument("--games", type=int, default=10, help="games played by each bot")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first bot's moves")
+    return parser.parse_args(argv)
+
+if __name__ == "__main__":
+    """
+    Preconditions:
+    - The command line follows `parseArguments` and a server is listening at the given address.
+
+    Postconditions:
+    - Without `--bots`, one session is played from the terminal.
+    - With `--bots N`, N sessions play random games at once and the throughput and reply latencies are printed.
+    """
+    args = parseArguments(sys.argv[1:])
+    if args.bots:
+        report = asyncio.run(runBots(args.host, args.port, args.unix, args.bots, args.level, args.games, args.seed))
+        print(f"{report['sessions']} sessions, {report['games']} games, {report['moves']} moves in {report['seconds']:.2f} s, "
+              f"{report['moves_per_second']:.0f} moves/s, median reply {report['median_latency'] * 1000:.2f} ms, "
+              f"p99 {report['p99_latency'] * 1000:.2f} ms")
+    else:
+        asyncio.run(playInteractive(args.host, args.port, args.unix))
@@ -1,13 +1,28 @@
+import sys
+from Controllers.profiling import addProfilingArguments, startFromCommandLine
+
+# Started before the other imports, so they are profiled as the startup phase
+profiler = startFromCommandLine(sys.argv[1:]) if __name__ == "__main__" else None
+
 from Models.board_model import BoardModel
+from Models.endless_board_model import EndlessBoardModel
 from Controllers.game_controller import GameController
 from Views.board_view import BoardView
+from Views.canvas_board_view import CanvasBoardView, BUTTON_GRID_LIMIT
 from Views.difficulty_view import DifficultyView
 from Views.text_board_view import TextBoardView
 from Views.testing_view import TestingView
 from Views.mode_view import ModeView
 from Controllers.test_controller import TestController
+from Controllers.move_journal import JournalError, MoveJournal
+from Controllers.metrics import DEFAULT_EXPORT_INTERVAL, MetricsExporter, enableMetrics
+import argparse
+import os
 import tkinter as tk
 
+# Snapshot of the game in progress, resumed on the next start with the same difficulty
+AUTOSAVE_PATH = os.path.join(os.path.expanduser("~"), ".minesweeper_autosave")
+
 if __name__=="__main__":
     """
     Preconditions:
@@ -22,10 +37,27 @@ if __name__=="__main__":
         - The program exits if the test board is invalid.
     - If a difficulty level is selected:
         - A `BoardModel` is instantiated with the corresponding rows, columns, mines, and treasures.
+        - The "endless" level instantiates an `EndlessBoardModel` instead.
+    - Games on difficulty boards are autosaved to `AUTOSAVE_PATH` and resumed on the next start with the same difficulty.
+    - With `--journal FILE`, games on bounded boards are recorded to FILE for `replay.py`.
+    - With `--metrics FILE`, operation latencies are written to FILE in Prometheus text format every `--metrics-interval` seconds.
+    - With `--profile DIR` or `MINESWEEPER_PROFILE=DIR`, the session is profiled by phase and the results are written to DIR at exit.
     - Depending on the selected mode:
-        - In graphical mode, a `BoardView` and `GameController` are instantiated, and the game runs in a graphical window.
+        - In graphical mode, a `BoardView` (or a `CanvasBoardView` for large boards) and `GameController` are instantiated, and the game runs in a graphical window.
         - In text mode, a `TextBoardView` and `GameController` are instantiated, and the game runs in a console-based loop.
     """
+    parser = argparse.ArgumentParser(description="Play Minesweeper.")
+    parser.add_argument("--journal", help="append every game and move to this journal, for replay.py")
+    parser.add_argument("--metrics", help="write latency metrics in Prometheus text format to this file")
+    parser.add_argument("--metrics-interval", type=float, default=DEFAULT_EXPORT_INTERVAL, help="seconds between metrics exports")
+    addProfilingArguments(parser)
+    args = parser.parse_args()
+    if profiler is not None:
+        profiler.endStartup()
+
+    # Metrics are only wrapped around the game when asked for, so a normal game pays nothing for them
+    exporter = MetricsExporter(enableMetrics(), args.metrics, args.metrics_interval) if args.metrics else None
+
     # Creates the root window and hides it
     root = tk.Tk("root")
     root.withdraw()
@@ -48,6 +80,7 @@ if __name__=="__main__":
             print("Invalid test board. Exiting the game.")
             exit()
         board = test_controller.game_board
+        autosave_path = None
     else:
         # Creates a board according to the user's desired difficulty if they don't select testing mode
         difficulty_view = DifficultyView(root)
@@ -56,16 +89,34 @@ if __name__=="__main__":
         cols = difficulty_view.cols
         mines = difficulty_view.mines
         treasures = difficulty_view.treasures
-        board = BoardModel(rows, cols, mines, treasures)
+        if difficulty_view.level == "endless":
+            board = EndlessBoardModel()
+            autosave_path = None
+        else:
+            board = BoardModel(rows, cols, mines, treasures)
+            autosave_path = AUTOSAVE_PATH
+
+    # Endless boards have no finite layout to record
+    journal = None
+    if args.journal and not isinstance(board, EndlessBoardModel):
+        try:
+            journal = MoveJournal(args.journal)
+        except JournalError as error:
+            print(f"{error}. Exiting the game.")
+            exit()
 
     # Creates the game board and view based on the user's selected mode
     if mode_view.mode == "graphical":
-        view = BoardView(board, root)
-        controller = GameController(board, view)
+        # Large boards are drawn on a single scrollable canvas instead of one button per cell
+        if board.rows * board.cols > BUTTON_GRID_LIMIT:
+            view = CanvasBoardView(board, root)
+        else:
+            view = BoardView(board, root)
+        controller = GameController(board, view, autosave_path, journal)
         root.mainloop()
     elif mode_view.mode == "text":
         view = TextBoardView(board)
-        controller = GameController(board, view)
+        controller = GameController(board, view, autosave_path, journal)
         while not controller.game_over:
             view.promptMove()
     else:
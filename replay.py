@@ -0,0 +1,171 @@
+# Command line entry point for replaying move journals, headless at full speed or paced through the GUI
+import sys
+from Controllers.profiling import addProfilingArguments, startFromCommandLine
+
+# Started before the other imports, so they are profiled as the startup phase
+profiler = startFromCommandLine(sys.argv[1:]) if __name__ == "__main__" else None
+
+import argparse
+import json
+import time
+
+from Models.board_model import BoardModel
+from Controllers.move_journal import REVEAL, SnapshotEntry, journalGames, startReplay
+
+def modelFor(backend):
+    """
+    Gets the board class for a backend name.
+
+    Preconditions:
+    - `backend` is "list", "array" or "bit".
+
+    Postconditions:
+    - Returns BoardModel, ArrayBoardModel or BitBoardModel.
+    """
+    if backend == "array":
+        from Models.array_board_model import ArrayBoardModel
+        return ArrayBoardModel
+    if backend == "bit":
+        from Models.bit_board_model import BitBoardModel
+        return BitBoardModel
+    return BoardModel
+
+def replayHeadless(games, model, repeat):
+    """
+    Replays every game without rendering, `repeat` times.
+
+    Preconditions:
+    - `games` is a list of (start, moves) pairs from `journalGames`.
+
+    Postconditions:
+    - Returns a dictionary with the final status of each game from the first pass, the number of moves applied,
+      and the wall time of the fastest pass, which excludes decoding the journal.
+    """
+    best = None
+    statuses = []
+    for attempt in range(repeat):
+        began = time.perf_counter()
+        passStatuses = []
+        for start, moves in games:
+            engine = startReplay(start, model)
+            reveal, flag = engine.reveal, engine.flag
+            for move in moves:
+                if move.kind == REVEAL:
+                    reveal(move.x, move.y)
+                else:
+                    flag(move.x, move.y)
+            passStatuses.append(engine.getStatus())
+        seconds = time.perf_counter() - began
+        best = seconds if best is None else min(best, seconds)
+        if attempt == 0:
+            statuses = passStatuses
+    moves = sum(len(moves) for _, moves in games)
+    return {
+        "games": len(games),
+        "moves": moves,
+        "seconds": best,
+        "moves_per_second": moves / best if best else 0.0,
+        "results": statuses,
+    }
+
+def replayGui(start, moves, model, speed):
+    """
+    Replays one game through the graphical view with the recorded timing.
+
+    Preconditions:
+    - A display is available.
+    - `speed` is a positive factor; 2 plays twice as fast as recorded.
+
+    Postconditions:
+    - Each move is applied through `GameController.onClick` or `onRightClick` after its recorded delay divided by `speed`.
+    - Returns when the window is closed.
+    """
+    import tkinter as tk
+    from Controllers.game_controller import GameController
+    from Controllers.game_snapshot import restoreSnapshot
+    from Views.board_view import BoardView
+    from Views.canvas_board_view import CanvasBoardView, BUTTON_GRID_LIMIT
+
+    root = tk.Tk()
+    root.withdraw()
+    engine = startReplay(start, model)
+    board = engine.board
+    view = CanvasBoardView(board, root) if board.rows * board.cols > BUTTON_GRID_LIMIT else BoardView(board, root)
+    controller = GameController(board, view)
+    if isinstance(start, SnapshotEntry):
+        # The controller set up a new game; the snapshot replaces it
+        changed = restoreSnapshot(controller.engine, start.data)
+        view.resetUI()
+        view.updateCells(changed)
+
+    pending = iter(moves)
+
+    def step(move):
+        if move is not None:
+            if move.kind == REVEAL:
+                controller.onClick(move.x, move.y)
+            else:
+                controller.onRightClick(move.x, move.y)
+        upcoming = next(pending, None)
+        if upcoming is not None and not controller.game_over:
+            root.after(max(1, int(upcoming.delay / 1000 / speed)), step, upcoming)
+    step(None)
+    root.mainloop()
+
+def parseArguments(argv):
+    """
+    Parses the command line.
+
+    Postconditions:
+    - Returns the argparse namespace.
+    """
+    parser = argparse.ArgumentParser(description="Replay a Minesweeper move journal.")
+    parser.add_argument("journal", help="journal written with main.py --journal")
+    parser.add_argument("--backend", choices=["list", "array", "bit"], default="list", help="board storage backend")
+    parser.add_argument("--repeat", type=int, default=1, help="headless passes; the fastest is reported")
+    parser.add_argument("--gui", action="store_true", help="replay one game in the graphical view with its recorded timing")
+    parser.add_argument("--game", type=int, default=0, help="index of the game to replay with --gui")
+    parser.add_argument("--speed", type=float, default=1.0, help="speed factor for --gui")
+    parser.add_argument("--json", action="store_true", help="print the headless report as JSON")
+    parser.add_argument("--metrics", help="instrument the replay and write its metrics in Prometheus text format to this file")
+    addProfilingArguments(parser)
+    return parser.parse_args(argv)
+
+if __name__ == "__main__":
+    """
+    Preconditions:
+    - The command line follows `parseArguments`.
+
+    Postconditions:
+    - Without `--gui`, every game is replayed headless and a summary, with the final status of each game, is printed.
+    - With `--gui`, the selected game is replayed in a window.
+    - With `--metrics FILE`, the replay is instrumented and its metrics are written to FILE when it ends.
+    - With `--profile DIR` or `MINESWEEPER_PROFILE=DIR`, the replay is profiled by phase and the results are written to DIR at exit.
+    """
+    args = parseArguments(sys.argv[1:])
+    if profiler is not None:
+        profiler.endStartup()
+    model = modelFor(args.backend)
+    games = list(journalGames(args.journal))
+    if not games:
+        raise SystemExit("The journal holds no games.")
+
+    if args.metrics:
+        from Controllers.metrics import enableMetrics
+        registry = enableMetrics()
+
+    if args.gui:
+        if not 0 <= args.game < len(games):
+            raise SystemExit(f"The journal holds {len(games)} games.")
+        replayGui(*games[args.game], model, args.speed)
+    else:
+        report = replayHeadless(games, model, max(1, args.repeat))
+        if args.json:
+            print(json.dumps(report))
+        else:
+            for index, status in enumerate(report["results"]):
+                print(f"game {index}: {status['rows']}x{status['cols']} {status['status']} after {status['moves']} moves")
+            print(f"{report['games']} games, {report['moves']} moves in {report['seconds'] * 1000:.2f} ms, "
+                  f"{report['moves_per_second']:.0f} moves/s")
+    if args.metrics:
+        registry.writeText(args.metrics)
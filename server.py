@@ -0,0 +1,39 @@
+# Command line entry point for hosting many text-mode games from one process
+import argparse
+import asyncio
+import sys
+
+from Models.board_model import DIFFICULTY_PRESETS
+from Controllers.game_server import DEFAULT_HOST, DEFAULT_PORT, IDLE_TIMEOUT, MAX_SESSIONS, GameServer
+
+def parseArguments(argv):
+    """
+    Parses the command line.
+
+    Postconditions:
+    - Returns the argparse namespace.
+    """
+    parser = argparse.ArgumentParser(description="Serve Minesweeper games over a line-based text protocol.")
+    parser.add_argument("--host", default=DEFAULT_HOST, help="address to listen on")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="TCP port to listen on")
+    parser.add_argument("--unix", metavar="PATH", help="listen on this Unix socket instead of TCP")
+    parser.add_argument("--level", choices=sorted(DIFFICULTY_PRESETS), default="beginner", help="board of every session's first game")
+    parser.add_argument("--idle-timeout", type=float, default=IDLE_TIMEOUT, help="seconds before a silent session is closed")
+    parser.add_argument("--max-sessions", type=int, default=MAX_SESSIONS, help="sessions served at once")
+    return parser.parse_args(argv)
+
+if __name__ == "__main__":
+    """
+    Preconditions:
+    - The command line follows `parseArguments`.
+
+    Postconditions:
+    - Every connection plays its own game with the `R x y` / `F x y` commands of text mode, until the server is interrupted.
+    """
+    args = parseArguments(sys.argv[1:])
+    server = GameServer(args.level, args.idle_timeout, args.max_sessions)
+    print(f"Serving on {args.unix or f'{args.host}:{args.port}'}")
+    try:
+        asyncio.run(server.serve(args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        print(f"Stopped after {server.games_played} games.")
@@ -0,0 +1,195 @@
+# Command line entry point for Monte Carlo simulation of solver-played games
+import sys
+from Controllers.profiling import addProfilingArguments, startFromCommandLine
+
+# Started before the other imports, so they are profiled as the startup phase. Pool workers import this module without starting one.
+profiler = startFromCommandLine(sys.argv[1:]) if __name__ == "__main__" else None
+
+import argparse
+import json
+import os
+import statistics
+import time
+from multiprocessing import Pool
+
+from Models.board_model import BoardModel, DIFFICULTY_PRESETS
+from Controllers.game_engine import GameEngine
+from Controllers.solver import Solver
+
+# Games handed to a worker at a time
+CHUNK_SIZE = 500
+
+def makeBoard(config, seed):
+    """
+    Creates the board for a configuration.
+
+    Preconditions:
+    - `config` is a dictionary with "rows", "cols", "mines", "treasures" and "backend".
+
+    Postconditions:
+    - Returns a BoardModel, or an ArrayBoardModel or BitBoardModel if the backend is "array" or "bit", seeded with `seed`.
+    """
+    if config["backend"] == "array":
+        from Models.array_board_model import ArrayBoardModel
+        model = ArrayBoardModel
+    elif config["backend"] == "bit":
+        from Models.bit_board_model import BitBoardModel
+        model = BitBoardModel
+    else:
+        model = BoardModel
+    return model(config["rows"], config["cols"], config["mines"], config["treasures"], seed=seed)
+
+def playGames(job):
+    """
+    Plays a chunk of seeded games in a worker process.
+
+    Preconditions:
+    - `job` is a (config, first_seed, count) tuple.
+
+    Postconditions:
+    - Game i is played on a board seeded with `first_seed + i`, so results do not depend on the worker.
+    - Returns a list of (won, found_treasure, finished, moves, guesses, seconds) tuples, one per game.
+    """
+    config, firstSeed, count = job
+    results = []
+    for seed in range(firstSeed, firstSeed + count):
+        board = makeBoard(config, seed)
+        engine = GameEngine(board)
+        start = time.perf_counter()
+        engine.newGame()
+        solver = Solver(board, flag_mines=False, rng=board.rng)
+        moves = solver.play(engine)
+        seconds = time.perf_counter() - start
+        results.append((engine.won, engine.found_treasure, engine.game_over, moves, solver.guess_count, seconds))
+    return results
+
+def summarize(config, results, wallSeconds):
+    """
+    Merges per-game results into statistics.
+
+    Preconditions:
+    - `results` is a non-empty list of tuples returned by `playGames`.
+
+    Postconditions:
+    - Returns a dictionary with the configuration, win and treasure rates, and move, guess and duration statistics.
+    """
+    games = len(results)
+    durations = sorted(result[5] for result in results)
+    return {
+        "config": config,
+        "games": games,
+        "wins": sum(1 for result in results if result[0]),
+        "win_rate": sum(1 for result in results if result[0]) / games,
+        "treasure_rate": sum(1 for result in results if result[1]) / games,
+        "unfinished": sum(1 for result in results if not result[2]),
+        "mean_moves": statistics.fmean(result[3] for result in results),
+        "mean_guesses": statistics.fmean(result[4] for result in results),
+        "mean_seconds": statistics.fmean(durations),
+        "median_seconds": durations[games // 2],
+        "p99_seconds": durations[min(games - 1, int(games * 0.99))],
+        "wall_seconds": wallSeconds,
+        "games_per_second": games / wallSeconds if wallSeconds > 0 else 0.0,
+    }
+
+def simulate(config, games, seed, processes, in_process=False):
+    """
+    Plays `games` seeded games of one configuration across a process pool.
+
+    Preconditions:
+    - `games` is a positive integer and `processes` is None or a positive integer.
+
+    Postconditions:
+    - Returns the statistics from `summarize`.
+    - With `in_process`, the games are played in this process instead, so a profiler running here sees them.
+    """
+    jobs = [(config, seed + start, min(CHUNK_SIZE, games - start)) for start in range(0, games, CHUNK_SIZE)]
+    start = time.perf_counter()
+    results = []
+    if in_process:
+        for job in jobs:
+            results.extend(playGames(job))
+    else:
+        with Pool(processes) as pool:
+            for chunk in pool.imap_unordered(playGames, jobs):
+                results.extend(chunk)
+    return summarize(config, results, time.perf_counter() - start)
+
+def parseArguments(argv):
+    """
+    Parses the command line.
+
+    Postconditions:
+    - Returns the argparse namespace.
+    - Exits with a usage error if `--games` or `--processes` is below 1, or the custom board is not a valid board.
+    """
+    parser = argparse.ArgumentParser(description="Play seeded Minesweeper games with the solver and report statistics.")
+    parser.add_argument("--difficulty", action="append", choices=sorted(DIFFICULTY_PRESETS),
+                        help="difficulty preset to simulate; may be repeated")
+    parser.add_argument("--rows", type=int, help="rows of a custom board")
+    parser.add_argument("--cols", type=int, help="columns of a custom board")
+    parser.add_argument("--mines", type=int, help="mines on a custom board")
+    parser.add_argument("--treasures", type=int, default=0, help="treasures on a custom board")
+    parser.add_argument("--games", type=int, default=10000, help="games per configuration")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first game")
+    parser.add_argument("--processes", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--backend", choices=["list", "array", "bit"], default="list", help="board storage backend")
+    parser.add_argument("--json", action="store_true", help="print one JSON object per configuration")
+    addProfilingArguments(parser)
+    args = parser.parse_args(argv)
+    if args.games < 1:
+        parser.error("--games must be at least 1")
+    if args.processes is not None and args.processes < 1:
+        parser.error("--processes must be at least 1")
+    if args.rows is not None and args.rows < 1 or args.cols is not None and args.cols < 1:
+        parser.error("--rows and --cols must be at least 1")
+    if args.mines is not None and args.mines < 0 or args.treasures < 0:
+        parser.error("--mines and --treasures must be at least 0")
+    if args.rows is not None and args.cols is not None and args.mines is not None \
+            and args.mines + args.treasures >= args.rows * args.cols:
+        parser.error("--mines and --treasures must leave at least one safe cell")
+    return args
+
+def configurations(args):
+    """
+    Builds the configurations requested on the command line.
+
+    Postconditions:
+    - Returns a list of configuration dictionaries; beginner is used if nothing was requested.
+    """
+    configs = []
+    for level in args.difficulty or []:
+        rows, cols, mines, treasures = DIFFICULTY_PRESETS[level]
+        configs.append({"name": level, "rows": rows, "cols": cols, "mines": mines, "treasures": treasures, "backend": args.backend})
+    if args.rows is not None or args.cols is not None or args.mines is not None:
+        if args.rows is None or args.cols is None or args.mines is None:
+            raise SystemExit("A custom board needs --rows, --cols and --mines.")
+        configs.append({"name": "custom", "rows": args.rows, "cols": args.cols, "mines": args.mines,
+                        "treasures": args.treasures, "backend": args.backend})
+    if not configs:
+        rows, cols, mines, treasures = DIFFICULTY_PRESETS["beginner"]
+        configs.append({"name": "beginner", "rows": rows, "cols": cols, "mines": mines, "treasures": treasures, "backend": args.backend})
+    return configs
+
+if __name__ == "__main__":
+    """
+    Preconditions:
+    - The command line follows `parseArguments`.
+
+    Postconditions:
+    - Each configuration is simulated and its statistics are printed, as text or JSON lines.
+    - With `--profile DIR` or `MINESWEEPER_PROFILE=DIR`, the games are played in this process and profiled by phase,
+      and the results are written to DIR at exit.
+    """
+    args = parseArguments(sys.argv[1:])
+    if profiler is not None:
+        profiler.endStartup()
+    processes = args.processes or os.cpu_count()
+    for config in configurations(args):
+        stats = simulate(config, args.games, args.seed, processes, in_process=profiler is not None)
+        if args.json:
+            print(json.dumps(stats))
+        else:
+            print(f"{config['name']} {config['rows']}x{config['cols']} mines={config['mines']} treasures={config['treasures']}: "
+                  f"{stats['games']} games, win rate {stats['win_rate']:.3f}, treasure rate {stats['treasure_rate']:.3f}, "
+                  f"unfinished {stats['unfinished']}, mean moves {stats['mean_moves']:.1f}, "
+                  f"mean {stats['mean_seconds'] * 1000:.2f} ms/game, {stats['games_per_second']:.0f} games/s")
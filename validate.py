@@ -0,0 +1,160 @@
+# Command line entry point for validating directory trees of test boards across a process pool
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from itertools import islice
+from multiprocessing import Pool
+
+from Models.board_loader import ANY_SIZE_RULES, CLASSIC_RULES, BoardLoadError, readBoard
+from Models.board_file import BOARD_FILE_EXTENSION, readBoardFile
+
+# Extensions of the board files that are validated
+BOARD_EXTENSIONS = (".csv", BOARD_FILE_EXTENSION)
+
+# Rule sets selectable on the command line
+RULE_SETS = {"classic": CLASSIC_RULES, "any": ANY_SIZE_RULES}
+
+# Files handed to a worker at a time
+CHUNK_SIZE = 64
+
+# Files submitted to the pool at a time, so a tree of millions of files is never held in memory
+BATCH_SIZE = 16384
+
+# Rules used by the current process, set once per worker by `initWorker`
+_rules = CLASSIC_RULES
+
+def boardFiles(root):
+    """
+    Walks a directory tree for board files.
+
+    Preconditions:
+    - `root` is a directory or a single file.
+
+    Postconditions:
+    - Yields the path of every file under `root` whose extension is in `BOARD_EXTENSIONS`, ignoring case,
+      sorted by name within each directory, as the walk reaches it.
+    - A single file is yielded as it is, whatever its extension.
+    """
+    if not os.path.isdir(root):
+        yield root
+        return
+    pending = [root]
+    while pending:
+        directory = pending.pop()
+        try:
+            entries = sorted(os.scandir(directory), key=lambda entry: entry.name)
+        except OSError:
+            continue
+        subdirectories = []
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirectories.append(entry.path)
+            elif entry.name.lower().endswith(BOARD_EXTENSIONS):
+                yield entry.path
+        pending.extend(reversed(subdirectories))
+
+def initWorker(rules):
+    """
+    Sets the rules of a worker process.
+
+    Postconditions:
+    - `checkBoard` validates against `rules` in this process.
+    """
+    global _rules
+    _rules = rules
+
+def checkBoard(file_path):
+    """
+    Validates one board file against the worker's rules.
+
+    Postconditions:
+    - Packed board files are read with `readBoardFile` and any other file with `readBoard`, as `TestController` does.
+    - Returns (file_path, error, rule): error and rule are None for a valid board; otherwise error is the broken rule's
+      message and rule names it, as in `BoardLoadError.rule`. Files that cannot be read have the rule "unreadable".
+    """
+    try:
+        if file_path.lower().endswith(BOARD_FILE_EXTENSION):
+            readBoardFile(file_path, _rules)
+        else:
+            readBoard(file_path, _rules)
+    except BoardLoadError as error:
+        return file_path, str(error), error.rule
+    except (OSError, UnicodeDecodeError, csv.Error) as error:
+        return file_path, f"Unreadable file: {error}", "unreadable"
+    return file_path, None, None
+
+def validateTree(roots, rules, processes):
+    """
+    Validates every board file under `roots`.
+
+    Preconditions:
+    - `processes` is None for all cores, or a positive integer.
+
+    Postconditions:
+    - Yields `checkBoard` results in the order the files are found, as soon as they are ready.
+    - Files are submitted in batches of `BATCH_SIZE`, so memory does not grow with the size of the tree.
+    - With one process, the files are validated in this process without a pool.
+    """
+    files = (path for root in roots for path in boardFiles(root))
+    if processes == 1:
+        initWorker(rules)
+        yield from map(checkBoard, files)
+        return
+    with Pool(processes, initializer=initWorker, initargs=(rules,)) as pool:
+        while True:
+            batch = list(islice(files, BATCH_SIZE))
+            if not batch:
+                break
+            yield from pool.imap(checkBoard, batch, chunksize=CHUNK_SIZE)
+
+def parseArguments(argv):
+    """
+    Parses the command line.
+
+    Postconditions:
+    - Returns the argparse namespace.
+    - Exits with a usage error if `--processes` is below 1.
+    """
+    parser = argparse.ArgumentParser(description="Validate every test board under one or more directories.")
+    parser.add_argument("paths", nargs="+", help="directories to walk, or single board files")
+    parser.add_argument("--rules", choices=sorted(RULE_SETS), default="classic",
+                        help="rule set: classic 8x8 test boards, or any size with only the file format checked")
+    parser.add_argument("--processes", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--failures-only", action="store_true", help="report only the files that fail")
+    parser.add_argument("--json", action="store_true", help="print one JSON object per file")
+    args = parser.parse_args(argv)
+    if args.processes is not None and args.processes < 1:
+        parser.error("--processes must be at least 1")
+    return args
+
+if __name__ == "__main__":
+    """
+    Preconditions:
+    - The command line follows `parseArguments`.
+
+    Postconditions:
+    - One line per file is printed as soon as it is validated: "PASS path", or "FAIL path: message" with the failed rule.
+    - A summary is printed to standard error, and the exit status is 1 if any file failed.
+    """
+    args = parseArguments(sys.argv[1:])
+    start = time.perf_counter()
+    passed = failed = 0
+    for path, error, rule in validateTree(args.paths, RULE_SETS[args.rules], args.processes):
+        if error is None:
+            passed += 1
+            if args.failures_only:
+                continue
+        else:
+            failed += 1
+        if args.json:
+            print(json.dumps({"path": path, "valid": error is None, "error": error, "rule": rule}))
+        elif error is None:
+            print(f"PASS {path}")
+        else:
+            print(f"FAIL {path}: {error} ({rule})")
+    seconds = time.perf_counter() - start
+    print(f"{passed + failed} files, {passed} passed, {failed} failed in {seconds:.2f} s", file=sys.stderr)
+    sys.exit(1 if failed else 0)